@@ -0,0 +1,1104 @@
+"""해커톤 봇 오프라인 성능 측정 스크립트.
+
+네트워크 없이 봇의 각 단계를 합성 데이터로 측정합니다.
+
+    python benchmark.py neardup --history 100000 --queries 3000
+    python benchmark.py parse [--repeat 5]
+    python benchmark.py rsc [--camps 3000] [--filler-mb 4]
+    python benchmark.py dates [--items 200000]
+    python benchmark.py classify [--entries 3000]
+    python benchmark.py route [--subscriptions 500] [--items 5000]
+    python benchmark.py history [--history 100000] [--queries 3000]
+    python benchmark.py record                     # 실제 사이트 응답을 fixtures/replay/에 저장 (네트워크 필요)
+    python benchmark.py load [--sources 1000] [--items 10000] [--history 1000000] [--scales 0.1,0.5,1] [--json out.json]
+    python benchmark.py replay [--latency 0.05] [--error-rate 0.1] [--slow mlh.io=3] [--block aivle.kt.co.kr=403] [--page-workers 1]
+
+fixtures/ 아래에 실제로 저장한 페이지(mlh.html 등)가 있으면 그것을 쓰고,
+없으면 각 사이트 구조를 흉내 낸 합성 페이지로 측정합니다.
+"""
+import argparse
+import base64
+import contextlib
+import hashlib
+import json
+import os
+import random
+import re
+import resource
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import requests
+from bs4 import BeautifulSoup
+
+import bot
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+REPLAY_DIR = os.path.join(FIXTURE_DIR, "replay")
+DISCORD_REPLAY_URL = "https://discord.com/api/webhooks/replay/token"
+
+WORDS = [
+    "AI", "해커톤", "Hackathon", "부트캠프", "Bootcamp", "공모전", "챌린지", "Challenge", "데이터",
+    "Data", "클라우드", "Cloud", "보안", "Security", "블록체인", "Web3", "게임", "Game", "모빌리티",
+    "헬스케어", "핀테크", "Fintech", "스타트업", "Startup", "서울", "Seoul", "부산", "글로벌", "Global",
+    "청년", "대학생", "개발자", "Developer", "오픈소스", "Open Source", "LLM", "Agent", "Vision", "로봇",
+    "메타버스", "ESG", "기후", "Climate", "교육", "K-디지털", "트레이닝", "아카데미", "Academy", "Summit",
+]
+PREFIXES = ["🇰🇷 [캠퍼스픽] ", "🎓 [데브이벤트] ", "[부트텐트] ", "[SSAFY] ", "🎓 [부트캠프/교육] ", ""]
+
+
+def synthetic_titles(n, seed=0):
+    """WORDS 조합 + 연도/회차로 서로 다른 제목 n개를 만듭니다."""
+    rng = random.Random(seed)
+    titles, seen = [], set()
+    while len(titles) < n:
+        words = rng.sample(WORDS, rng.randint(3, 6))
+        title = f"{' '.join(words)} {rng.choice(['2024', '2025', '2026'])} 제{rng.randint(1, 30)}회"
+        if title not in seen:
+            seen.add(title)
+            titles.append(title)
+    return titles
+
+
+def perturb(title, rng):
+    """같은 공고로 봐야 하는 작은 변형(접두어, 문장부호, 대소문자, 단어 추가)을 만듭니다."""
+    choice = rng.randrange(4)
+    if choice == 0:
+        return rng.choice(PREFIXES) + title
+    if choice == 1:
+        return title.replace(" ", " - ", 1) + "!"
+    if choice == 2:
+        return rng.choice(PREFIXES) + title.upper()
+    return title + " 모집"
+
+
+def peak_rss():
+    """프로세스 최대 RSS(바이트). tracemalloc은 대량 삽입을 몇 배 느리게 만들어 구축 측정에 쓰지 않습니다."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def fmt_mb(n):
+    return f"{n / 1024 / 1024:.1f}MB"
+
+
+def bench_neardup(args):
+    rng = random.Random(1)
+    history = synthetic_titles(args.history)
+    keys = [bot.normalize_key(t) for t in history]
+    novel = synthetic_titles(args.history + args.queries, seed=99)
+    known = set(keys)
+    novel = [t for t in novel if bot.normalize_key(t) not in known][:args.queries // 2]
+    dups = [perturb(rng.choice(history), rng) for _ in range(args.queries - len(novel))]
+    print(f"기록 {len(history)}개, 질의 {len(dups)}개(변형 중복) + {len(novel)}개(신규)")
+
+    rss = peak_rss()
+    t = time.perf_counter()
+    index = bot.NearDuplicateIndex()
+    for k in keys:
+        index.add(k)
+    build = time.perf_counter() - t
+    print(f"[메모리 LSH] 구축 {build:.2f}s ({len(keys) / build:,.0f}건/s), 최대 RSS 증가 {fmt_mb(peak_rss() - rss)}")
+
+    def run_queries(query):
+        t = time.perf_counter()
+        hits = sum(query(bot.normalize_key(q)) is not None for q in dups)
+        false_pos = sum(query(bot.normalize_key(q)) is not None for q in novel)
+        elapsed = time.perf_counter() - t
+        return hits, false_pos, elapsed
+
+    hits, fp, elapsed = run_queries(index.query)
+    n = len(dups) + len(novel)
+    print(f"[메모리 LSH] 질의 {elapsed * 1e6 / n:.0f}µs/건, 재현율 {hits / len(dups):.1%}, 오탐 {fp}건")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        t = time.perf_counter()
+        store = bot.SqliteDedupStore(os.path.join(tmp, "bench.db"), legacy_path=os.path.join(tmp, "none"))
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+        store._insert_rows([(title, "bench", None, None, now) for title in history])
+        store.conn.commit()
+        build = time.perf_counter() - t
+        size = os.path.getsize(os.path.join(tmp, "bench.db"))
+        print(f"[SQLite LSH] 구축 {build:.2f}s, 파일 {fmt_mb(size)}")
+        t = time.perf_counter()
+        store.close()
+        store = bot.SqliteDedupStore(os.path.join(tmp, "bench.db"))
+        print(f"[SQLite LSH] 다시 열기 {(time.perf_counter() - t) * 1000:.1f}ms")
+        hits, fp, elapsed = run_queries(store.find_similar)
+        print(f"[SQLite LSH] 질의 {elapsed * 1e6 / n:.0f}µs/건, 재현율 {hits / len(dups):.1%}, 오탐 {fp}건")
+        store.close()
+
+    # 비교 기준: 기록 전체와 쌍별 비교 (일부 질의만 측정해 외삽)
+    sample = dups[:20]
+    history_shingles = [bot.shingles(k) for k in keys]
+    t = time.perf_counter()
+    for q in sample:
+        qs = bot.shingles(bot.normalize_key(q))
+        max(bot.jaccard(qs, hs) for hs in history_shingles)
+    per_query = (time.perf_counter() - t) / len(sample)
+    print(f"[쌍별 비교] 질의 {per_query * 1e6:,.0f}µs/건 (LSH 대비 {per_query * n / elapsed:,.0f}배)")
+
+
+class FakeResponse:
+    """파싱 함수에 넘길 최소한의 requests.Response 대용품입니다."""
+
+    def __init__(self, text, status_code=200, headers=None):
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+
+    @property
+    def content(self):
+        return self.text.encode("utf-8")
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def _filler(n):
+    """실제 페이지처럼 파싱 대상과 무관한 마크업/스크립트를 채웁니다."""
+    nav = "".join(f'<li class="menu"><a href="/m/{i}">메뉴 {i}</a><span>설명 {i}</span></li>' for i in range(n))
+    return (f'<head><title>page</title><script>var cfg = {json.dumps({"k": list(range(n * 20))})};</script>'
+            f'<style>.a{{color:red}}</style></head><nav><ul>{nav}</ul></nav>')
+
+
+def synth_mlh(n=120):
+    # 만료 필터에 걸리지 않도록 다음 달 일정으로 생성
+    month = time.strftime("%b", time.localtime(time.time() + 35 * 86400)).upper()
+    cards = "".join(
+        f'<div class="event"><a href="/events/{i}?utm=x"><div class="img"><img src="/i/{i}.png"></div>'
+        f'<h3>{" ".join(random.Random(i).sample(WORDS, 3))} Hack {i}</h3><p>{month} {i % 28 + 1} - {month} {i % 28 + 1}</p>'
+        f'<p>Online</p></a></div>' for i in range(n))
+    return f"<html>{_filler(300)}<body><main>{cards}</main></body></html>"
+
+
+def synth_ssafy(n=60):
+    rows = "".join(
+        f'<li class="_top"><span class="td td1"><a href="javascript:goViewPage({1000 + i})">'
+        f'<i class="ico_noti">[공지]</i>SSAFY {i}기 교육생 모집 공고</a></span><span class="td td2">2026.0{i % 9 + 1}.01</span></li>'
+        f'<li class="row"><span class="td td1"><a href="#">일반 공지 {i}</a></span></li>' for i in range(n))
+    return f"<html>{_filler(200)}<body><ul class=\"list\">{rows}</ul></body></html>"
+
+
+def synth_woowacourse(n=80):
+    blocks = {f"block{i}": {"value": {"type": "page", "properties": {
+        "title": [[f"우아한테크코스 {i}기 모집"]], "date": [["2026-03-01"]]}}} for i in range(n)}
+    data = {"props": {"pageProps": {"recordMap": {"block": blocks}}}}
+    return (f"<html>{_filler(300)}<body><div id=\"__next\">{'<div><p>본문</p></div>' * 500}</div>"
+            f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(data, ensure_ascii=False)}</script></body></html>')
+
+
+def synth_boostcamp():
+    sections = "".join(f"<section><h2>과정 소개 {i}</h2><p>{'설명 문장 ' * 40}</p></section>" for i in range(150))
+    return (f"<html>{_filler(300)}<body>{sections}<div class=\"apply\">부스트캠프 AI Tech 8기 모집 중 "
+            f"지원 기간 2026.06.01 ~ 2026.06.30</div></body></html>")
+
+
+def synth_kt_techup():
+    faq = {"@context": "https://schema.org", "@type": "FAQPage", "mainEntity": [
+        {"@type": "Question", "name": f"질문 {i}", "acceptedAnswer": {"@type": "Answer", "text": (
+            "교육은 2026년 7월 1일부터 2026년 12월 31일까지 진행됩니다." if i == 5 else f"답변 {i}")}}
+        for i in range(30)]}
+    body = "".join(f"<div class=\"track\"><h3>트랙 {i}</h3><p>{'소개 ' * 60}</p></div>" for i in range(120))
+    return (f'<html>{_filler(300)}<script type="application/ld+json">{{"@type": "Organization"}}</script>'
+            f'<script type="application/ld+json">{json.dumps(faq, ensure_ascii=False)}</script><body>{body}</body></html>')
+
+
+def synth_kt_aivle(n=40):
+    rows = "".join(
+        f'<div class="tr"><div class="td num">{i}</div><div class="td subject">'
+        f"<a href=\"javascript:readPtlBbsAtcl('{500 + i}')\">KT 에이블스쿨 {i}기 교육생 모집</a></div>"
+        f'<div class="td date">2026.05.{i % 28 + 1:02d}</div></div>' for i in range(n))
+    return f"<html>{_filler(300)}<body><div class=\"board\">{rows}</div></body></html>"
+
+
+def synth_detail(deadline):
+    """상세 페이지: 접수 기간/장소 표와 긴 본문."""
+    return (f"<html>{_filler(100)}<body><table><tr><th>접수 기간</th><td>2026.01.01 ~ {deadline}</td></tr>"
+            f"<tr><th>장소</th><td>서울 강남구</td></tr></table><p>오프라인 진행</p>{'<p>안내 문장</p>' * 300}</body></html>")
+
+
+PARSE_CASES = [
+    # (이름, 픽스처 파일, 파싱 호출, 합성 페이지)
+    ("MLH", "mlh.html", lambda b, r: b._parse_mlh(r, b.sources["MLH"]), synth_mlh),
+    ("SSAFY", "ssafy.html", lambda b, r: b._parse_ssafy(r, b.sources["SSAFY"]), synth_ssafy),
+    ("우아한테크코스", "woowacourse.html", lambda b, r: b._parse_woowacourse(r, b.sources["우아한테크코스"]), synth_woowacourse),
+    ("부스트캠프", "boostcamp.html", lambda b, r: b._parse_boostcamp(r, b.sources["부스트캠프"], "https://boostcamp.connect.or.kr/", "AI Tech"), synth_boostcamp),
+    ("KT Cloud TechUp", "kt_techup.html", lambda b, r: b._parse_kt_techup(r, b.sources["KT Cloud TechUp"]), synth_kt_techup),
+    ("KT 에이블스쿨", "kt_aivle.html", lambda b, r: b._parse_kt_aivle(r, b.sources["KT 에이블스쿨"]), synth_kt_aivle),
+]
+
+
+def load_fixture(filename, synth):
+    path = os.path.join(FIXTURE_DIR, filename)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read(), "저장본"
+    return synth(), "합성"
+
+
+def measure(fn, repeat):
+    """fn을 repeat번 실행한 최소 시간(초)과 한 번 실행의 최대 할당 메모리(바이트)를 돌려줍니다."""
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def bench_parse(args):
+    b = bot.HackathonBot.__new__(bot.HackathonBot)
+    b.sources = bot.registered_sources()
+    b.classifier = bot.TitleClassifier(b.sources)
+    print(f"파서: {bot.html_parser()} (기준: 전체 트리 html.parser)")
+    print(f"{'소스':<16}{'입력':>8}{'크기':>9}{'기준 시간':>11}{'기준 메모리':>11}{'새 시간':>10}{'새 메모리':>10}{'항목':>5}")
+    for name, filename, parse, synth in PARSE_CASES:
+        text, origin = load_fixture(filename, synth)
+        base_t, base_mem, _ = measure(lambda: BeautifulSoup(text, "html.parser"), args.repeat)
+        new_t, new_mem, items = measure(lambda: parse(b, FakeResponse(text)), args.repeat)
+        print(f"{name:<16}{origin:>8}{len(text.encode()) / 1024:>7.0f}KB"
+              f"{base_t * 1000:>9.1f}ms{fmt_mb(base_mem):>11}{new_t * 1000:>8.1f}ms{fmt_mb(new_mem):>10}{len(items):>5}")
+
+
+def synth_boottent(camps=3000, filler_mb=4):
+    """부트텐트 /camps 응답처럼 여러 RSC push 청크 사이에 campList 청크가 낀 페이지를 만듭니다."""
+    rng = random.Random(3)
+    camp_list = [{
+        "campId": f"c{i}", "batchId": f"b{i}", "title": f"{' '.join(rng.sample(WORDS, 3))} 부트캠프 {i}기",
+        "categories": rng.sample(["data", "ai", "web", "mobile", "design"], 2),
+        "startDate": "2026-01-01", "endDate": "2099-12-31", "desc": "소개 \"따옴표\" [괄호] " * 5,
+    } for i in range(camps)]
+
+    def push(payload):
+        return f"<script>self.__next_f.push({json.dumps([1, payload], ensure_ascii=False)})</script>"
+
+    filler = push("1:" + json.dumps({"tree": ["$", "div", None, {"children": "x" * 2000}]}))
+    n_filler = int(filler_mb * 1024 * 1024 / len(filler.encode()))
+    camp_chunk = push("5:" + json.dumps(["$", "CampPage", None, {"campList": camp_list, "total": camps}], ensure_ascii=False))
+    half = n_filler // 2
+    return "<html><body>" + filler * half + camp_chunk + filler * (n_filler - half) + "</body></html>"
+
+
+def legacy_boottent_extract(text):
+    """변경 전 방식: 정규식으로 모든 push를 모으고 문자 단위 괄호 매칭 후 다시 json.loads."""
+    def extract_json_array(s, key):
+        idx = s.find(f'"{key}":')
+        if idx == -1:
+            return None
+        start = s.index('[', idx + len(key) + 3)
+        depth, in_string, escape = 1, False, False
+        for i in range(start + 1, len(s)):
+            c = s[i]
+            if escape:
+                escape = False
+                continue
+            if c == '\\' and in_string:
+                escape = True
+                continue
+            if c == '"':
+                in_string = not in_string
+                continue
+            if in_string:
+                continue
+            if c == '[':
+                depth += 1
+            elif c == ']':
+                depth -= 1
+                if depth == 0:
+                    return s[start:i + 1]
+        return None
+
+    for p in re.findall(r'self\.__next_f\.push\((\[.*?\])\)', text, re.DOTALL):
+        if '\\"campList\\"' not in p:
+            continue
+        arr_str = extract_json_array(json.loads(p)[1], 'campList')
+        return json.loads(arr_str) if arr_str else []
+    return []
+
+
+def bench_rsc(args):
+    path = os.path.join(FIXTURE_DIR, "boottent.html")
+    text, origin = load_fixture("boottent.html", lambda: synth_boottent(args.camps, args.filler_mb))
+    size = len(text.encode())
+    print(f"입력: {origin} {size / 1024 / 1024:.1f}MB" + ("" if os.path.exists(path) else f" (캠프 {args.camps}개)"))
+
+    def pieces():
+        for i in range(0, len(text), bot.RSC_READ_SIZE):
+            yield text[i:i + bot.RSC_READ_SIZE]
+
+    old_t, old_mem, old = measure(lambda: legacy_boottent_extract(text), args.repeat)
+    new_t, new_mem, new = measure(lambda: bot.extract_rsc_array(pieces(), "campList"), args.repeat)
+    assert old == new, "두 방식의 결과가 다릅니다"
+    for label, t, mem in (("기존(정규식+문자 루프)", old_t, old_mem), ("스트리밍+raw_decode", new_t, new_mem)):
+        print(f"{label:<22}{t * 1000:>9.1f}ms {size / t / 1024 / 1024:>7.1f}MB/s  최대 메모리 {fmt_mb(mem)}")
+    print(f"캠프 {len(new)}개 추출, {old_t / new_t:.1f}배 빠름")
+
+
+def synthetic_dates(n, seed=0):
+    """소스별 날짜 표기를 섞은 문자열 n개 (Devpost, MLH, 캠퍼스픽, 부트텐트, 링커리어, 게시일)."""
+    rng = random.Random(seed)
+    months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+    out = []
+    for _ in range(n):
+        y, m, d = rng.choice([2025, 2026, 2027]), rng.randint(1, 12), rng.randint(1, 28)
+        m2, d2 = min(m + rng.randint(0, 2), 12), rng.randint(1, 28)
+        out.append(rng.choice([
+            f"{months[m - 1]} {d:02d} - {months[m2 - 1]} {d2:02d}, {y}",
+            f"{months[m - 1].upper()} {d} - {months[m2 - 1].upper()} {d2}",
+            f"{y}-{m:02d}-{d:02d}",
+            f"마감: {y}-{m:02d}-{d:02d} ~ {y}-{m2:02d}-{d2:02d}",
+            f"{y}.{m:02d}.{d:02d}",
+            f"{y}년 {m}월 {d}일",
+            "상세 확인",
+        ]))
+    return out
+
+
+def bench_dates(args):
+    today = time.strftime("%Y-%m-%d")
+    unique = synthetic_dates(args.items, seed=1)
+    pool = synthetic_dates(2000, seed=2)
+    rng = random.Random(3)
+    items = [{"date": rng.choice(pool)} for _ in range(args.items)]
+
+    bot.parse_date_range.cache_clear()
+    t = time.perf_counter()
+    parsed = [bot.parse_date_range.__wrapped__(text, today) for text in unique]
+    cold = time.perf_counter() - t
+    t = time.perf_counter()
+    bot.normalize_dates(items, today)
+    batch = time.perf_counter() - t
+    expired = sum(1 for i in items if i["end"] and i["end"] < today)
+    print(f"날짜 문자열 {args.items:,}개 (전부 다름): {cold * 1000:8.1f}ms  {args.items / cold:>12,.0f}건/s, "
+          f"해석 실패 {sum(e is None for _, e in parsed):,}개")
+    print(f"항목 {args.items:,}개 일괄 정규화 (서로 다른 표기 {len(set(pool)):,}개): {batch * 1000:8.1f}ms  "
+          f"{args.items / batch:>12,.0f}건/s, 마감 지남 {expired:,}개")
+
+
+def synth_devevent_readme(n, seed=5):
+    """Dev-Event README.md 형식의 합성 문서 (행사 n개)."""
+    rng = random.Random(seed)
+    kinds = ["해커톤", "컨퍼런스", "밋업", "공모전", "부트캠프", "스터디", "웨비나", "교육", "경진대회", "세미나"]
+    lines = ["# Dev-Event", "", "## 26년 10월", ""]
+    titles = synthetic_titles(n, seed=seed)
+    for i, title in enumerate(titles):
+        kind = rng.choice(kinds)
+        lines += [f"- __[{title} {kind}](https://event.example.com/{i})__",
+                  f"  - 분류: `{rng.choice(['온라인', '오프라인'])}`, `{kind}`",
+                  f"  - 주최: {rng.choice(PREFIXES)}",
+                  f"  - 접수: `10. {rng.randint(1, 28):02d}(월) ~ 11. {rng.randint(1, 28):02d}(금)`", ""]
+    return "\n".join(lines)
+
+
+def legacy_classify(title, lists):
+    """분류기 이전 방식: 소스별 키워드 목록과 범주 목록을 차례로 any(k in title) 검사."""
+    low = title.lower()
+    accepted = {name: any(k in low for k in kws) for name, kws in lists.items()}
+    category = next((c for c in bot.CATEGORY_ORDER if any(k in low for k in bot.CATEGORY_KEYWORDS[c])), "")
+    return accepted, category
+
+
+def bench_classify(args):
+    readme, origin = load_fixture("devevent.md", lambda: synth_devevent_readme(args.entries))
+    readme_titles = re.findall(r'__\[([^\]]+)\]\(', readme)
+    history_path = os.path.join(os.path.dirname(FIXTURE_DIR), bot.DB_FILE)
+    with open(history_path, "r", encoding="utf-8") as f:
+        history = [line.strip() for line in f if line.strip()]
+    sources = bot.registered_sources()
+    lists = {name: [k.lower() for k in spec["keywords"]] for name, spec in sources.items() if spec["keywords"]}
+    print(f"입력: Dev-Event README {origin} (제목 {len(readme_titles):,}개), {bot.DB_FILE} (제목 {len(history):,}개), "
+          f"키워드 집합 {len(lists) + len(bot.CATEGORY_KEYWORDS)}개")
+
+    def new_classify(matcher, title):
+        tags = matcher.scan(title)
+        accepted = {name: f"in:{name}" in tags for name in lists}
+        category = next((c for c in bot.CATEGORY_ORDER if f"cat:{c}" in tags), "")
+        return accepted, category
+
+    groups = {**{f"cat:{c}": kws for c, kws in bot.CATEGORY_KEYWORDS.items()},
+              **{f"in:{n}": spec["keywords"] for n, spec in sources.items()}}
+    backends = [("정규식 결합", bot.KeywordMatcher(groups, automaton=False))]
+    aho = bot.KeywordMatcher(groups)
+    if aho.automaton is not None:
+        backends.append(("Aho-Corasick", aho))
+    else:
+        print("(pyahocorasick 미설치: 정규식 경로만 측정)")
+
+    for label, titles in (("README", readme_titles), ("기록 파일", history)):
+        old_t, _, old = measure(lambda: [legacy_classify(t, lists) for t in titles], args.repeat)
+        print(f"\n[{label}] 제목 {len(titles):,}개")
+        print(f"   {'기존 any() 루프':<18}{old_t * 1000:>9.2f}ms {len(titles) / old_t:>12,.0f}건/s")
+        for name, matcher in backends:
+            new_t, _, new = measure(lambda: [new_classify(matcher, t) for t in titles], args.repeat)
+            diff = sum(a != b for a, b in zip(old, new))
+            print(f"   {name:<18}{new_t * 1000:>9.2f}ms {len(titles) / new_t:>12,.0f}건/s  "
+                  f"{old_t / new_t:.1f}배, 결과 차이 {diff}건")
+        counts = {}
+        for _, cat in old:
+            counts[cat or "미분류"] = counts.get(cat or "미분류", 0) + 1
+        print(f"   범주: {', '.join(f'{k} {v:,}' for k, v in sorted(counts.items(), key=lambda kv: -kv[1]))}")
+
+
+def synthetic_subscriptions(n, seed=7):
+    """범주/소스/키워드/제외 조건을 섞은 구독 n개. 웹훅 주소는 채널 n/4개에 나눠 둡니다."""
+    rng = random.Random(seed)
+    sources = list(bot.registered_sources())
+    subs = {}
+    for i in range(n):
+        spec = {"webhook": f"https://discord.com/api/webhooks/{i % max(1, n // 4)}/token"}
+        if rng.random() < 0.5:
+            spec["categories"] = rng.sample(list(bot.CATEGORY_STYLE), rng.randint(1, 2))
+        if rng.random() < 0.3:
+            spec["sources"] = rng.sample(sources, rng.randint(1, 3))
+        if rng.random() < 0.6:
+            spec["keywords"] = rng.sample(WORDS, rng.randint(1, 3))
+        if rng.random() < 0.2:
+            spec["exclude"] = rng.sample(WORDS, 1)
+        subs[f"구독{i}"] = spec
+    return subs
+
+
+def naive_route(items, subscriptions):
+    """색인 없이 항목 × 구독 규칙을 하나씩 검사하는 방식."""
+    routes = {}
+    for i, item in enumerate(items):
+        text = f"{item['title']} {item['host']}".lower()
+        urls = []
+        for spec in subscriptions.values():
+            if spec["categories"] and (item.get("category") or "") not in spec["categories"]:
+                continue
+            if spec["sources"] and item.get("source") not in spec["sources"]:
+                continue
+            if spec["keywords"] and not any(k.lower() in text for k in spec["keywords"]):
+                continue
+            if any(k.lower() in text for k in spec["exclude"]):
+                continue
+            urls += [u for u in spec["webhook"] if u not in urls]
+        for url in urls:
+            routes.setdefault(url, []).append(i)
+    return routes
+
+
+def bench_route(args):
+    rng = random.Random(3)
+    sources = list(bot.registered_sources())
+    items = [{"title": t, "host": rng.choice(["Devpost", "MLH", "캠퍼스픽", "부트텐트", "SSAFY"]),
+              "category": rng.choice(list(bot.CATEGORY_STYLE) + [""]), "source": rng.choice(sources)}
+             for t in synthetic_titles(args.items, seed=11)]
+    subscriptions = bot.load_subscriptions(path=os.devnull, raw=json.dumps(synthetic_subscriptions(args.subscriptions)))
+    build_t, _, router = measure(lambda: bot.SubscriptionRouter(subscriptions), 1)
+    print(f"구독 {len(router):,}개 (웹훅 {len({u for s in subscriptions.values() for u in s['webhook']}):,}개), "
+          f"항목 {len(items):,}개, 색인 구축 {build_t * 1000:.1f}ms")
+    old_t, _, old = measure(lambda: naive_route(items, subscriptions), args.repeat)
+    new_t, _, new = measure(lambda: bot.SubscriptionRouter(subscriptions).route(items), args.repeat)
+    print(f"   {'규칙 × 항목 루프':<18}{old_t * 1000:>9.1f}ms {len(items) / old_t:>12,.0f}건/s")
+    print(f"   {'색인 라우터':<18}{new_t * 1000:>9.1f}ms {len(items) / new_t:>12,.0f}건/s  {old_t / new_t:.1f}배, "
+          f"결과 {'일치' if old == new else '불일치'}")
+    deliveries = sum(len(v) for v in new.values())
+    print(f"   전달 {deliveries:,}건 (항목당 평균 웹훅 {deliveries / len(items):.1f}개), "
+          f"웹훅당 메시지 최소 {sum(-(-len(v) // bot.DISCORD_MAX_EMBEDS) for v in new.values()):,}개")
+
+
+def bench_history(args):
+    history = synthetic_titles(args.history)
+    known = set(map(bot.normalize_key, history))
+    novel = [t for t in synthetic_titles(args.history + args.queries, seed=99) if bot.normalize_key(t) not in known]
+    novel = novel[:args.queries]
+    sample = random.Random(2).sample(history, min(args.queries, len(history)))
+    print(f"기록 {len(history):,}개, 질의 {len(sample):,}개(있는 제목) + {len(novel):,}개(새 제목)")
+    with tempfile.TemporaryDirectory() as tmp:
+        text = os.path.join(tmp, "sent.txt")
+        with open(text, "w", encoding="utf-8") as f:
+            f.writelines(f"{t}\n" for t in history)
+        missing = os.path.join(tmp, "none")
+        backends = [
+            ("text", text, lambda: bot.TextDedupStore(text)),
+            ("sqlite", os.path.join(tmp, "sent.db"), lambda: bot.SqliteDedupStore(os.path.join(tmp, "sent.db"), legacy_path=text)),
+            ("compact", os.path.join(tmp, "sent.bin"),
+             lambda: bot.CompactDedupStore(os.path.join(tmp, "sent.bin"), legacy_db=missing, legacy_path=text)),
+        ]
+        # 첫 질의: 유사 제목 인덱스를 처음 만드는 비용. 캐시 후: 닫을 때 저장한 캐시(compact의 .lsh)로 다시 열었을 때
+        print(f"   {'저장소':<9}{'파일':>10}{'옮기기':>10}{'다시 열기':>11}{'있는 제목':>12}{'새 제목 첫 질의':>16}{'캐시 후':>9}{'새 제목':>10}")
+        def timed(fn):
+            t = time.perf_counter()
+            result = fn()
+            return time.perf_counter() - t, result
+
+        for name, path, open_store in backends:
+            migrate, store = timed(open_store)
+            store.close()
+            reopen, store = timed(open_store)
+            hit_t, _ = timed(lambda: sum(t in store for t in sample))
+            first_t, _ = timed(lambda: store.seen({"title": novel[0]}))
+            novel_t, _ = timed(lambda: sum(store.seen({"title": t}) for t in novel))
+            store.close()
+            store = open_store()
+            warm_t, _ = timed(lambda: store.seen({"title": novel[0]}))
+            store.close()
+            print(f"   {name:<9}{fmt_mb(os.path.getsize(path)):>10}{migrate * 1000:>8.0f}ms{reopen * 1000:>9.1f}ms"
+                  f"{hit_t * 1e6 / len(sample):>9.1f}µs/건{first_t * 1000:>13.0f}ms{warm_t * 1000:>7.0f}ms"
+                  f"{novel_t * 1e6 / len(novel):>7.0f}µs/건")
+
+
+# ─────────────────────────────────────────────────────
+# 녹화/재생 하네스
+# ─────────────────────────────────────────────────────
+
+def request_key(method, url, body=b""):
+    """같은 요청을 찾기 위한 키. 쿼리/본문까지 일치해야 하는 정확한 키입니다."""
+    return hashlib.sha1(f"{method} {url}\n".encode() + (body or b"")).hexdigest()[:20]
+
+
+def route_key(method, url):
+    """쿼리/본문을 무시한 느슨한 키 (합성 픽스처나 페이지 번호만 다른 요청에 사용)."""
+    parts = urlsplit(url)
+    return f"{method} {parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def fixture_entry(method, url, body, status, headers, content):
+    kept = {k: v for k, v in headers.items() if k.lower() in ("content-type", "etag", "last-modified")}
+    try:
+        payload, encoding = content.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        payload, encoding = base64.b64encode(content).decode(), "base64"
+    return {"method": method, "url": url, "key": request_key(method, url, body), "route": route_key(method, url),
+            "status": status, "headers": kept, "encoding": encoding, "body": payload}
+
+
+class RecordingAdapter(bot.TimedAdapter):
+    """실제 응답을 그대로 돌려주면서 fixtures/replay/에 한 요청당 파일 하나로 저장합니다."""
+
+    def __init__(self, directory, **kwargs):
+        super().__init__(**kwargs)
+        self.directory = directory
+
+    def send(self, request, stream=False, **kwargs):
+        res = super().send(request, stream=stream, **kwargs)
+        content = res.content  # stream=True여도 전부 읽어 두면 iter_content가 저장된 본문을 돌려줌
+        body = request.body.encode() if isinstance(request.body, str) else (request.body or b"")
+        entry = fixture_entry(request.method, request.url, body, res.status_code, res.headers, content)
+        with open(os.path.join(self.directory, f"{entry['key']}.json"), "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        return res
+
+
+class ReplayAdapter(bot.TimedAdapter):
+    """https://host/path 요청을 로컬 재생 서버의 /https/host/path로 돌립니다."""
+
+    def __init__(self, base, **kwargs):
+        super().__init__(**kwargs)
+        self.base = base
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.headers["X-Replay-Key"] = request_key(
+            request.method, request.url,
+            request.body.encode() if isinstance(request.body, str) else (request.body or b""))
+        request.url = f"{self.base}/{parts.scheme}/{parts.netloc}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+        return super().send(request, **kwargs)
+
+
+def synthetic_fixtures():
+    """네트워크 없이 재생할 수 있도록 모든 소스의 합성 응답을 만듭니다."""
+    rng = random.Random(7)
+    future = time.strftime("%Y-%m-%d", time.localtime(time.time() + 40 * 86400))
+    titles = synthetic_titles(400, seed=11)
+
+    def item_titles(n):
+        return [titles.pop() for _ in range(n)]
+
+    devpost = {"hackathons": [{"title": t, "url": f"https://devpost-{i}.devpost.com/", "submission_period_dates": "Jan 01 - Dec 31, 2099"}
+                              for i, t in enumerate(item_titles(60))]}
+    devevent = "\n".join(f"- __[{t} 해커톤](https://event.example.com/e?id={i})__\n  - 분류: `오프라인`"
+                         for i, t in enumerate(item_titles(80)))
+    campuspick = {"result": {"activities": [{"id": 9000 - i, "title": t, "endDate": future}
+                                            for i, t in enumerate(item_titles(15))]}}
+    linkareer = {"data": {"activities": {"totalCount": 20, "nodes": [
+        {"id": str(5000 - i), "title": t, "organizationName": "기관", "recruitCloseAt": int(time.time() * 1000) + 86400000}
+        for i, t in enumerate(item_titles(20))]}}}
+    html = {"Content-Type": "text/html; charset=utf-8"}
+    js = {"Content-Type": "application/json; charset=utf-8"}
+    return {
+        "GET https://devpost.com/api/hackathons": (js, json.dumps(devpost)),
+        "GET https://mlh.io/seasons/2026/events": (html, synth_mlh()),
+        "GET https://raw.githubusercontent.com/brave-people/Dev-Event/master/README.md": ({"Content-Type": "text/plain; charset=utf-8"}, devevent),
+        "POST https://api2.campuspick.com/find/activity/list": (js, json.dumps(campuspick)),
+        "POST https://api.linkareer.com/graphql": (js, json.dumps(linkareer)),
+        "GET https://www.ssafy.com/ksp/servlet/swp.board.controller.SwpBoardServlet": (html, synth_ssafy()),
+        "GET https://woowacourse.io/notice": (html, synth_woowacourse()),
+        "GET https://boostcamp.connect.or.kr/guide_ai.html": (html, synth_boostcamp()),
+        "GET https://boostcamp.connect.or.kr/main_wm.html": (html, synth_boostcamp().replace("AI Tech", "Web·Mobile")),
+        "GET https://ktcloud-techup.com/": (html, synth_kt_techup()),
+        "GET https://aivle.kt.co.kr/home/main/goMenuPage": (html, synth_kt_aivle()),
+        "GET https://boottent.com/camps": (html, synth_boottent(camps=rng.randint(250, 300), filler_mb=1)),
+        # 상세 페이지 (SSAFY 상세는 목록과 경로가 같아 목록 응답을 받음)
+        "GET https://event.example.com/e": (html, synth_detail(future.replace("-", "."))),
+        "GET https://aivle.kt.co.kr/home/brd/bbs/view": (html, synth_detail(future.replace("-", "."))),
+    }
+
+
+def load_replay_fixtures(directory):
+    """저장된 녹화본을 {정확한 키: 항목}, {느슨한 키: 항목}으로 읽습니다."""
+    exact, routes = {}, {}
+    for name in sorted(os.listdir(directory)) if os.path.isdir(directory) else []:
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            exact[entry["key"]] = entry
+            routes.setdefault(entry["route"], entry)
+    return exact, routes
+
+
+class ReplayServer:
+    """녹화본(또는 합성 응답)을 돌려주는 로컬 HTTP 서버입니다.
+    호스트별 지연, 무작위 5xx, 고정 차단 응답을 주입할 수 있고, 디스코드 웹훅 요청은 세기만 합니다.
+    """
+
+    def __init__(self, exact, routes, latency=0.0, jitter=0.0, error_rate=0.0, slow=None, block=None, seed=0):
+        self.exact, self.routes = exact, routes
+        self.latency, self.jitter, self.error_rate = latency, jitter, error_rate
+        self.slow, self.block = slow or {}, block or {}
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.discord_messages, self.discord_embeds, self.served, self.not_modified, self.missing = 0, 0, 0, 0, []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.handle(self)
+
+            def do_POST(self):
+                server.handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+
+            def handle_error(self, request, client_address):
+                pass  # 커넥션 풀이 keep-alive 소켓을 닫을 때 나는 리셋은 무시
+
+        self.httpd = Server(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self.httpd.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def reply(self, h, status, headers=None, body=b""):
+        h.send_response(status)
+        for k, v in (headers or {}).items():
+            h.send_header(k, v)
+        h.send_header("Content-Length", str(len(body)))
+        h.end_headers()
+        h.wfile.write(body)
+
+    def handle(self, h):
+        length = int(h.headers.get("Content-Length") or 0)
+        body = h.rfile.read(length) if length else b""
+        _, scheme, host, path = (h.path.split("/", 3) + [""])[:4]
+        url = f"{scheme}://{host}/{path}"
+        with self.lock:
+            delay = self.latency + self.slow.get(host, 0.0) + self.rng.uniform(0, self.jitter)
+            fail = self.rng.random() < self.error_rate
+        time.sleep(delay)
+        if host == urlsplit(DISCORD_REPLAY_URL).netloc:
+            with self.lock:
+                self.discord_messages += 1
+                self.discord_embeds += len(json.loads(body or b"{}").get("embeds", []))
+            return self.reply(h, 200, {"Content-Type": "application/json", "X-RateLimit-Remaining": "5"}, b"{}")
+        if host in self.block:
+            return self.reply(h, self.block[host])
+        if fail:
+            return self.reply(h, 503)
+        entry = self.exact.get(h.headers.get("X-Replay-Key")) or self.routes.get(route_key(h.command, url.split("?")[0]))
+        if entry is None:
+            with self.lock:
+                self.missing.append(f"{h.command} {url}")
+            return self.reply(h, 404)
+        etag = entry["headers"].get("ETag") or entry["headers"].get("etag")
+        if etag and h.headers.get("If-None-Match") == etag:
+            with self.lock:
+                self.not_modified += 1
+            return self.reply(h, 304, {"ETag": etag})
+        content = entry["body"].encode() if entry["encoding"] == "utf-8" else base64.b64decode(entry["body"])
+        with self.lock:
+            self.served += 1
+        self.reply(h, entry["status"], entry["headers"], content)
+
+
+def parse_host_values(pairs, cast):
+    return {host: cast(value) for host, value in (p.split("=", 1) for p in pairs or [])}
+
+
+def bench_record(args):
+    os.makedirs(REPLAY_DIR, exist_ok=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        # 봇은 만들 때 중복 방지 기록과 캐시/커서 파일을 열므로, 저장소의 파일을 건드리지 않게 옮긴 뒤에 만듦
+        os.chdir(tmp)
+        try:
+            b = bot.HackathonBot(full_resync=True)
+            adapter = RecordingAdapter(REPLAY_DIR, max_retries=b.session.get_adapter("https://").max_retries)
+            b.session.mount("https://", adapter)
+            b.session.mount("http://", adapter)
+            for _ in b.iter_fetchers(b.tasks()):
+                pass
+            b.sent_list.close()
+        finally:
+            os.chdir(cwd)
+    print(f"녹화 완료: {len(os.listdir(REPLAY_DIR))}개 응답 → {REPLAY_DIR}")
+
+
+def bench_replay(args):
+    exact, routes = load_replay_fixtures(REPLAY_DIR)
+    origin = "녹화본"
+    if args.synthetic or not exact:
+        origin = "합성"
+        for route, (headers, body) in synthetic_fixtures().items():
+            method, url = route.split(" ", 1)
+            entry = fixture_entry(method, url, b"", 200, dict(headers, ETag=f'"{hashlib.sha1(body.encode()).hexdigest()[:12]}"'), body.encode())
+            routes[entry["route"]] = entry
+    server = ReplayServer(exact, routes, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                          slow=parse_host_values(args.slow, float), block=parse_host_values(args.block, int))
+    bot.WEBHOOK_URL, bot.WEBHOOK_URLS = DISCORD_REPLAY_URL, [DISCORD_REPLAY_URL]
+    bot.PAGE_WORKERS = args.page_workers
+    print(f"재생 입력: {origin} ({len(exact) or len(routes)}개 응답), 지연 {args.latency * 1000:.0f}ms, 오류율 {args.error_rate:.0%}")
+    cwd = os.getcwd()
+    with server, tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            for run in range(1, args.runs + 1):
+                b = bot.HackathonBot(full_resync=run == 1)
+                for session in (b.session, b.discord_session):
+                    adapter = ReplayAdapter(server.base, pool_maxsize=bot.MAX_WORKERS,
+                                            max_retries=session.get_adapter("https://").max_retries)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                before = (server.discord_messages, server.discord_embeds, server.served, server.not_modified)
+                t = time.perf_counter()
+                b.run()
+                total = time.perf_counter() - t
+                print(f"\n[{run}회차] 전체 {total:.2f}s (수집 {b.fetch_wall:.2f}s), "
+                      f"응답 {server.served - before[2]}개 / 304 {server.not_modified - before[3]}개, "
+                      f"디스코드 메시지 {server.discord_messages - before[0]}개 / 임베드 {server.discord_embeds - before[1]}개")
+                print(f"   {'소스':<16}{'항목':>5}{'파싱':>9}{'전송량':>9}{'처리량':>12}")
+                for m in b.metrics.values():
+                    rate = f"{m['items'] / m['parse_s']:,.0f}건/s" if m['parse_s'] > 0 and m['items'] else "-"
+                    print(f"   {m['source']:<16}{m['items']:>5}{m['parse_s'] * 1000:>7.1f}ms{m['bytes'] / 1024:>7.0f}KB{rate:>12}")
+        finally:
+            os.chdir(cwd)
+    if server.missing:
+        print(f"\n⚠️ 녹화본이 없는 요청 {len(server.missing)}개: {server.missing[:5]}")
+
+
+# ─────────────────────────────────────────────────────
+# 부하 측정
+# ─────────────────────────────────────────────────────
+
+def current_rss():
+    """현재 RSS(바이트). /proc이 없으면 최대 RSS로 대신합니다."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return peak_rss()
+
+
+def fmt_rss(mb):
+    return "-" if mb is None else f"{mb:.0f}MB"
+
+
+def percentile(values, p):
+    """가장 가까운 순위 방식의 백분위수."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, -(-len(ordered) * p // 100) - 1))] if ordered else 0.0
+
+
+class DiscordSink(bot.TimedAdapter):
+    """디스코드 웹훅 요청에 바로(또는 latency초 뒤) 200을 돌려주고 메시지/임베드 수만 셉니다."""
+
+    def __init__(self, latency=0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.latency, self.messages, self.embeds = latency, 0, 0
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        time.sleep(self.latency)
+        with self.lock:
+            self.messages += 1
+            self.embeds += len(json.loads(request.body or b"{}").get("embeds", []))
+        res = requests.Response()
+        res.status_code, res._content, res.url, res.request = 200, b"{}", request.url, request
+        res.headers["X-RateLimit-Remaining"] = "5"
+        return res
+
+
+class LoadBot(bot.HackathonBot):
+    """합성 소스(fetch_synthetic)를 수집하면서 단계별 호출 시간과 호출 직후 RSS를 기록하는 HackathonBot입니다."""
+
+    def __init__(self, feeds, latency=0.0, jitter=0.0, failure_rate=0.0, seed=0, **kwargs):
+        self.feeds, self.latency, self.jitter, self.failure_rate = feeds, latency, jitter, failure_rate
+        self.rng, self.rng_lock = random.Random(seed), threading.Lock()
+        self.samples = {stage: [] for stage in LOAD_STAGES}
+        super().__init__(**kwargs)
+
+    def fetch_synthetic(self, name, spec):
+        with self.rng_lock:
+            delay, fail = self.latency + self.rng.uniform(0, self.jitter), self.rng.random() < self.failure_rate
+        time.sleep(delay)
+        if fail:
+            raise requests.ConnectionError("합성 소스 실패")
+        return [dict(i) for i in self.feeds[name]]
+
+    def timed_stage(self, stage, count, fn, *args):
+        t = time.perf_counter()
+        result = fn(*args)
+        self.samples[stage].append((time.perf_counter() - t, count, current_rss()))
+        return result
+
+    def triage(self, name, found, deduper):
+        return self.timed_stage("triage", len(found), super().triage, name, found, deduper)
+
+    def send_to_discord(self, items, announced=None):
+        return self.timed_stage("send", len(items), super().send_to_discord, items, announced)
+
+    def save_sent_list(self, new_items):
+        return self.timed_stage("store", len(new_items), super().save_sent_list, new_items)
+
+
+# fetch: 소스별 수집, triage: 스냅샷 비교/분류/마감/중복 제거, send: 디스코드 묶음 전송, store: 중복 방지 기록 저장
+LOAD_STAGES = ("fetch", "triage", "send", "store")
+
+
+def synthetic_feeds(args, total, history, rng):
+    """소스별 합성 항목. 기록에 있는 제목(dup-rate), 그 변형(near-rate), 다른 소스와 겹치는 새 제목(cross-rate),
+    나머지는 새 제목으로 채우고, 소스 크기는 지프 분포(--skew)로 나눕니다.
+    """
+    names = [f"합성{i:05d}" for i in range(args.sources)]
+    weights = [1 / (i + 1) ** args.skew for i in range(args.sources)]
+    sizes = [int(total * w / sum(weights)) for w in weights]
+    sizes[0] += total - sum(sizes)
+    known = set(history)
+    novel = [t for t in synthetic_titles(total + len(history) // 50 + 1000, seed=99) if t not in known][:total]
+    future = time.strftime("%Y-%m-%d", time.localtime(time.time() + 40 * 86400))
+    feeds, n = {}, 0
+    for name, size in zip(names, sizes):
+        items = []
+        for _ in range(size):
+            roll = rng.random()
+            if history and roll < args.dup_rate:
+                title = rng.choice(history)
+            elif history and roll < args.dup_rate + args.near_rate:
+                title = perturb(rng.choice(history), rng)
+            elif n and roll < args.dup_rate + args.near_rate + args.cross_rate:
+                title = novel[rng.randrange(n)]
+            else:
+                title, n = novel[n % len(novel)], n + 1
+            items.append({"title": title, "url": f"https://load.example.com/{name}/{len(items)}",
+                          "host": name, "date": future, "category": "hackathon"})
+        feeds[name] = items
+    return feeds
+
+
+def stage_report(b, wall):
+    """단계별 호출 수, 항목 수, 처리량, 호출당 p50/p99, 단계 호출 직후 최대 RSS."""
+    samples = dict(b.samples)
+    samples["fetch"] = [(m["elapsed_s"], m["items"], None) for m in b.metrics.values() if m["status"] is not None]
+    report = {}
+    for stage in LOAD_STAGES:
+        rows = samples[stage]
+        durations = [d for d, _, _ in rows]
+        items, total = sum(c for _, c, _ in rows), sum(durations)
+        report[stage] = {
+            "calls": len(rows), "items": items, "total_s": round(total, 4),
+            "throughput": round(items / total, 1) if total > 0 else 0.0,
+            "p50_ms": round(percentile(durations, 50) * 1000, 3), "p99_ms": round(percentile(durations, 99) * 1000, 3),
+            "rss_mb": round(max(r for _, _, r in rows) / 1024 / 1024, 1) if rows and rows[0][2] is not None else None,
+        }
+    return report
+
+
+def compare_baseline(results, baseline, tolerance):
+    """같은 항목 수의 기준 결과보다 p99가 tolerance배 넘게 늘거나 처리량이 1/tolerance 밑으로 떨어진 단계를 돌려줍니다."""
+    base = {r["items"]: r for r in baseline.get("scales", [])}
+    regressions = []
+    for result in results:
+        old = base.get(result["items"])
+        for stage, new in result["stages"].items() if old else ():
+            prev = old["stages"].get(stage)
+            if not prev or not new["calls"]:
+                continue
+            if prev["p99_ms"] > 0 and new["p99_ms"] > prev["p99_ms"] * tolerance:
+                regressions.append(f"{result['items']:,}개 {stage} p99 {prev['p99_ms']:.1f}→{new['p99_ms']:.1f}ms")
+            if prev["throughput"] > 0 and new["throughput"] < prev["throughput"] / tolerance:
+                regressions.append(f"{result['items']:,}개 {stage} 처리량 {prev['throughput']:,.0f}→{new['throughput']:,.0f}건/s")
+    return regressions
+
+
+def bench_load(args):
+    rng = random.Random(args.seed)
+    history = synthetic_titles(args.history, seed=0) if args.history else []
+    scales = [float(x) for x in args.scales.split(",")]
+    bot.WEBHOOK_URL, bot.WEBHOOK_URLS = DISCORD_REPLAY_URL, [DISCORD_REPLAY_URL]
+    raw = json.dumps(synthetic_subscriptions(args.subscriptions)) if args.subscriptions else ""
+    subscriptions = bot.load_subscriptions(path=os.path.join(tempfile.gettempdir(), "load-no-subscriptions.json"), raw=raw)
+    cwd, results = os.getcwd(), []
+    print(f"소스 {args.sources:,}개, 기록 {len(history):,}개 ({bot.DEDUP_BACKEND}), 구독 {len(subscriptions)}개, "
+          f"지연 {args.latency * 1000:.0f}ms(+{args.jitter * 1000:.0f}), 실패율 {args.failure_rate:.0%}")
+    with tempfile.TemporaryDirectory() as template:
+        os.chdir(template)
+        try:
+            # 기록은 한 번만 만들어(텍스트 → 선택한 저장소로 옮김) 규모마다 복사해 씀
+            t = time.perf_counter()
+            with open(bot.DB_FILE, "w", encoding="utf-8") as f:
+                f.writelines(f"{title}\n" for title in history)
+            with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+                bot.open_dedup_store().close()
+            sources = {name: {"enabled": False} for name in bot.SOURCES}
+            print(f"기록 준비 {time.perf_counter() - t:.1f}s, RSS {fmt_mb(current_rss())}")
+            for scale in scales:
+                total = max(1, int(args.items * scale))
+                feeds = synthetic_feeds(args, total, history, rng)
+                with tempfile.TemporaryDirectory() as tmp:
+                    for name in os.listdir(template):
+                        shutil.copy(os.path.join(template, name), tmp)
+                    os.chdir(tmp)
+                    with open(bot.SOURCES_FILE, "w", encoding="utf-8") as f:
+                        json.dump({**sources, **{name: {"transport": "json", "fetch": "fetch_synthetic", "category": "hackathon"}
+                                                 for name in feeds}}, f, ensure_ascii=False)
+                    sink = DiscordSink(latency=args.webhook_latency, pool_maxsize=bot.FANOUT_WORKERS)
+                    rss = current_rss()
+                    t = time.perf_counter()
+                    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+                        b = LoadBot(feeds, latency=args.latency, jitter=args.jitter, failure_rate=args.failure_rate,
+                                    seed=args.seed, full_resync=True, subscriptions=subscriptions)
+                        b.discord_session.mount("https://", sink)
+                        setup = time.perf_counter() - t
+                        b.run()
+                    wall = time.perf_counter() - t
+                    os.chdir(template)
+                stages = stage_report(b, wall)
+                status = {}
+                for m in b.metrics.values():
+                    status[m["status"]] = status.get(m["status"], 0) + 1
+                result = {"items": total, "sources": len(feeds), "wall_s": round(wall, 3), "setup_s": round(setup, 3),
+                          "rss_mb": round(current_rss() / 1024 / 1024, 1), "rss_growth_mb": round((current_rss() - rss) / 1024 / 1024, 1),
+                          "discord_messages": sink.messages, "discord_embeds": sink.embeds, "status": status, "stages": stages}
+                results.append(result)
+                print(f"\n[항목 {total:,}개] 전체 {wall:.2f}s (준비 {setup:.2f}s), 임베드 {sink.embeds:,}개 / 메시지 {sink.messages:,}개, "
+                      f"RSS {result['rss_mb']:.0f}MB (+{result['rss_growth_mb']:.0f}MB), 소스 상태 {status}")
+                print(f"   {'단계':<8}{'호출':>7}{'항목':>9}{'처리량':>13}{'p50':>10}{'p99':>10}{'RSS':>8}")
+                for stage, r in stages.items():
+                    print(f"   {stage:<8}{r['calls']:>7,}{r['items']:>9,}{r['throughput']:>10,.0f}건/s"
+                          f"{r['p50_ms']:>8.1f}ms{r['p99_ms']:>8.1f}ms{fmt_rss(r['rss_mb']):>8}")
+        finally:
+            os.chdir(cwd)
+    if len(results) > 1:
+        print("\n규모별 곡선 (처리량 건/s · p99 ms · RSS MB)")
+        print(f"   {'항목':>9}{'전체':>9}" + "".join(f"{stage:>24}" for stage in LOAD_STAGES))
+        for r in results:
+            cells = "".join(f"{s['throughput']:>10,.0f} {s['p99_ms']:>6.1f} {fmt_rss(s['rss_mb']):>6}" for s in r["stages"].values())
+            print(f"   {r['items']:>9,}{r['wall_s']:>8.1f}s{cells}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "scales": results}, f, ensure_ascii=False, indent=1)
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare_baseline(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"⚠️ 성능 저하: {line}")
+        if regressions:
+            raise SystemExit(1)
+        print(f"✅ 기준 결과({args.baseline}) 대비 {args.tolerance}배 안쪽")
+
+
+COMMANDS = {
+    "neardup": (bench_neardup, "제목 유사 중복 탐지(MinHash LSH) vs 쌍별 비교"),
+    "parse": (bench_parse, "HTML 수집기별 파싱 시간/최대 메모리 (픽스처 또는 합성 페이지)"),
+    "rsc": (bench_rsc, "부트텐트 RSC 청크 추출: 기존 3단계 방식 vs 스트리밍 디코더"),
+    "dates": (bench_dates, "전 소스 날짜 표기 정규화/마감 필터 처리량"),
+    "classify": (bench_classify, "제목 분류: 소스별 any() 루프 vs 키워드 매처 한 번 훑기 (Dev-Event README, 기록 파일)"),
+    "route": (bench_route, "구독 라우팅: 구독 규칙 × 항목 루프 vs 범주/소스/키워드 색인"),
+    "history": (bench_history, "중복 방지 기록 저장소(text/sqlite/compact) 파일 크기, 열기, 조회 시간"),
+    "load": (bench_load, "합성 소스 수천 개로 HackathonBot.run 부하 측정: 단계별 처리량, p50/p99, 메모리"),
+    "record": (bench_record, "실제 사이트 응답을 fixtures/replay/에 녹화"),
+    "replay": (bench_replay, "녹화본(없으면 합성 응답)을 로컬 서버로 재생하며 HackathonBot.run 전체 실행"),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="해커톤 봇 오프라인 성능 측정")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("neardup", help=COMMANDS["neardup"][1])
+    p.add_argument("--history", type=int, default=100_000)
+    p.add_argument("--queries", type=int, default=3000)
+    p = sub.add_parser("parse", help=COMMANDS["parse"][1])
+    p.add_argument("--repeat", type=int, default=5)
+    p = sub.add_parser("rsc", help=COMMANDS["rsc"][1])
+    p.add_argument("--camps", type=int, default=3000)
+    p.add_argument("--filler-mb", type=float, default=4)
+    p.add_argument("--repeat", type=int, default=3)
+    p = sub.add_parser("dates", help=COMMANDS["dates"][1])
+    p.add_argument("--items", type=int, default=200000)
+    p = sub.add_parser("classify", help=COMMANDS["classify"][1])
+    p.add_argument("--entries", type=int, default=3000, help="합성 README 행사 수 (fixtures/devevent.md가 없을 때)")
+    p.add_argument("--repeat", type=int, default=5)
+    p = sub.add_parser("route", help=COMMANDS["route"][1])
+    p.add_argument("--subscriptions", type=int, default=500)
+    p.add_argument("--items", type=int, default=5000)
+    p.add_argument("--repeat", type=int, default=3)
+    p = sub.add_parser("history", help=COMMANDS["history"][1])
+    p.add_argument("--history", type=int, default=100_000)
+    p.add_argument("--queries", type=int, default=3000)
+    p = sub.add_parser("load", help=COMMANDS["load"][1])
+    p.add_argument("--sources", type=int, default=1000)
+    p.add_argument("--items", type=int, default=10000, help="규모 1일 때 한 실행의 전체 항목 수")
+    p.add_argument("--history", type=int, default=100_000, help="미리 채울 중복 방지 기록 수")
+    p.add_argument("--scales", default="0.1,0.5,1", help="--items에 곱할 규모 (쉼표 구분)")
+    p.add_argument("--skew", type=float, default=1.0, help="소스 크기 지프 지수 (0이면 고르게)")
+    p.add_argument("--dup-rate", type=float, default=0.3, help="기록에 있는 제목 비율")
+    p.add_argument("--near-rate", type=float, default=0.05, help="기록 제목을 살짝 바꾼 제목 비율")
+    p.add_argument("--cross-rate", type=float, default=0.05, help="다른 소스와 겹치는 새 제목 비율")
+    p.add_argument("--latency", type=float, default=0.02, help="소스 응답 지연(초)")
+    p.add_argument("--jitter", type=float, default=0.02, help="0~jitter초 무작위 추가 지연")
+    p.add_argument("--failure-rate", type=float, default=0.02, help="소스 수집 실패 비율")
+    p.add_argument("--webhook-latency", type=float, default=0.0, help="디스코드 요청 지연(초)")
+    p.add_argument("--subscriptions", type=int, default=0, help="합성 구독 수 (0이면 웹훅 하나)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    p.add_argument("--baseline", metavar="PATH", help="이전 --json 결과와 비교해 저하가 있으면 종료 코드 1")
+    p.add_argument("--tolerance", type=float, default=1.5, help="기준 대비 허용 배수")
+    sub.add_parser("record", help=COMMANDS["record"][1])
+    p = sub.add_parser("replay", help=COMMANDS["replay"][1])
+    p.add_argument("--synthetic", action="store_true", help="녹화본이 있어도 합성 응답 사용")
+    p.add_argument("--runs", type=int, default=2, help="반복 실행 횟수 (2회차부터 304/중복 제거 경로 측정)")
+    p.add_argument("--latency", type=float, default=0.0, help="모든 응답에 더할 지연(초)")
+    p.add_argument("--jitter", type=float, default=0.0, help="0~jitter초 무작위 추가 지연")
+    p.add_argument("--error-rate", type=float, default=0.0, help="무작위 503 응답 비율")
+    p.add_argument("--slow", action="append", metavar="HOST=SEC", help="특정 호스트 추가 지연")
+    p.add_argument("--block", action="append", metavar="HOST=STATUS", help="특정 호스트 고정 오류 응답")
+    p.add_argument("--page-workers", type=int, default=bot.PAGE_WORKERS, help="페이지형 게시판의 뒤 페이지 동시 요청 수 (1이면 순서대로)")
+    args = parser.parse_args()
+    COMMANDS[args.command][0](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,1288 @@
 import os
+import sys
+import html
+import argparse
+import asyncio
+import signal
 import json
+import sqlite3
 import requests
+import urllib3
 import re
-from datetime import datetime
-from bs4 import BeautifulSoup
+import random
+import struct
+import hashlib
+import zlib
+import time
+import threading
+import queue
+from array import array
+from collections import Counter
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 WEBHOOK_URL = os.environ.get('DISCORD_WEBHOOK_URL')
+# 쉼표/공백으로 여러 웹훅을 지정하면 병렬로 모두 전송
+WEBHOOK_URLS = [u for u in re.split(r'[\s,]+', WEBHOOK_URL or '') if u]
 DB_FILE = "sent_hackathons.txt"
 
+# 중복 방지 저장소: text(기존 한 줄 append 방식) | sqlite(정규화 키 인덱스 + 메타데이터)
+#                  | compact(정렬된 64비트 해시 + 블룸 필터 바이너리, 저장소에 커밋되는 크기가 가장 작음)
+DEDUP_BACKEND = os.environ.get('BOT_DEDUP_BACKEND', 'compact')
+DEDUP_DB_FILE = "sent_hackathons.db"
+HISTORY_FILE = "sent_hackathons.bin"
+# 마감일이 지난 뒤 이 기간이 지나면 기록을 정리 (같은 공고가 다시 올라와도 재전송되지 않을 만큼 여유)
+DEDUP_TTL_DAYS = int(os.environ.get('BOT_DEDUP_TTL_DAYS', '90'))
+
+# 동시 수집 설정: 워커 수, 소스별 마감 시간(초), 전체 실행 예산(초)
+MAX_WORKERS = int(os.environ.get('BOT_MAX_WORKERS', '6'))
+SOURCE_DEADLINE = float(os.environ.get('BOT_SOURCE_DEADLINE', '40'))
+RUN_BUDGET = float(os.environ.get('BOT_RUN_BUDGET', '120'))
+
+# HTTP 클라이언트 설정: 호스트별 커넥션 풀 크기, 재시도 횟수, 백오프 계수(초)
+HTTP_POOL_SIZE = int(os.environ.get('BOT_HTTP_POOL_SIZE', '4'))
+HTTP_RETRIES = int(os.environ.get('BOT_HTTP_RETRIES', '3'))
+HTTP_BACKOFF = float(os.environ.get('BOT_HTTP_BACKOFF', '0.5'))
+RETRY_STATUS = (429, 500, 502, 503, 504)
+# 서버가 보낸 Retry-After(초)를 이 값까지만 따름. 한 시간 같은 값을 그대로 기다리면 실행이 멈춤
+HTTP_RETRY_AFTER_MAX = float(os.environ.get('BOT_HTTP_RETRY_AFTER_MAX', '30'))
+
+# HTML 파서: lxml이 설치돼 있으면 사용하고, 없으면 표준 html.parser로 대체
+def _html_parser():
+    try:
+        import lxml  # noqa: F401
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+
+HTML_PARSER = os.environ.get('BOT_HTML_PARSER')
+NEXT_DATA_RE = re.compile(r'<script[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.DOTALL)
+LD_JSON_RE = re.compile(r'<script[^>]*\btype=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.DOTALL)
+
+
+def html_parser():
+    """HTML_PARSER를 처음 쓸 때 정합니다 (lxml 확인도 HTML 소스가 실제로 돌 때까지 미룸)."""
+    global HTML_PARSER
+    if not HTML_PARSER:
+        HTML_PARSER = _html_parser()
+    return HTML_PARSER
+
+
+def make_soup(markup, parse_only=None):
+    """HTML_PARSER로 파싱합니다. parse_only(strainer)를 주면 필요한 태그만 트리로 만듭니다.
+    bs4는 JSON/마크다운 소스만 도는 실행에서는 불러오지 않도록 여기서 가져옵니다.
+    """
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(markup, html_parser(), parse_only=parse_only)
+
+
+def strainer(name, **attrs):
+    """make_soup에 넘길 SoupStrainer를 만듭니다."""
+    from bs4 import SoupStrainer
+    return SoupStrainer(name, **attrs)
+
+# Next.js RSC 스트림 (self.__next_f.push([1, "..."]) 청크) 해석
+RSC_PUSH = 'self.__next_f.push('
+RSC_END = ')</script>'
+RSC_READ_SIZE = 64 * 1024
+JSON_DECODER = json.JSONDecoder()
+
+
+def find_rsc_chunk(pieces, marker):
+    """텍스트 조각을 이어 읽으며 marker가 든 push(...) 인자 문자열 하나를 돌려줍니다.
+    이미 지나간 청크는 버리고, 끝 표시는 새로 들어온 부분에서만 찾으므로 한 번만 훑습니다.
+    """
+    buf, scan_from = '', 0
+    for piece in pieces:
+        buf += piece
+        while True:
+            start = buf.find(RSC_PUSH)
+            if start == -1:
+                # 조각 경계에 걸친 RSC_PUSH 앞부분만 남김
+                buf, scan_from = buf[-(len(RSC_PUSH) - 1):], 0
+                break
+            end = buf.find(RSC_END, max(scan_from, start + len(RSC_PUSH)))
+            if end == -1:
+                buf = buf[start:]
+                scan_from = max(len(buf) - len(RSC_END) + 1, len(RSC_PUSH))
+                break
+            chunk = buf[start + len(RSC_PUSH):end]
+            if marker in chunk:
+                return chunk
+            buf, scan_from = buf[end + len(RSC_END):], 0
+    return None
+
+
+def extract_rsc_array(pieces, key):
+    """RSC 스트림에서 key에 해당하는 JSON 배열을 꺼냅니다. 없으면 빈 리스트.
+    해당 청크 하나만 디코딩하고, 배열은 C 구현 raw_decode로 시작 위치부터 바로 읽습니다.
+    """
+    chunk = find_rsc_chunk(pieces, f'\\"{key}\\"')
+    if chunk is None:
+        return []
+    try:
+        inner = json.loads(chunk)[1]  # 이중 이스케이프 해제
+        idx = inner.find(f'"{key}":')
+        if idx == -1:
+            return []
+        arr, _ = JSON_DECODER.raw_decode(inner, inner.index('[', idx))
+        return arr
+    except (ValueError, IndexError, TypeError):
+        return []
+
+
+# 조건부 요청 캐시: ETag/Last-Modified와 파싱 결과를 URL별로 보관 (Actions에서는 커밋하지 않고 캐시로 이어 씀)
+HTTP_CACHE_FILE = "http_cache.json"
+HTTP_CACHE_MAX_AGE_DAYS = int(os.environ.get('BOT_HTTP_CACHE_MAX_AGE_DAYS', '14'))
+HTTP_CACHE_MAX_BYTES = int(os.environ.get('BOT_HTTP_CACHE_MAX_BYTES', str(512 * 1024)))
+
+# 페이지형 소스의 최신 id 기록(high-water mark). 이미 본 id에 닿으면 페이지 넘김을 멈춤
+CURSOR_FILE = "source_cursors.json"
+FULL_RESYNC = os.environ.get('BOT_FULL_RESYNC') == '1'
+MAX_PAGES = int(os.environ.get('BOT_MAX_PAGES', '10'))
+# 페이지 번호형 게시판(paginate)을 앞에서부터 읽을 최대 페이지 수 (첫 페이지가 모두 새 공고일 때만 뒤 페이지를 읽음)와
+# 뒤 페이지를 읽을 때의 소스당 동시 요청 수
+PAGE_DEPTH = int(os.environ.get('BOT_PAGE_DEPTH', '3'))
+PAGE_WORKERS = int(os.environ.get('BOT_PAGE_WORKERS', '3'))
+
+
+def load_json_state(path, default):
+    """실행 간에 유지되는 JSON 상태 파일을 읽습니다. 없거나 깨졌으면 default를 돌려줍니다."""
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ {path} 읽기 실패, 새로 시작합니다: {e}")
+    return default
+
+
+def save_json_state(path, data):
+    """임시 파일에 쓴 뒤 교체해서 중간에 죽어도 상태 파일이 깨지지 않게 합니다."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    os.replace(tmp, path)
+
+
+def split_state(sources, keys):
+    """소스별 상태 {이름: {...}}를 (keys를 뺀 커밋할 상태, keys에 든 실행 기록)으로 나눕니다."""
+    kept = {n: {k: v for k, v in e.items() if k not in keys} for n, e in sources.items()}
+    runs = {n: {k: v for k, v in e.items() if k in keys} for n, e in sources.items()}
+    return kept, {n: e for n, e in runs.items() if e}
+
+
+def merge_state(sources, runs):
+    """split_state로 따로 저장한 실행 기록을 커밋된 소스별 상태에 다시 합칩니다."""
+    for name, entry in runs.items():
+        if name in sources:
+            sources[name].update(entry)
+    return sources
+
+
+def _accept_encoding():
+    """urllib3가 해제할 수 있는 압축 방식만 협상합니다 (br은 brotli 설치 시에만)."""
+    encodings = ["gzip", "deflate"]
+    try:
+        import brotli  # noqa: F401
+        encodings.append("br")
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            encodings.append("br")
+        except ImportError:
+            pass
+    return ", ".join(encodings)
+
+
+# ─────────────────────────────────────────────────────
+# 계측 섹션: 소스별 네트워크/파싱 시간, 전송량, 오류를 스레드 단위로 모음
+# ─────────────────────────────────────────────────────
+
+# 실행 보고서와 최근 실행 기록 (Actions에서는 커밋하지 않고 아티팩트로 올림)
+RUN_REPORT_FILE = "run_report.json"
+RUN_HISTORY_FILE = "run_history.jsonl"
+RUN_HISTORY_MAX = int(os.environ.get('BOT_RUN_HISTORY_MAX', '200'))
+
+_metrics_local = threading.local()
+_metrics_lock = threading.Lock()
+
+
+def new_metrics(name):
+    """소스 하나의 계측 값. connect_s는 DNS+TCP, tls_s는 TLS 핸드셰이크, ttfb_s는 요청~응답 헤더입니다."""
+    return {
+        "source": name, "status": None, "items": 0, "elapsed_s": 0.0,
+        "requests": 0, "connections": 0, "connect_s": 0.0, "tls_s": 0.0, "ttfb_s": 0.0,
+        "download_s": 0.0, "network_s": 0.0, "parse_s": 0.0, "bytes": 0, "retries": 0,
+        "http_errors": [], "errors": [],
+    }
+
+
+def current_metrics():
+    return getattr(_metrics_local, "metrics", None)
+
+
+@contextmanager
+def collecting(metrics):
+    """이 스레드에서 일어나는 HTTP 요청과 report_error를 metrics에 기록합니다."""
+    previous = current_metrics()
+    _metrics_local.metrics = metrics
+    try:
+        yield metrics
+    finally:
+        _metrics_local.metrics = previous
+
+
+def record(key, amount):
+    metrics = current_metrics()
+    if metrics is not None:
+        with _metrics_lock:
+            if isinstance(metrics[key], list):
+                metrics[key].append(amount)
+            else:
+                metrics[key] += amount
+
+
+def finish_metrics(metrics, state, found, elapsed):
+    """수집이 끝난 소스의 상태/항목 수/소요 시간을 채웁니다. 파싱 시간은 전체에서 네트워크 시간을 뺀 값입니다."""
+    if state == "ok" and (metrics["errors"] or metrics["http_errors"]):
+        # 수집 함수가 예외를 삼켰어도 결과가 비었으면 실패로 기록
+        state = "partial" if found else "error"
+    metrics.update(status=state, items=len(found), elapsed_s=round(elapsed, 4))
+    metrics["parse_s"] = max(metrics["elapsed_s"] - metrics["network_s"], 0.0)
+
+
+def merge_metrics(into, part):
+    """part(페이지 하나 등 일부 요청의 계측)의 횟수, 시간, 오류를 into에 더합니다."""
+    if into is None:
+        return
+    with _metrics_lock:
+        for key, value in part.items():
+            if isinstance(value, list):
+                into[key].extend(value)
+            elif isinstance(value, (int, float)) and key != "elapsed_s":
+                into[key] += value
+
+
+def rounded(metrics):
+    return {k: round(v, 4) if isinstance(v, float) else v for k, v in metrics.items()}
+
+
+def report_error(e):
+    """수집 함수가 삼킨 예외의 종류를 현재 소스 계측에 남깁니다. 같은 예외는 한 번만 셉니다."""
+    if getattr(e, "_bot_reported", False):
+        return
+    try:
+        e._bot_reported = True
+    except AttributeError:
+        pass
+    record("errors", type(e).__name__)
+
+
+class _TimedConnectionMixin:
+    """새 연결을 맺을 때 DNS+TCP(_new_conn)와 TLS(나머지) 시간을 기록합니다."""
+
+    def _new_conn(self):
+        t = time.perf_counter()
+        sock = super()._new_conn()
+        self._tcp_s = time.perf_counter() - t
+        return sock
+
+    def connect(self):
+        t = time.perf_counter()
+        self._tcp_s = 0.0
+        super().connect()
+        total = time.perf_counter() - t
+        record("connections", 1)
+        record("connect_s", self._tcp_s)
+        record("tls_s", max(total - self._tcp_s, 0.0))
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, urllib3.connection.HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, urllib3.connection.HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(urllib3.HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+
+
+class InstrumentedSession(requests.Session):
+    """요청마다 TTFB, 다운로드 시간, 전송 바이트(압축 상태), 재시도 횟수를 현재 소스 계측에 더합니다.
+    리다이렉트는 바깥 요청 한 번으로만 셉니다.
+    """
+
+    def send(self, request, **kwargs):
+        depth = getattr(_metrics_local, "send_depth", 0)
+        _metrics_local.send_depth = depth + 1
+        t = time.perf_counter()
+        try:
+            res = super().send(request, **kwargs)
+        except Exception as e:
+            if depth == 0:
+                record("network_s", time.perf_counter() - t)
+                report_error(e)
+            raise
+        finally:
+            _metrics_local.send_depth = depth
+        if depth == 0 and current_metrics() is not None:
+            total = time.perf_counter() - t
+            ttfb = res.elapsed.total_seconds()
+            if kwargs.get("stream"):
+                size = int(res.headers.get("Content-Length") or 0)
+            else:
+                size = getattr(res.raw, "tell", lambda: 0)() or len(res.content)
+            retries = getattr(getattr(res.raw, "retries", None), "history", ()) or ()
+            record("requests", 1)
+            record("ttfb_s", ttfb)
+            record("download_s", max(total - ttfb, 0.0))
+            record("network_s", total)
+            record("bytes", size)
+            record("retries", len(retries))
+            if res.status_code >= 400:
+                record("http_errors", res.status_code)
+        return res
+
+
+class CappedRetry(Retry):
+    """Retry-After를 HTTP_RETRY_AFTER_MAX초로 자르는 재시도 정책입니다. Retry.new()가 같은 클래스로 복사하므로 재시도마다 유지됩니다."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, HTTP_RETRY_AFTER_MAX)
+
+
+def build_session(retries=HTTP_RETRIES):
+    """keep-alive 커넥션 풀과 재시도 정책을 갖춘 공용 requests 세션을 만듭니다.
+    429/5xx 응답은 Retry-After를 따르되 HTTP_RETRY_AFTER_MAX초까지만 기다리고, 없으면 지터가 섞인 지수 백오프로 재시도합니다.
+    """
+    retry = CappedRetry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        status_forcelist=RETRY_STATUS,
+        # 수집용 POST(GraphQL, 캠퍼스픽 목록)는 조회 요청이므로 재시도해도 안전
+        allowed_methods=frozenset({"GET", "HEAD", "POST"}),
+        backoff_factor=HTTP_BACKOFF,
+        backoff_jitter=HTTP_BACKOFF,  # 재시도마다 0~HTTP_BACKOFF초 무작위 지연 추가
+        backoff_max=30,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = TimedAdapter(pool_connections=16, pool_maxsize=max(HTTP_POOL_SIZE, MAX_WORKERS), max_retries=retry)
+    session = InstrumentedSession()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept-Encoding": _accept_encoding(), "Connection": "keep-alive"})
+    return session
+
+
+class DaemonThreadPool(Executor):
+    """마감을 넘겨 버린 작업을 기다리지 않는 데몬 스레드 풀입니다.
+    ThreadPoolExecutor의 스레드는 인터프리터가 끝날 때 join되어, 버린 수집이 끝날 때까지 프로세스가 남습니다.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix="pool"):
+        self.max_workers, self.prefix = max(1, max_workers), thread_name_prefix
+        self.jobs, self.threads, self.lock = queue.SimpleQueue(), [], threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.jobs.put((future, fn, args, kwargs))
+        with self.lock:
+            if len(self.threads) < self.max_workers:
+                thread = threading.Thread(target=self._work, name=f"{self.prefix}_{len(self.threads)}", daemon=True)
+                self.threads.append(thread)
+                thread.start()
+        return future
+
+    def _work(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            future, fn, args, kwargs = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        if cancel_futures:
+            while True:
+                try:
+                    job = self.jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is not None:
+                    job[0].cancel()
+        for _ in self.threads:
+            self.jobs.put(None)
+        if wait:
+            for thread in self.threads:
+                thread.join()
+
+
+# ─────────────────────────────────────────────────────
+# 날짜 정규화 섹션
+# ─────────────────────────────────────────────────────
+
+DATE_RE = re.compile(r'(\d{4})\s*[년.\-/]\s*(\d{1,2})\s*[월.\-/]\s*(\d{1,2})')
+# "Mar 15", "MAR 15, 2026", "March 3rd - 5th" 같은 영문 월 표기 (일만 오는 범위 끝도 함께 잡음).
+# 월 이름은 약자와 전체 철자만 받음 ("Market 15", "Junior 3"은 날짜가 아님)
+MONTH_DATE_RE = re.compile(
+    r'\b(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sept?(?:ember)?'
+    r'|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b\.?\s+(\d{1,2})(?:st|nd|rd|th)?\b'
+    r'(?:\s*[-–~]\s*(\d{1,2})(?:st|nd|rd|th)?\b(?![:./]))?(?:,?\s+(\d{4}))?',
+    re.IGNORECASE,
+)
+MONTHS = {m: i for i, m in enumerate(('jan', 'feb', 'mar', 'apr', 'may', 'jun',
+                                      'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)}
+
+
+def _nearest_year(month, day, ref):
+    """연도가 없는 날짜를 기준일에서 가까운 해로 봅니다 (12월에 본 'JAN 10'은 다음 해).
+    시즌 페이지에는 지난 행사가 남아 있으므로 미래 쪽 거리를 두 배로 쳐서 대략 8개월 전 ~ 4개월 후로 해석합니다.
+    """
+    candidates = []
+    for year in (ref.year - 1, ref.year, ref.year + 1):
+        try:
+            candidates.append(datetime(year, month, day))
+        except ValueError:
+            pass
+    return min(candidates, key=lambda d: (d - ref) * 2 if d > ref else ref - d).year if candidates else None
+
+
+@lru_cache(maxsize=8192)
+def parse_date_range(text, today=None):
+    """날짜 문자열을 (시작일, 종료일) YYYY-MM-DD 쌍으로 바꿉니다. 날짜가 없으면 (None, None).
+    숫자 표기(2026-05-01, 2026.05.01, 2026년 5월 1일)와 영문 월 표기(Devpost, MLH)를 읽습니다.
+    연도가 빠진 날짜는 뒤에 나오는 날짜의 연도를, 그것도 없으면 today에서 가장 가까운 해를 씁니다.
+    """
+    text = str(text or '')
+    found = []  # (위치, 연, 월, 일), 연도를 모르면 None
+    for m in DATE_RE.finditer(text):
+        found.append((m.start(), int(m.group(1)), int(m.group(2)), int(m.group(3))))
+    for m in MONTH_DATE_RE.finditer(text):
+        month, year = MONTHS[m.group(1)[:3].lower()], int(m.group(4)) if m.group(4) else None
+        found.append((m.start(), year, month, int(m.group(2))))
+        if m.group(3):
+            found.append((m.start(3), year, month, int(m.group(3))))
+    if not found:
+        return None, None
+    dates, later = [], None
+    for _, year, month, day in sorted(found, reverse=True):
+        if year is None:
+            if later is None:
+                ref = datetime(*map(int, today.split('-'))) if today else datetime.now()
+                year = _nearest_year(month, day, ref)
+            else:
+                # 뒤 날짜보다 늦은 월/일이면 해를 넘긴 범위 (Dec 28 - Jan 03, 2027)
+                year = later.year if (month, day) <= (later.month, later.day) else later.year - 1
+        try:
+            later = datetime(year, month, day)
+        except (TypeError, ValueError):
+            continue
+        dates.append(later)
+    if not dates:
+        return None, None
+    start, end = min(dates), max(dates)
+    return f"{start.year:04d}-{start.month:02d}-{start.day:02d}", f"{end.year:04d}-{end.month:02d}-{end.day:02d}"
+
+
+def shift_year(date, years):
+    """YYYY-MM-DD 문자열의 연도만 years만큼 옮깁니다."""
+    return f"{int(date[:4]) + years:04d}{date[4:]}" if date and years else date
+
+
+def normalize_dates(items, today=None):
+    """항목마다 date 문자열을 해석해 start/end(YYYY-MM-DD 또는 None)를 채웁니다.
+    같은 문자열은 parse_date_range 캐시로 한 번만 해석하므로 기록 전체에 돌려도 빠릅니다.
+    스냅샷이 처음 본 해로 고정한 항목(year_shift)은 추정한 연도를 그만큼 되돌립니다.
+    """
+    today = today or datetime.now().strftime('%Y-%m-%d')
+    for item in items:
+        start, end = parse_date_range(item.get('date'), today)
+        shift = item.get('year_shift', 0)
+        item['start'], item['end'] = shift_year(start, shift), shift_year(end, shift)
+    return items
+
+
+def extract_deadline(date_text):
+    """'마감/일정' 문자열의 종료일(YYYY-MM-DD)을 돌려줍니다. 없으면 None."""
+    return parse_date_range(date_text, datetime.now().strftime('%Y-%m-%d'))[1]
+
+
+# ─────────────────────────────────────────────────────
+# 중복 방지 저장소 섹션
+# ─────────────────────────────────────────────────────
+
+# 수집기가 제목 앞에 붙이는 출처 접두어 (파서를 고치면 함께 고침). 공고 제목 자체의 [채용 우대] 같은 대괄호는 키에 남김
+SOURCE_TITLE_TAGS = ('캠퍼스픽', '데브이벤트', '부트캠프/교육', 'SSAFY', '우테코', '부스트캠프', '부트텐트', 'KT 에이블스쿨',
+                     'KT Cloud TECH UP')
+# 제목 앞의 이모지/기호와 위 출처 접두어
+TITLE_PREFIX_RE = re.compile(r'^(?:[^\w\[]+|\[(?:' + '|'.join(map(re.escape, SOURCE_TITLE_TAGS)) + r')\])+')
+NON_WORD_RE = re.compile(r'[\W_]+')
+DIGITS_RE = re.compile(r'\d+')
+# 정규 URL에서 뺄 추적용 쿼리 (utm_로 시작하는 것과 아래 이름 그대로인 것만. refId 같은 실제 파라미터는 남김)
+TRACKING_PARAMS = frozenset(['ref', 'referrer', 'fbclid', 'gclid'])
+
+# 유사 중복 판정: 3-gram 자카드 유사도 기준과 MinHash 밴드 구성 (6밴드 x 5행 ≈ 유사도 0.7부터 후보)
+# 0.8이면 sent_hackathons.txt에서 "DigitalOcean Hackathon NY/SF"처럼 짧은 다른 공고끼리 묶여서 0.95로 올림
+# (이 기록에서 같은 출처로 보고 비교해도 "AI 에이전트 개발/개발자" 한 쌍만 묶임).
+# 기준을 넘어도 같은 출처/URL의 기록일 때만 같은 공고로 보고, 단어 차이가 아래 군더더기뿐이면 기준과 관계없이 같은 공고로 봄
+NEAR_DUP_THRESHOLD = float(os.environ.get('BOT_NEAR_DUP_THRESHOLD', '0.95'))
+FILLER_WORDS = frozenset(['모집', '안내', '공고', '접수', '신청', '모집중', '마감', '임박', '연장', '추가', '재공고', '선발'])
+# 날짜/기수 표기 단어 (2026년, 3월, 14기, 제3회 ...). 숫자 자체가 다르면 similarity가 이미 0을 돌려줌
+DATE_WORD_RE = re.compile(r'^제?\d+(?:년|월|일|기|기생|회|차|주년|st|nd|rd|th)?$')
+MINHASH_BANDS, MINHASH_ROWS = 6, 5
+_MINHASH_MASKS = [random.Random(seed).getrandbits(32) for seed in range(MINHASH_BANDS * MINHASH_ROWS)]
+
+
+def normalize_key(title, url=None):
+    """출처 접두어, 이모지, 문장부호, 대소문자 차이를 없앤 제목 키를 만듭니다.
+    그렇게 하면 비는 제목(기호뿐인 제목 등)은 원래 제목을, 제목도 없으면 정규 URL을 키로 씁니다.
+    """
+    return (NON_WORD_RE.sub(' ', TITLE_PREFIX_RE.sub('', title)).strip().casefold()
+            or NON_WORD_RE.sub(' ', title).strip().casefold() or title.strip().casefold() or canonical_url(url))
+
+
+def canonical_url(url):
+    """스킴/호스트 대소문자, www., 추적용 쿼리, 프래그먼트, 끝 슬래시 차이를 없앤 URL을 만듭니다."""
+    if not url:
+        return ''
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if not (k.lower().startswith('utm_') or k.lower() in TRACKING_PARAMS))
+    return urlunsplit(('https' if parts.scheme in ('http', 'https') else parts.scheme,
+                       host, parts.path.rstrip('/'), urlencode(query), ''))
+
+
+def shingles(key):
+    """정규화된 제목의 문자 3-gram 해시 집합입니다."""
+    if len(key) < 3:
+        return {zlib.crc32(key.encode('utf-8'))}
+    return {zlib.crc32(key[i:i + 3].encode('utf-8')) for i in range(len(key) - 2)}
+
+
+def minhash_bands(shingle_set):
+    """MinHash 서명을 밴드별로 묶어 밴드 번호가 포함된 정수 버킷 키 목록으로 돌려줍니다."""
+    sig = [min(map(m.__xor__, shingle_set)) for m in _MINHASH_MASKS]
+    return [(b << 32) | zlib.crc32(struct.pack(f'<{MINHASH_ROWS}I', *sig[b * MINHASH_ROWS:(b + 1) * MINHASH_ROWS]))
+            for b in range(MINHASH_BANDS)]
+
+
+def item_source(item):
+    """기록에 남기는 출처 (레지스트리 소스 이름, 없으면 주최)."""
+    return str(item.get('source') or item.get('host') or "").replace('\t', ' ')
+
+
+def filler_only(key, cand):
+    """두 정규화 제목의 단어 차이가 날짜/기수 표기나 '모집', '안내' 같은 군더더기뿐이면 True."""
+    a, b = Counter(key.split()), Counter(cand.split())
+    return all(w in FILLER_WORDS or DATE_WORD_RE.match(w) for w in (a - b) + (b - a))
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+def similarity(key, key_shingles, cand):
+    """자카드 유사도를 돌려주되, 숫자(연도/기수)가 다르면 다른 공고로 보고 0을 돌려줍니다."""
+    if DIGITS_RE.findall(key) != DIGITS_RE.findall(cand):
+        return 0.0
+    return jaccard(key_shingles, shingles(cand))
+
+
+def best_match(key, key_shingles, candidates, threshold, accept=None):
+    """LSH 후보 중 같은 공고로 볼 수 있는 가장 비슷한 것을 돌려줍니다.
+    단어 차이가 군더더기뿐인 후보는 그대로, 아니면 유사도가 threshold 이상이고 accept(후보)가 참이어야 합니다.
+    """
+    scored = sorted(((similarity(key, key_shingles, cand), cand) for cand in candidates), reverse=True)
+    for score, cand in scored:
+        if score > 0 and filler_only(key, cand):
+            return cand
+        if score >= threshold and accept is not None and accept(cand):
+            return cand
+    return None
+
+
+class NearDuplicateIndex:
+    """MinHash LSH 메모리 인덱스입니다. 밴드가 하나라도 겹치는 후보만 자카드 유사도로 확인하므로
+    기록 전체와 쌍별 비교(O(n²))를 하지 않습니다.
+    """
+
+    def __init__(self, threshold=NEAR_DUP_THRESHOLD):
+        self.threshold = threshold
+        self.buckets = {}
+        self.keys = set()
+
+    def add(self, key):
+        if key in self.keys:
+            return
+        self.keys.add(key)
+        for band in minhash_bands(shingles(key)):
+            self.buckets.setdefault(band, []).append(key)
+
+    def query(self, key, accept=None):
+        """key와 같은 공고로 볼 수 있는 기존 키를 돌려줍니다(best_match). 없으면 None."""
+        if key in self.keys:
+            return key
+        sh = shingles(key)
+        candidates = set()
+        for band in minhash_bands(sh):
+            candidates.update(self.buckets.get(band, ()))
+        return best_match(key, sh, candidates, self.threshold, accept)
+
+
+class TextDedupStore:
+    """sent_hackathons.txt에 제목을 한 줄씩 추가하는 기존 방식의 저장소입니다.
+    URL이 기록되지 않으므로 유사 중복 판정은 메모리 LSH 인덱스로만 합니다.
+    """
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        self.titles = set()
+        self.index = NearDuplicateIndex()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.titles = set(line.strip() for line in f if line.strip())
+        for title in self.titles:
+            self.index.add(normalize_key(title))
+
+    def __contains__(self, title):
+        return title in self.titles
+
+    def seen(self, item):
+        """같은 제목이거나 정규화 제목이 기존 기록과 거의 같으면 True."""
+        return item['title'] in self.titles or self.index.query(normalize_key(item['title'], item.get('url'))) is not None
+
+    def add_many(self, items):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for item in items:
+                f.write(f"{item['title']}\n")
+                self.titles.add(item['title'])
+                self.index.add(normalize_key(item['title'], item.get('url')))
+
+    def prune(self, ttl_days=DEDUP_TTL_DAYS, keep_sources=()):
+        return 0  # 메타데이터가 없어 정리할 수 없음
+
+    def close(self):
+        pass
+
+
+class SqliteDedupStore:
+    """정규화 제목 키를 기본 키로 쓰는 SQLite 저장소입니다.
+    조회는 인덱스 몇 번으로 끝나므로 시작 비용이 기록 크기와 무관합니다.
+    정규 URL 인덱스와 MinHash 밴드 테이블(lsh)로 출처가 다른 같은 공고도 찾아냅니다.
+    처음 열 때 sent_hackathons.txt 내용을 한 번만 가져옵니다.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path=DEDUP_DB_FILE, legacy_path=DB_FILE, threshold=NEAR_DUP_THRESHOLD):
+        self.path = path
+        self.threshold = threshold
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        self._create_schema()
+        if version == 0:
+            self._import_legacy(legacy_path)
+        self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def _create_schema(self):
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS sent ("
+            " key TEXT PRIMARY KEY, title TEXT NOT NULL, source TEXT, url TEXT,"
+            " deadline TEXT, first_seen TEXT NOT NULL, url_key TEXT) WITHOUT ROWID"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_sent_deadline ON sent(deadline)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_sent_url_key ON sent(url_key)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS lsh ("
+            " band INTEGER NOT NULL, key TEXT NOT NULL, PRIMARY KEY (band, key)) WITHOUT ROWID"
+        )
+
+    def _insert_rows(self, rows):
+        """(title, source, url, deadline, first_seen) 행을 키/밴드와 함께 넣습니다."""
+        sent, bands = [], []
+        for title, source, url, deadline, first_seen in rows:
+            key = normalize_key(title, url)
+            sent.append((key, title, source, url, deadline, first_seen, canonical_url(url) or None))
+            bands.extend((band, key) for band in minhash_bands(shingles(key)))
+        self.conn.executemany("INSERT OR IGNORE INTO sent VALUES (?, ?, ?, ?, ?, ?, ?)", sent)
+        self.conn.executemany("INSERT OR IGNORE INTO lsh VALUES (?, ?)", bands)
+
+    def _import_legacy(self, legacy_path):
+        if not os.path.exists(legacy_path):
+            return
+        now = datetime.now().isoformat(timespec="seconds")
+        with open(legacy_path, "r", encoding="utf-8") as f:
+            rows = [(line.strip(), "legacy", None, None, now) for line in f if line.strip()]
+        self._insert_rows(rows)
+        print(f"🗃️ {legacy_path}에서 {len(rows)}개 기록을 가져왔습니다.")
+
+    def __contains__(self, title):
+        with self.lock:
+            row = self.conn.execute("SELECT 1 FROM sent WHERE key = ?", (normalize_key(title),)).fetchone()
+        return row is not None
+
+    def find_similar(self, key, source=None, url_key=None):
+        """LSH 밴드가 겹치는 후보 중 같은 공고로 볼 수 있는 기존 키를 돌려줍니다.
+        단어 차이가 군더더기뿐이 아니면 출처나 정규 URL이 같은 기록만 인정합니다.
+        """
+        sh = shingles(key)
+        bands = minhash_bands(sh)
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT key, source, url_key FROM sent WHERE key IN"
+                f" (SELECT key FROM lsh WHERE band IN ({','.join('?' * len(bands))}))", bands
+            ).fetchall()
+        candidates = {k: (s, u) for k, s, u in rows}
+        return best_match(key, sh, candidates, self.threshold,
+                          lambda cand: (source and candidates[cand][0] == source) or (url_key and candidates[cand][1] == url_key))
+
+    def seen(self, item):
+        """정규화 제목, 정규 URL, 유사 제목 중 하나라도 기록에 있으면 True."""
+        key, url_key = normalize_key(item['title'], item.get('url')), canonical_url(item.get('url'))
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM sent WHERE key = ? OR (url_key = ? AND url_key IS NOT NULL)",
+                (key, url_key or None),
+            ).fetchone()
+        return row is not None or self.find_similar(key, item_source(item), url_key) is not None
+
+    def add_many(self, items):
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = [(i['title'], item_source(i), i.get('url'),
+                 i['end'] if 'end' in i else extract_deadline(i.get('date')), now) for i in items]
+        with self.lock:
+            self._insert_rows(rows)
+            self.conn.commit()
+
+    def prune(self, ttl_days=DEDUP_TTL_DAYS, keep_sources=()):
+        """마감일로부터 ttl_days가 지난 기록을 지우고 삭제 건수를 돌려줍니다.
+        keep_sources의 기록은 날짜가 게시일이므로 지우지 않습니다 (예전에 게시일을 마감으로 저장한 행 포함).
+        """
+        cutoff = (datetime.now() - timedelta(days=ttl_days)).strftime('%Y-%m-%d')
+        keep = list(keep_sources)
+        with self.lock:
+            cur = self.conn.execute(
+                "DELETE FROM sent WHERE deadline IS NOT NULL AND deadline < ?"
+                f" AND source NOT IN ({','.join('?' * len(keep))})", [cutoff] + keep)
+            if cur.rowcount:
+                self.conn.execute("DELETE FROM lsh WHERE key NOT IN (SELECT key FROM sent)")
+            self.conn.commit()
+        return cur.rowcount
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+# 바이너리 기록 파일 구성: 머리글 | 블룸 필터 | 정렬된 제목 해시 | 정렬된 URL 해시 | zlib(행들 + 출처\t제목 줄들) | 덧붙인 기록
+# 조회에는 앞의 세 부분만 쓰고, 압축된 메타데이터는 정리/내보내기/유사 제목 비교 때만 풉니다.
+HISTORY_MAGIC = b"HKSL"
+HISTORY_VERSION = 1
+HISTORY_HEADER = struct.Struct("<4sB3xIIIII")  # 매직, 버전, 기록 수, URL 해시 수, 블룸 필터 바이트 수, 압축 메타 바이트 수, 다음 순번
+HISTORY_ROW = struct.Struct("<QHHI")  # URL 해시, 마감일, 처음 본 날 (2000-01-01부터 일수, 0=없음), 순번 (텍스트 내보내기 순서)
+HISTORY_TAIL = struct.Struct("<QQHHIH")  # 덧붙인 기록: 제목 해시, URL 해시, 마감일, 처음 본 날, 순번, 메타 바이트 수
+# 유사 제목 비교용 LSH 버킷 캐시 (기록 파일 옆 .lsh, 커밋하지 않고 Actions 캐시로 유지).
+# 머리글 | 제목 해시(u64) n개 | 기록마다 버킷 id(u32) MINHASH_BANDS개. 없거나 모자라면 빠진 기록만 다시 계산
+HISTORY_LSH_MAGIC = b"HKLB"
+HISTORY_LSH_HEADER = struct.Struct("<4sBBxxI")  # 매직, 버전, 밴드 수, 기록 수
+HISTORY_EPOCH = datetime(2000, 1, 1)
+# 덧붙인 기록이 정렬된 본문의 이 비율을 넘으면 prune 때 다시 정렬해 씀
+HISTORY_COMPACT_RATIO = 0.25
+BLOOM_BITS_PER_KEY = 10  # 키당 10비트, 해시 7개면 거짓 양성 약 1%
+BLOOM_HASHES = 7
+
+
+def hash64(text):
+    """문자열의 64비트 해시. 빈 문자열은 0(없음)입니다."""
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little') if text else 0
+
+
+def lsh_buckets(key):
+    """정규화 제목의 MinHash 밴드를 LSH 캐시에 넣을 32비트 버킷 id로 줄입니다 (겹쳐도 후보가 늘 뿐 유사도로 다시 확인)."""
+    return [(band ^ (band >> 32) * 0x9E3779B1) & 0xFFFFFFFF for band in minhash_bands(shingles(key))]
+
+
+def day_number(iso_date):
+    """YYYY-MM-DD를 2000-01-01부터의 일수(1부터)로 바꿉니다. 없거나 해석할 수 없으면 0."""
+    try:
+        return (datetime.strptime(iso_date[:10], '%Y-%m-%d') - HISTORY_EPOCH).days + 1 if iso_date else 0
+    except ValueError:
+        return 0
+
+
+def day_iso(number):
+    return (HISTORY_EPOCH + timedelta(days=number - 1)).strftime('%Y-%m-%d') if number else None
+
+
+class BloomFilter:
+    """64비트 해시용 블룸 필터입니다. 해시를 두 32비트로 나눠 이중 해싱으로 BLOOM_HASHES개 위치를 만듭니다."""
+
+    def __init__(self, bits):
+        self.bits = bytearray(bits)
+        self.size = len(self.bits) * 8
+
+    @classmethod
+    def for_keys(cls, count):
+        return cls(max(8, (count * BLOOM_BITS_PER_KEY + 7) // 8))
+
+    def _positions(self, h):
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) % self.size for i in range(BLOOM_HASHES)]
+
+    def add(self, h):
+        for p in self._positions(h):
+            self.bits[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, h):
+        return all(self.bits[p >> 3] >> (p & 7) & 1 for p in self._positions(h))
+
+
+def _native(values):
+    """파일의 리틀 엔디언 u64 배열을 현재 기계 순서로 (빅 엔디언이면 바이트를 뒤집음)."""
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+class CompactDedupStore:
+    """sent_hackathons.bin 바이너리 기록 저장소입니다. 정렬된 제목/URL 64비트 해시 배열과 블룸 필터로 조회하고,
+    출처와 제목은 zlib으로 묶어 두었다가 유사 제목 비교, 정리, 텍스트 내보내기에 필요할 때만 풉니다.
+    새 기록은 파일 끝에 덧붙이고(append), prune이 만료 기록을 빼거나 덧붙인 기록이 쌓이면 정렬해 다시 씁니다.
+    처음 열 때 sent_hackathons.txt의 줄을 순서 그대로 옮기고(SQLite 기록이 있으면 URL/마감일도), 그대로 다시 내보낼 수 있습니다.
+    """
+
+    def __init__(self, path=HISTORY_FILE, legacy_db=DEDUP_DB_FILE, legacy_path=DB_FILE, threshold=NEAR_DUP_THRESHOLD):
+        self.path = path
+        self.lsh_path = os.path.splitext(path)[0] + ".lsh"
+        self.threshold = threshold
+        self.lock = threading.Lock()
+        self._lsh, self._lsh_dirty = None, False  # 제목 해시 → 버킷 id들 (다시 쓴 뒤에도 유지)
+        if not os.path.exists(path):
+            records = self._legacy_records(legacy_db, legacy_path)
+            self._write(records)
+            if records:
+                print(f"🗃️ 기존 기록 {len(records)}개를 {path}로 옮겼습니다.")
+        self._load()
+
+    # 파일 읽기/쓰기: 기록 하나는 (제목 해시, URL 해시, 마감일, 처음 본 날, 순번, 출처, 제목)
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            data = f.read()
+        magic, version, count, url_count, bloom_len, meta_len, next_seq = HISTORY_HEADER.unpack_from(data)
+        if magic != HISTORY_MAGIC or version != HISTORY_VERSION:
+            raise ValueError(f"{self.path}: 알 수 없는 기록 파일 형식")
+        off = HISTORY_HEADER.size
+        self.bloom = BloomFilter(data[off:off + bloom_len])
+        off += bloom_len
+        self.keys, self.urls = array('Q'), array('Q')
+        for values, n in ((self.keys, count), (self.urls, url_count)):
+            values.frombytes(data[off:off + 8 * n])
+            _native(values)
+            off += 8 * n
+        self.count, self.meta = count, data[off:off + meta_len]
+        off += meta_len
+        self.tail = []
+        seq = next_seq
+        while off < len(data):
+            record = self._tail_record(data, off, seq)
+            if record is None:
+                # 쓰다 끊긴 기록 뒤에 덧붙이면 이후 기록을 읽을 수 없으므로 마지막 온전한 기록까지 잘라냄
+                print(f"⚠️ {self.path}: 끊긴 기록을 발견해 {len(data) - off}바이트를 잘라냅니다.")
+                with open(self.path, "r+b") as f:
+                    f.truncate(off)
+                break
+            self.tail.append(record)
+            off += HISTORY_TAIL.size + HISTORY_TAIL.unpack_from(data, off)[-1]
+            seq += 1
+        self.tail_keys = {r[0] for r in self.tail}
+        self.tail_urls = {r[1] for r in self.tail if r[1]}
+        self.next_seq = seq
+        self._records_cache, self._buckets, self._near_keys = None, None, {}
+
+    @staticmethod
+    def _tail_record(data, off, seq):
+        """off의 덧붙인 기록을 풀어 돌려줍니다. 순번이 이어지지 않거나, 잘렸거나, 메타가 깨졌으면 None."""
+        if off + HISTORY_TAIL.size > len(data):
+            return None
+        *fields, meta_size = HISTORY_TAIL.unpack_from(data, off)
+        meta = data[off + HISTORY_TAIL.size:off + HISTORY_TAIL.size + meta_size]
+        if fields[4] != seq or len(meta) < meta_size or b'\n' in meta:
+            return None
+        try:
+            source, title = meta.decode('utf-8').split('\t', 1)
+        except ValueError:  # UnicodeDecodeError 포함
+            return None
+        return (*fields, source, title)
+
+    def _records(self):
+        """모든 기록을 (제목 해시, URL 해시, 마감일, 처음 본 날, 순번, 출처, 제목) 목록으로 풉니다."""
+        return self._base_records() + self.tail
+
+    def _base_records(self):
+        """정렬된 본문의 기록만 풉니다 (덧붙인 기록 제외)."""
+        if self._records_cache is None:
+            blob = zlib.decompress(self.meta) if self.count else b""
+            size = HISTORY_ROW.size * self.count
+            rows = HISTORY_ROW.iter_unpack(blob[:size])
+            lines = blob[size:].decode('utf-8').split('\n')
+            self._records_cache = [(key, *row, *line.split('\t', 1)) for key, row, line in zip(self.keys, rows, lines)]
+        return self._records_cache
+
+    def _write(self, records):
+        """기록을 제목 해시 순으로 정렬해 새 파일로 쓰고 교체합니다 (덧붙인 기록 없음)."""
+        records = sorted(records, key=lambda r: (r[0], r[4]))
+        bloom = BloomFilter.for_keys(len(records) + sum(1 for r in records if r[1]))
+        for r in records:
+            bloom.add(r[0])
+            if r[1]:
+                bloom.add(r[1])
+        keys = _native(array('Q', [r[0] for r in records]))
+        urls = _native(array('Q', sorted(r[1] for r in records if r[1])))
+        meta = zlib.compress(b"".join(HISTORY_ROW.pack(*r[1:5]) for r in records)
+                             + "\n".join(f"{r[5]}\t{r[6]}" for r in records).encode('utf-8'), 9)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(HISTORY_HEADER.pack(HISTORY_MAGIC, HISTORY_VERSION, len(records), len(urls), len(bloom.bits), len(meta),
+                                        max((r[4] + 1 for r in records), default=0)))
+            f.write(bloom.bits)
+            f.write(keys.tobytes())
+            f.write(urls.tobytes())
+            f.write(meta)
+        os.replace(tmp, self.path)
+
+    def _legacy_records(self, legacy_db, legacy_path):
+        """텍스트 기록은 줄 그대로(중복 줄 포함) 순서대로, SQLite 기록은 텍스트에 없는 키만 덧붙입니다."""
+        meta = {}
+        if os.path.exists(legacy_db):
+            conn = sqlite3.connect(legacy_db)
+            try:
+                for title, source, url, deadline, first_seen in conn.execute(
+                        "SELECT title, source, url, deadline, first_seen FROM sent ORDER BY first_seen"):
+                    meta.setdefault(normalize_key(title, url), (title, source, url, deadline, first_seen))
+            except sqlite3.DatabaseError:
+                pass
+            finally:
+                conn.close()
+        today = datetime.now().strftime('%Y-%m-%d')
+        rows = []
+        if os.path.exists(legacy_path):
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    title = line.rstrip('\n')
+                    if title.strip():
+                        _, source, url, deadline, first_seen = meta.get(normalize_key(title), (None, "legacy", None, None, today))
+                        rows.append((title, source, url, deadline, first_seen))
+        in_text = {normalize_key(r[0]) for r in rows}
+        rows += [m for k, m in meta.items() if k not in in_text]
+        return [(hash64(normalize_key(t, u)), hash64(canonical_url(u)), day_number(d), day_number(f), seq,
+                 (s or "").replace('\t', ' '), t)
+                for seq, (t, s, u, d, f) in enumerate(rows)]
+
+    # 조회
+
+    def _has(self, h, values, tail):
+        """덧붙인 기록을 먼저 보고, 블룸 필터가 없다고 하면 끝, 있다고 하면 정렬 배열을 이분 탐색합니다."""
+        if h in tail:
+            return True
+        if h not in self.bloom:
+            return False
+        i = bisect_left(values, h)
+        return i < len(values) and values[i] == h
+
+    def near_index(self):
+        """버킷 id → 기록 번호 목록. 정확히 같은 키/URL이 없을 때 처음 필요해지면 LSH 캐시 파일의 버킷으로 만들고,
+        캐시에 없는 기록만 MinHash를 계산합니다 (캐시는 close 때 저장).
+        """
+        if self._buckets is None:
+            if self._lsh is None:
+                self._lsh = self._read_lsh()
+            self._buckets = {}
+            for i, r in enumerate(self._records()):
+                self._index_buckets(i, r)
+        return self._buckets
+
+    def _index_buckets(self, i, record):
+        ids = self._lsh.get(record[0])
+        if ids is None:
+            ids = self._lsh[record[0]] = tuple(lsh_buckets(normalize_key(record[6])))
+            self._lsh_dirty = True
+        for bucket in ids:
+            self._buckets.setdefault(bucket, []).append(i)
+
+    def _read_lsh(self):
+        """LSH 캐시를 {제목 해시: 버킷 id들}로 읽습니다. 없거나 형식이 다르면 빈 캐시."""
+        try:
+            with open(self.lsh_path, "rb") as f:
+                data = f.read()
+            magic, version, bands, n = HISTORY_LSH_HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return {}
+        off = HISTORY_LSH_HEADER.size
+        if magic != HISTORY_LSH_MAGIC or version != 1 or bands != MINHASH_BANDS or len(data) != off + n * (8 + 4 * bands):
+            return {}
+        keys, ids = array('Q'), array('I')
+        keys.frombytes(data[off:off + 8 * n])
+        ids.frombytes(data[off + 8 * n:])
+        _native(keys)
+        _native(ids)
+        return {key: tuple(ids[j * bands:(j + 1) * bands]) for j, key in enumerate(keys)}
+
+    def _write_lsh(self):
+        """지금 기록에 있는 제목의 버킷만 LSH 캐시에 씁니다 (정리된 기록의 버킷은 버림)."""
+        live = {r[0] for r in self._records()}
+        keys = sorted(k for k in self._lsh if k in live)
+        ids = array('I', [bucket for k in keys for bucket in self._lsh[k]])
+        tmp = f"{self.lsh_path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(HISTORY_LSH_HEADER.pack(HISTORY_LSH_MAGIC, 1, MINHASH_BANDS, len(keys)))
+            f.write(_native(array('Q', keys)).tobytes())
+            f.write(_native(ids).tobytes())
+        os.replace(tmp, self.lsh_path)
+        self._lsh_dirty = False
+
+    def near_candidates(self, buckets):
+        """LSH 버킷이 하나라도 겹치는 기록들의 (정규화 제목, 기록). 메타데이터는 버킷 인덱스를 만들 때 처음 풉니다."""
+        index, found = self.near_index(), set()
+        for bucket in buckets:
+            found.update(index.get(bucket, ()))
+        base, candidates = self._base_records(), []
+        for i in found:
+            r = base[i] if i < self.count else self.tail[i - self.count]
+            if i not in self._near_keys:
+                self._near_keys[i] = normalize_key(r[6])
+            candidates.append((self._near_keys[i], r))
+        return candidates
+
+    def __contains__(self, title):
+        with self.lock:
+            return self._has(hash64(normalize_key(title)), self.keys, self.tail_keys)
+
+    def seen(self, item):
+        """정규화 제목, 정규 URL, 유사 제목 중 하나라도 기록에 있으면 True."""
+        key, url_hash = normalize_key(item['title'], item.get('url')), hash64(canonical_url(item.get('url')))
+        with self.lock:
+            if self._has(hash64(key), self.keys, self.tail_keys):
+                return True
+            if url_hash and self._has(url_hash, self.urls, self.tail_urls):
+                return True
+            source, near = item_source(item), {}
+            for cand, r in self.near_candidates(lsh_buckets(key)):
+                near.setdefault(cand, []).append((r[5], r[1]))
+            return best_match(key, shingles(key), near, self.threshold, lambda cand: any(
+                s == source or (url_hash and u == url_hash) for s, u in near[cand])) is not None
+
+    # 쓰기/정리
+
+    def add_many(self, items):
+        """이미 같은 키가 있는 항목은 건너뛰고 나머지를 파일 끝에 덧붙입니다."""
+        today = day_number(datetime.now().strftime('%Y-%m-%d'))
+        with self.lock, open(self.path, "ab") as f:
+            for i in items:
+                key = normalize_key(i['title'], i.get('url'))
+                key_hash = hash64(key)
+                if self._has(key_hash, self.keys, self.tail_keys):
+                    continue
+                url_hash = hash64(canonical_url(i.get('url')))
+                deadline = day_number(i['end'] if 'end' in i else extract_deadline(i.get('date')))
+                source = item_source(i)
+                title = i['title'].replace('\n', ' ')
+                meta = f"{source}\t{title}".encode('utf-8')
+                f.write(HISTORY_TAIL.pack(key_hash, url_hash, deadline, today, self.next_seq, len(meta)) + meta)
+                self.tail.append((key_hash, url_hash, deadline, today, self.next_seq, source, title))
+                if self._buckets is not None:
+                    self._index_buckets(self.count + len(self.tail) - 1, self.tail[-1])
+                self.tail_keys.add(key_hash)
+                if url_hash:
+                    self.tail_urls.add(url_hash)
+                self.next_seq += 1
+
+    def prune(self, ttl_days=DEDUP_TTL_DAYS, keep_sources=()):
+        """마감일로부터 ttl_days가 지난 기록(keep_sources 제외)을 지우고 삭제 건수를 돌려줍니다.
+        지울 것이 없고 덧붙인 기록도 많지 않으면 파일을 다시 쓰지 않습니다.
+        """
+        cutoff = day_number((datetime.now() - timedelta(days=ttl_days)).strftime('%Y-%m-%d'))
+        keep = set(keep_sources)
+        with self.lock:
+            expiring = any(0 < r[2] < cutoff and r[5] not in keep for r in self._records())
+        if not expiring and len(self.tail) <= HISTORY_COMPACT_RATIO * max(self.count, 64):
+            return 0
+        return self.compact(ttl_days, keep_sources)
+
+    def compact(self, ttl_days=DEDUP_TTL_DAYS, keep_sources=()):
+        """만료 기록을 빼고 덧붙인 기록까지 정렬해 파일을 다시 씁니다. 삭제 건수를 돌려줍니다."""
+        cutoff = day_number((datetime.now() - timedelta(days=ttl_days)).strftime('%Y-%m-%d'))
+        keep = set(keep_sources)
+        with self.lock:
+            records = self._records()
+            kept = [r for r in records if not (0 < r[2] < cutoff and r[5] not in keep)]
+            self._write(kept)
+            self._load()
+        return len(records) - len(kept)
+
+    def export_text(self, path):
+        """기록의 제목을 처음 기록한 순서대로 한 줄씩 씁니다 (sent_hackathons.txt 형식). 쓴 줄 수를 돌려줍니다."""
+        with self.lock:
+            records = sorted(self._records(), key=lambda r: r[4])
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(f"{r[6]}\n" for r in records)
+        return len(records)
+
+    def import_text(self, path):
+        """텍스트 기록에서 아직 없는 제목을 덧붙이고 추가한 개수를 돌려줍니다."""
+        with open(path, "r", encoding="utf-8") as f:
+            titles = [line.strip() for line in f if line.strip()]
+        before = len(self.tail)
+        self.add_many([{"title": t, "source": "legacy", "end": None} for t in titles])
+        return len(self.tail) - before
+
+    def close(self):
+        with self.lock:
+            if self._lsh_dirty:
+                self._write_lsh()
+
+
+class BatchDeduper:
+    """한 실행 안에서 이미 통과한 항목과 같은 공고(정규 URL, 정규화 제목, 유사 제목)를 걸러냅니다.
+    소스가 끝날 때마다 이어서 쓸 수 있도록 본 URL과 제목 인덱스를 유지합니다.
+    """
+
+    def __init__(self):
+        self.seen_urls, self.index, self.sources = set(), NearDuplicateIndex(), {}
+
+    def admit(self, items):
+        admitted = []
+        for item in items:
+            url_key, key = canonical_url(item.get('url')), normalize_key(item['title'], item.get('url'))
+            source = item_source(item)
+            if (url_key and url_key in self.seen_urls) or self.index.query(key, lambda cand: source in self.sources[cand]) is not None:
+                continue
+            if url_key:
+                self.seen_urls.add(url_key)
+            self.index.add(key)
+            self.sources.setdefault(key, set()).add(source)
+            admitted.append(item)
+        return admitted
+
+
+DEDUP_BACKENDS = {
+    "text": TextDedupStore,
+    "sqlite": SqliteDedupStore,
+    "compact": CompactDedupStore,
+}
+
+
+def open_dedup_store(backend=DEDUP_BACKEND):
+    if backend not in DEDUP_BACKENDS:
+        raise ValueError(f"알 수 없는 중복 방지 저장소: {backend} (가능: {', '.join(DEDUP_BACKENDS)})")
+    return DEDUP_BACKENDS[backend]()
+
+
+# ─────────────────────────────────────────────────────
+# 디스코드 메시지 구성 섹션
+# ─────────────────────────────────────────────────────
+
+DISCORD_MAX_EMBEDS = 10
+DISCORD_MAX_CHARS = 6000
+DISCORD_MAX_RETRIES = int(os.environ.get('BOT_DISCORD_MAX_RETRIES', '5'))
+# 전송 대기 항목 수 한도. 디스코드 전송이 밀려 가득 차면 수집 결과 처리가 기다림
+DELIVERY_QUEUE_SIZE = int(os.environ.get('BOT_DELIVERY_QUEUE_SIZE', '50'))
+# 다른 웹훅에는 전달됐지만 일부 웹훅에만 못 보낸 항목 {웹훅 해시: [항목]} (Actions에서 커밋됨).
+# 다음 실행에서 그 웹훅에만 다시 보냄. 웹훅 주소는 비밀이므로 해시로만 남김
+PENDING_DELIVERY_FILE = "pending_deliveries.json"
+NEW_ITEMS_HEADER = "🚀 **새로운 소식이 도착했습니다!**"
+# 범주별 임베드 표시 (이름, 색상). 범주가 없으면 기존 색상
+CATEGORY_STYLE = {
+    "hackathon": ("해커톤", 0xF1C40F),
+    "contest": ("공모전", 0xE67E22),
+    "bootcamp": ("부트캠프/교육", 0x2ECC71),
+}
+DEFAULT_EMBED_COLOR = 5814783
+
+
+def build_embed(item):
+    """항목 하나를 디스코드 임베드로 만듭니다. 필드 길이 한도(제목 256, 값 1024)에 맞춰 자르고 범주별로 색을 입힙니다.
+    이미 알린 공고의 변경(changes)은 변경 내용만 담은 짧은 임베드로 만듭니다.
+    """
+    label, color = CATEGORY_STYLE.get(item.get('category'), (None, DEFAULT_EMBED_COLOR))
+    if item.get('changes'):
+        return {"title": f"🔄 {item['title']}"[:256], "url": item['url'], "color": color,
+                "fields": [{"name": "변경", "value": item['changes'][:1024], "inline": True},
+                           {"name": "마감/일정", "value": str(item['date'])[:1024] or "-", "inline": True}]}
+    fields = [{"name": "플랫폼", "value": str(item['host'])[:1024] or "-", "inline": True},
+              {"name": "마감/일정", "value": str(item['date'])[:1024] or "-", "inline": True}]
+    if label:
+        fields.append({"name": "분류", "value": label, "inline": True})
+    place = " · ".join(v for v in (item.get('mode'), item.get('location')) if v)
+    if place:
+        fields.append({"name": "장소", "value": place[:1024], "inline": True})
+    return {"title": f"✨ {item['title']}"[:256], "url": item['url'], "color": color, "fields": fields}
+
+
+def embed_chars(embed):
+    """디스코드가 메시지당 6000자 한도에 세는 글자 수입니다."""
+    return len(embed.get("title", "")) + sum(len(f["name"]) + len(f["value"]) for f in embed.get("fields", []))
+
+
+def webhook_key(url):
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+
+
+def pack_messages(items, header=NEW_ITEMS_HEADER):
+    """임베드 개수와 글자 수 한도를 넘지 않게 항목을 메시지로 묶어 [(항목 번호들, payload)]를 돌려줍니다.
+    header는 첫 메시지 본문에만 붙습니다.
+    """
+    messages, indices, embeds, chars = [], [], [], 0
+    for i, item in enumerate(items):
+        embed = build_embed(item)
+        size = embed_chars(embed)
+        if embeds and (len(embeds) >= DISCORD_MAX_EMBEDS or chars + size > DISCORD_MAX_CHARS):
+            messages.append((indices, {"content": "", "embeds": embeds}))
+            indices, embeds, chars = [], [], 0
+        indices.append(i)
+        embeds.append(embed)
+        chars += size
+    if embeds:
+        messages.append((indices, {"content": "", "embeds": embeds}))
+    if messages and header:
+        messages[0][1]["content"] = header
+    return messages
+
+
 LINKAREER_GRAPHQL_URL = "https://api.linkareer.com/graphql"
 
 LINKAREER_QUERY = """
@@ -28,96 +1303,1026 @@ query FetchActivities($filterBy: ActivityFilter, $page: Int!, $pageSize: Int!) {
 }
 """
 
+
+# ─────────────────────────────────────────────────────
+# 소스 레지스트리 섹션
+# ─────────────────────────────────────────────────────
+
+# 소스마다 엔드포인트, 전송 방식, 해석 메서드, 키워드, 기본 수집 주기를 선언합니다.
+# parse만 지정한 소스는 fetch_endpoint가 한 번 요청해 해석하고,
+# 페이지 넘김이나 스트리밍이 필요한 소스는 fetch에 전용 수집 메서드를 지정합니다.
+SOURCES_FILE = "sources.json"
+SOURCES_ONLY = os.environ.get('BOT_SOURCES')  # 쉼표로 구분한 소스 이름 (설정 대신 이 소스만 실행)
+SOURCE_TRANSPORTS = ("json", "graphql", "html", "markdown", "rsc")
+SOURCE_DEFAULTS = {
+    "enabled": True,
+    "method": "GET",
+    "conditional": False,  # ETag/Last-Modified 조건부 요청(cached_get) 사용 여부
+    "timeout": 15,
+    "expires": True,  # 항목 날짜의 종료일이 지나면 보내지 않음 (게시일만 있는 소스는 False)
+    "interval_hours": 24,
+    "headers": {},
+    "keywords": [],  # 하나라도 걸려야 수집 (비어 있으면 모두)
+    "exclude": [],  # 하나라도 걸리면 제외
+    "category": "",  # 제목에 범주 키워드가 없을 때 쓸 범주
+    "enrich": False,  # 새 항목의 상세 페이지에서 마감일/장소를 보강 (목록에 마감일이 없는 소스)
+    "incremental": False,  # 커서 이후 새 항목만 돌려주는 소스 (전체 목록이 아니라 스냅샷 비교에서 빠짐)
+    "paginate": None,  # 페이지 번호형 게시판: {"param": 페이지 파라미터, "start": 첫 번호, "depth": 최대 페이지 수}
+}
+SOURCES = {
+    "Devpost": {
+        "transport": "json",
+        "url": "https://devpost.com/api/hackathons",
+        "params": {"status[]": "upcoming", "sort_by": "Recently Added"},
+        "headers": {"Accept": "application/json", "Referer": "https://devpost.com/hackathons", "X-Requested-With": "XMLHttpRequest"},
+        "parse": "_parse_devpost",
+        "paginate": {"param": "page"},
+        "category": "hackathon",
+    },
+    "MLH": {
+        "transport": "html",
+        "url": "https://mlh.io/seasons/2026/events",
+        "conditional": True,
+        "parse": "_parse_mlh",
+        "category": "hackathon",
+    },
+    "DevEvent": {
+        # README.md에 현재 진행 중/예정 행사 목록이 있음 (end_event/는 종료된 행사)
+        "transport": "markdown",
+        "url": "https://raw.githubusercontent.com/brave-people/Dev-Event/master/README.md",
+        "conditional": True,
+        "parse": "_parse_devevent",
+        "enrich": True,
+        "keywords": ['해커톤', 'hackathon', '공모전', '경진대회', '부트캠프', 'bootcamp', '교육', 'kdt', '양성'],
+    },
+    "CampusPick": {
+        "transport": "json",
+        "method": "POST",
+        "url": "https://api2.campuspick.com/find/activity/list",
+        "headers": {"Content-Type": "application/x-www-form-urlencoded", "Origin": "https://www2.campuspick.com", "Referer": "https://www2.campuspick.com/"},
+        "fetch": "fetch_campuspick",
+        "incremental": True,
+        # 108: 공모전, 111: 교육/강연 → (제목 접두어, 범주)
+        "categories": {"108": ["🇰🇷 [캠퍼스픽]", "contest"], "111": ["🎓 [부트캠프/교육]", "bootcamp"]},
+    },
+    "링커리어 해커톤": {
+        "transport": "graphql",
+        "method": "POST",
+        "url": LINKAREER_GRAPHQL_URL,
+        "headers": {"Content-Type": "application/json", "Origin": "https://linkareer.com", "Referer": "https://linkareer.com/"},
+        "fetch": "fetch_linkareer",
+        "incremental": True,
+        "filter_by": {"q": "해커톤", "status": "OPEN"},
+        "label": "해커톤",
+        "category": "hackathon",
+        "enrich": True,
+        "enabled": False,
+    },
+    "링커리어 부트캠프": {
+        "transport": "graphql",
+        "method": "POST",
+        "url": LINKAREER_GRAPHQL_URL,
+        "headers": {"Content-Type": "application/json", "Origin": "https://linkareer.com", "Referer": "https://linkareer.com/"},
+        "fetch": "fetch_linkareer",
+        "incremental": True,
+        "filter_by": {"activityTypeID": 6, "status": "OPEN"},  # 교육 타입
+        "label": "부트캠프",
+        "category": "bootcamp",
+        "enrich": True,
+        "enabled": False,
+    },
+    "SSAFY": {
+        "transport": "html",
+        "url": "https://www.ssafy.com/ksp/servlet/swp.board.controller.SwpBoardServlet",
+        "params": {"p_process": "select-board-list", "p_tabseq": "226504", "p_pageno": "1"},
+        "headers": {"X-Requested-With": "XMLHttpRequest", "Accept": "application/json, text/javascript, */*; q=0.01", "Accept-Language": "ko-KR,ko;q=0.9"},
+        "parse": "_parse_ssafy",
+        "paginate": {"param": "p_pageno"},
+        "category": "bootcamp",
+        "expires": False,
+        "enrich": True,
+        "keywords": ['모집', '공고', '기수'],
+    },
+    "우아한테크코스": {
+        "transport": "html",
+        "url": "https://woowacourse.io/notice",
+        "parse": "_parse_woowacourse",
+        "category": "bootcamp",
+        "expires": False,
+        "keywords": ['모집', '지원', '과정', '기수', '선발'],
+    },
+    "부스트캠프": {
+        "transport": "html",
+        "pages": [
+            ["https://boostcamp.connect.or.kr/guide_ai.html", "AI Tech"],
+            ["https://boostcamp.connect.or.kr/main_wm.html", "Web·Mobile"],
+        ],
+        "conditional": True,
+        "fetch": "fetch_boostcamp",
+        "category": "bootcamp",
+        "expires": False,
+        # 모집 중일 때만 페이지에 나오는 문구
+        "keywords": ['모집 중', '지원 기간', '모집 기간', '접수 기간', '모집합니다', '지원하기', '원서접수'],
+        "interval_hours": 72,
+    },
+    "KT Cloud TechUp": {
+        "transport": "html",
+        "url": "https://ktcloud-techup.com/",
+        "conditional": True,
+        "parse": "_parse_kt_techup",
+        "category": "bootcamp",
+        "interval_hours": 72,
+    },
+    "KT 에이블스쿨": {
+        # 공지 JSON API가 막혀 있어 주요소식(MC00000058) HTML 페이지를 파싱
+        # GitHub Actions(AWS IP)에서 403이 발생할 수 있음 - 브라우저 헤더로 우회 시도
+        "transport": "html",
+        "url": "https://aivle.kt.co.kr/home/main/goMenuPage",
+        "params": {"mcd": "MC00000058"},
+        "headers": {
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+            "Referer": "https://aivle.kt.co.kr/",
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "same-origin",
+            "Sec-Fetch-User": "?1",
+            "Upgrade-Insecure-Requests": "1",
+        },
+        "parse": "_parse_kt_aivle",
+        # 전자정부 프레임워크 게시판의 페이지 파라미터. 서버가 무시하면 2페이지가 1페이지와 같아
+        # 새 항목이 없으므로 fetch_pages가 거기서 멈춤 (첫 페이지가 모두 새 공고일 때만 뒤 페이지 요청을 더 씀,
+        # 다르면 sources.json에서 바꿈)
+        "paginate": {"param": "pageIndex"},
+        "category": "bootcamp",
+        "expires": False,
+        "enrich": True,
+        "keywords": ['모집', '공고', '기수', '과정', '선발'],
+        "blocked_message": "서버에서 접근 차단됨 (IP 제한 추정), 건너뜁니다.",
+    },
+    "부트텐트": {
+        "transport": "rsc",
+        "url": "https://boottent.com/camps",
+        "fetch": "fetch_boottent",
+        "category": "bootcamp",
+        "categories": ["data", "ai"],
+    },
+}
+
+
+def registered_sources(path=SOURCES_FILE):
+    """SOURCES에 sources.json의 소스별 설정을 덮어쓴 전체 소스를 선언 순서대로 돌려줍니다.
+    sources.json에는 {"이름": {"enabled": false, ...}}처럼 바꿀 필드만 쓰고,
+    새 소스도 기존 parse/fetch 메서드를 지정하면 추가할 수 있습니다.
+    """
+    overrides = load_json_state(path, {})
+    sources = {}
+    for name in list(SOURCES) + [n for n in overrides if n not in SOURCES]:
+        spec = {**SOURCE_DEFAULTS, **SOURCES.get(name, {}), **overrides.get(name, {})}
+        if not (spec.get("parse") or spec.get("fetch")) or spec.get("transport") not in SOURCE_TRANSPORTS:
+            print(f"⚠️ 소스 설정이 올바르지 않아 건너뜁니다: {name}")
+            continue
+        sources[name] = dict(spec, name=name)
+    return sources
+
+
+def load_sources(only=None, path=SOURCES_FILE):
+    """실행할 소스를 고릅니다. only(쉼표로 구분한 이름)를 주면 enabled와 관계없이 그 소스만 고릅니다."""
+    sources = registered_sources(path)
+    if not only:
+        return {n: spec for n, spec in sources.items() if spec["enabled"]}
+    wanted = [n.strip() for n in only.split(",") if n.strip()]
+    for n in wanted:
+        if n not in sources:
+            print(f"⚠️ 알 수 없는 소스: {n}")
+    return {n: spec for n, spec in sources.items() if n in wanted}
+
+
+# ─────────────────────────────────────────────────────
+# 제목 분류 섹션
+# ─────────────────────────────────────────────────────
+
+# 범주 키워드 (소문자). 여러 범주가 걸리면 CATEGORY_ORDER 앞쪽이 이김
+CATEGORY_KEYWORDS = {
+    "hackathon": ['해커톤', 'hackathon', '아이디어톤', 'ideathon', 'makeathon'],
+    "contest": ['공모전', '경진대회', '대회', 'contest', 'competition', 'challenge', '챌린지'],
+    "bootcamp": ['부트캠프', 'bootcamp', '교육', 'kdt', '양성', '아카데미', 'academy', '교육생', '훈련생'],
+}
+CATEGORY_ORDER = ("hackathon", "contest", "bootcamp")
+
+
+class KeywordMatcher:
+    """{태그: [키워드]} 여러 집합을 한 번에 찾는 매처입니다. 텍스트를 한 번 훑어 걸린 태그 집합을 돌려줍니다.
+    pyahocorasick이 있으면 Aho-Corasick 오토마톤을, 없으면 모든 키워드를 합친 정규식 하나를 씁니다.
+    """
+
+    def __init__(self, groups, automaton=True):
+        tags = {}
+        for tag, keywords in groups.items():
+            for kw in keywords:
+                if kw:
+                    tags.setdefault(kw.lower(), set()).add(tag)
+        # 정규식은 겹치는 매치를 건너뛰므로 긴 키워드에 그 안에 든 짧은 키워드의 태그도 붙여 둠
+        self.tags = {kw: frozenset().union(*(t for other, t in tags.items() if other in kw)) for kw in tags}
+        try:
+            import ahocorasick
+        except ImportError:
+            ahocorasick = None
+        if not automaton:
+            ahocorasick = None  # 정규식 경로 강제 (벤치마크 비교용)
+        if ahocorasick is not None and self.tags:
+            self.automaton = ahocorasick.Automaton()
+            for kw, kw_tags in self.tags.items():
+                self.automaton.add_word(kw, kw_tags)
+            self.automaton.make_automaton()
+            self.regex = None
+        else:
+            self.automaton = None
+            alternation = "|".join(map(re.escape, sorted(self.tags, key=len, reverse=True)))
+            self.regex = re.compile(alternation or r"(?!)")
+
+    def scan(self, text):
+        text = str(text or '').lower()
+        if self.automaton is not None:
+            return frozenset().union(*(t for _, t in self.automaton.iter(text)))
+        return frozenset().union(*(self.tags[m] for m in self.regex.findall(text)))
+
+
+class TitleClassifier:
+    """범주 키워드와 소스별 포함(keywords)/제외(exclude) 키워드를 매처 하나로 묶습니다."""
+
+    def __init__(self, sources):
+        groups = {f"cat:{cat}": kws for cat, kws in CATEGORY_KEYWORDS.items()}
+        for name, spec in sources.items():
+            groups[f"in:{name}"] = spec["keywords"]
+            groups[f"out:{name}"] = spec.get("exclude", [])
+        self.matcher = KeywordMatcher(groups)
+
+    def classify(self, text, spec):
+        """text를 한 번 훑어 spec의 포함/제외 조건을 통과하면 범주(없으면 spec의 category, 그것도 없으면 "")를,
+        걸러지면 None을 돌려줍니다.
+        """
+        tags = self.matcher.scan(text)
+        name = spec["name"]
+        if (spec["keywords"] and f"in:{name}" not in tags) or f"out:{name}" in tags:
+            return None
+        return next((cat for cat in CATEGORY_ORDER if f"cat:{cat}" in tags), spec.get("category") or "")
+
+
+# ─────────────────────────────────────────────────────
+# 구독 라우팅 섹션
+# ─────────────────────────────────────────────────────
+
+# 채널(웹훅)별 구독 규칙. {"이름": {"webhook": "$환경변수" 또는 주소, "categories": [...], ...}}
+# 비어 있는 조건은 "전부"를 뜻하며, DISCORD_WEBHOOK_URL은 모든 항목을 받는 "전체" 구독이 됨
+SUBSCRIPTIONS_FILE = "subscriptions.json"
+# 웹훅 주소가 비밀값이라 Actions secret에 구독 설정 JSON을 통째로 넣을 때는 파일 대신 이 환경 변수를 읽음
+SUBSCRIPTIONS_JSON = os.environ.get('BOT_SUBSCRIPTIONS')
+SUBSCRIPTION_DEFAULTS = {
+    "enabled": True,
+    "webhook": [],
+    "categories": [],  # CATEGORY_STYLE 키 ("" = 미분류)
+    "sources": [],     # 소스 이름
+    "keywords": [],    # 제목/주최에 하나라도 들어 있어야 함 (대소문자 무시)
+    "exclude": [],     # 하나라도 들어 있으면 제외
+}
+# 동시에 보내는 웹훅 수. 웹훅마다 rate limit 버킷이 따로라 웹훅 단위로 병렬, 웹훅 안에서는 순서대로 보냄
+FANOUT_WORKERS = int(os.environ.get('BOT_FANOUT_WORKERS', '8'))
+
+
+def resolve_webhooks(value):
+    """구독의 webhook 값(문자열 또는 목록)을 주소 목록으로 바꿉니다. "$이름"은 환경 변수에서 읽습니다."""
+    urls = []
+    for v in [value] if isinstance(value, str) else value or []:
+        if v.startswith("$"):
+            v = os.environ.get(v[1:], "")
+        urls += [u for u in re.split(r'[\s,]+', v) if u]
+    return urls
+
+
+def load_subscriptions(path=SUBSCRIPTIONS_FILE, raw=None):
+    """DISCORD_WEBHOOK_URL의 "전체" 구독에 subscriptions.json(또는 BOT_SUBSCRIPTIONS)의 구독을 더해 돌려줍니다.
+    "전체"도 같은 이름으로 덮어써 조건을 걸거나 끌 수 있습니다. 웹훅이 없는 구독은 건너뜁니다.
+    """
+    raw = SUBSCRIPTIONS_JSON if raw is None else raw
+    config = {}
+    if raw:
+        try:
+            config = json.loads(raw)
+        except ValueError as e:
+            print(f"⚠️ BOT_SUBSCRIPTIONS 해석 실패, 구독 파일을 대신 읽습니다: {e}")
+    config = config or load_json_state(path, {})
+    base = {"전체": {"webhook": WEBHOOK_URLS or ([WEBHOOK_URL] if WEBHOOK_URL else [])}}
+    subscriptions = {}
+    for name in list(base) + [n for n in config if n not in base]:
+        spec = {**SUBSCRIPTION_DEFAULTS, **base.get(name, {}), **config.get(name, {})}
+        if not spec["enabled"]:
+            continue
+        webhooks = resolve_webhooks(spec["webhook"])
+        if not webhooks:
+            if name not in base:
+                print(f"⚠️ 웹훅이 없는 구독을 건너뜁니다: {name}")
+            continue
+        subscriptions[name] = dict(spec, name=name, webhook=webhooks)
+    return subscriptions
+
+
+class SubscriptionRouter:
+    """구독 규칙을 범주/소스/키워드 색인으로 미리 묶어 두고, 항목마다 받을 웹훅을 고릅니다.
+    구독 i는 비트 i이며, 범주와 소스는 dict 조회 한 번으로, 키워드는 모든 구독의 키워드를 합친 매처로
+    제목을 한 번 훑어 후보 비트마스크를 얻은 뒤 AND로 좁힙니다. 구독 수만큼 규칙을 하나씩 검사하지 않습니다.
+    """
+
+    def __init__(self, subscriptions):
+        self.names = list(subscriptions)
+        self.by_webhook = {}  # 웹훅 -> 그 웹훅으로 보내는 구독들의 비트마스크
+        everyone = (1 << len(self.names)) - 1
+        self.by_category, self.by_source = {}, {}
+        self.any_category = self.any_source = self.any_keyword = everyone
+        groups = {}
+        for i, name in enumerate(self.names):
+            spec, bit = subscriptions[name], 1 << i
+            for url in spec["webhook"]:
+                self.by_webhook[url] = self.by_webhook.get(url, 0) | bit
+            for field, index, wildcard in (("categories", self.by_category, "any_category"),
+                                           ("sources", self.by_source, "any_source")):
+                if spec[field]:
+                    setattr(self, wildcard, getattr(self, wildcard) & ~bit)
+                    for value in spec[field]:
+                        index[value] = index.get(value, 0) | bit
+            if spec["keywords"]:
+                self.any_keyword &= ~bit
+                groups[("in", i)] = spec["keywords"]
+            groups[("out", i)] = spec["exclude"]
+        self.matcher = KeywordMatcher(groups)
+        self._targets = {}  # 비트마스크 -> 웹훅 목록 (같은 조합이 반복되므로 캐시)
+
+    def __len__(self):
+        return len(self.names)
+
+    def match(self, item):
+        """항목을 받을 구독의 비트마스크를 돌려줍니다."""
+        hits = self.matcher.scan(f"{item.get('title', '')} {item.get('host', '')}")
+        include, exclude = self.any_keyword, 0
+        for kind, i in hits:
+            if kind == "in":
+                include |= 1 << i
+            else:
+                exclude |= 1 << i
+        return ((self.by_category.get(item.get('category') or "", 0) | self.any_category)
+                & (self.by_source.get(item.get('source'), 0) | self.any_source)
+                & include & ~exclude)
+
+    def targets(self, mask):
+        """비트마스크에 해당하는 구독들의 웹훅을 중복 없이 돌려줍니다."""
+        if mask not in self._targets:
+            if len(self._targets) > 4096:
+                self._targets.clear()  # 데몬에서 끝없이 커지지 않게
+            self._targets[mask] = [url for url, subs in self.by_webhook.items() if mask & subs]
+        return self._targets[mask]
+
+    def route(self, items):
+        """{웹훅: [항목 번호]}를 항목 순서대로 돌려줍니다. 어느 구독에도 맞지 않는 항목은 빠집니다."""
+        routes = {}
+        for i, item in enumerate(items):
+            for url in self.targets(self.match(item)):
+                routes.setdefault(url, []).append(i)
+        return routes
+
+
+# ─────────────────────────────────────────────────────
+# 상세 페이지 보강 섹션
+# ─────────────────────────────────────────────────────
+
+# 목록에 마감일이 없는 소스(enrich=True)의 새 항목만 상세 페이지를 읽어 마감일/장소/온·오프라인을 채움
+ENRICH = os.environ.get('BOT_ENRICH', '1') == '1'
+# URL별 추출 결과 (Actions에서는 커밋하지 않고 캐시로 이어 씀). TTL 안에는 같은 상세 페이지를 다시 요청하지 않음
+DETAIL_CACHE_FILE = "detail_cache.json"
+DETAIL_CACHE_TTL_DAYS = int(os.environ.get('BOT_DETAIL_CACHE_TTL_DAYS', '14'))
+# 실행당 상세 페이지 요청 수와 보강에 쓰는 시간(초) 한도. 넘치면 나머지는 목록 정보만으로 보냄
+ENRICH_MAX_REQUESTS = int(os.environ.get('BOT_ENRICH_MAX_REQUESTS', '40'))
+ENRICH_BUDGET = float(os.environ.get('BOT_ENRICH_BUDGET', '30'))
+ENRICH_PER_HOST = int(os.environ.get('BOT_ENRICH_PER_HOST', '2'))  # 호스트별 동시 요청 수
+ENRICH_TIMEOUT = 10
+DETAIL_MAX_BYTES = 1024 * 1024  # 상세 페이지는 앞부분만 읽음
+
+MARKUP_RE = re.compile(r'<(script|style|noscript)\b.*?</\1\s*>|<!--.*?-->|<[^>]+>', re.S | re.I)
+DEADLINE_LABEL_RE = re.compile(r'마감|(?:접수|모집|신청|지원|참가)\s*(?:기간|일정|마감)|deadline|apply by|registration', re.I)
+LOCATION_RE = re.compile(r'(?:교육|개최|행사)?\s*(?:장소|위치|venue|location)\s*[:：]?\s*([^\n|]{2,40})', re.I)
+BLANK_LINES_RE = re.compile(r'\s*\n\s*')
+ONLINE_RE = re.compile(r'온라인|비대면|online|zoom|virtual', re.I)
+OFFLINE_RE = re.compile(r'오프라인|대면|offline|in[- ]person', re.I)
+
+
+def extract_details(html_text, today=None):
+    """상세 페이지 HTML에서 {"end": 마감일, "location": 장소, "mode": 온라인/오프라인/온·오프라인}을 뽑습니다.
+    마감일은 '마감', '접수 기간' 같은 표시 바로 뒤(60자 안) 날짜 범위의 끝을 씁니다. 못 찾은 값은 None입니다.
+    연도 없는 날짜의 기준일(today)은 캐시된 parse_date_range에 항상 넘겨, 데몬에서 첫 호출 날짜에 묶이지 않게 합니다.
+    """
+    today = today or datetime.now().strftime('%Y-%m-%d')
+    text = BLANK_LINES_RE.sub('\n', html.unescape(MARKUP_RE.sub('\n', html_text or '')))
+    end = None
+    for m in DEADLINE_LABEL_RE.finditer(text):
+        end = parse_date_range(text[m.end():m.end() + 60], today)[1]
+        if end:
+            break
+    location = LOCATION_RE.search(text)
+    location = location.group(1).strip(' :·-') if location else None
+    online, offline = bool(ONLINE_RE.search(text)), bool(OFFLINE_RE.search(text.replace('비대면', '')))
+    mode = "온·오프라인" if online and offline else "온라인" if online else "오프라인" if offline or location else None
+    return {"end": end, "location": location or None, "mode": mode}
+
+
+def apply_details(item, details):
+    """추출 결과를 항목에 채웁니다. 목록에서 이미 얻은 마감일은 덮어쓰지 않습니다."""
+    if details.get("end") and not item.get("end"):
+        item["end"] = details["end"]
+        item["date"] = f"마감: {details['end']}"
+    for key in ("location", "mode"):
+        if details.get(key):
+            item[key] = details[key]
+    return item
+
+
+# ─────────────────────────────────────────────────────
+# 수집 주기 섹션
+# ─────────────────────────────────────────────────────
+
+# 소스별 수집 주기와 마지막 수집 결과 해시 (Actions에서 커밋됨)
+SCHEDULE_FILE = "source_schedule.json"
+# 실행마다 바뀌는 기록(마지막 수집 시각, 요청 수, 변경률 통계, 최근 24시간 요청 기록)은 커밋하지 않고 캐시로 이어 씀.
+# 캐시가 없으면 모든 소스가 한 번 기한이 된 것으로 보고 요청 예산 안에서 다시 수집함
+SCHEDULE_RUNS_FILE = "source_runs.json"
+SCHEDULE_RUN_KEYS = ("last_run", "requests", "rate", "checks", "changes")
+DUE_ONLY = os.environ.get('BOT_DUE_ONLY') == '1'
+# 바뀌면 주기를 절반으로, 그대로면 1.5배로 늘리되 이 범위(시간) 안에서만 조정
+SCHEDULE_MIN_HOURS = float(os.environ.get('BOT_SCHEDULE_MIN_HOURS', '1'))
+SCHEDULE_MAX_HOURS = float(os.environ.get('BOT_SCHEDULE_MAX_HOURS', '72'))
+SCHEDULE_SLACK_HOURS = 1 / 6  # cron 지연으로 한 시간 주기를 놓치지 않도록 10분 일찍 기한으로 봄
+CHANGE_RATE_ALPHA = 0.3
+# 데몬 모드: 기한 확인 간격(초)과 상태 파일(커서, 캐시, 수집 주기, 실행 보고서)을 쓰는 간격(초)
+DAEMON_TICK = float(os.environ.get('BOT_DAEMON_TICK', '60'))
+DAEMON_FLUSH = float(os.environ.get('BOT_DAEMON_FLUSH', '300'))
+# --due-only 실행이 최근 24시간 동안 보낼 수 있는 수집 요청 수 (소스마다 한 요청인 하루 한 번 전체 수집의 약 3배).
+# 페이지형 게시판은 앞 페이지가 모두 새 공고일 때만 더 읽으며, 그렇게 늘어난 요청도 record_requests로 예산에서 빠지고
+# 다음 plan에서는 그 소스의 지난 요청 수를 비용으로 봄
+DAILY_REQUEST_BUDGET = int(os.environ.get('BOT_DAILY_REQUEST_BUDGET', '36'))
+
+
+def items_digest(items):
+    """파싱된 항목(제목, URL)의 해시. 순서나 페이지 잡음(토큰, 광고)이 바뀌어도 같은 값이 나옵니다."""
+    lines = sorted(f"{i.get('title')}\t{i.get('url')}" for i in items)
+    return hashlib.sha1("\n".join(lines).encode("utf-8")).hexdigest()[:16]
+
+
+class SourceSchedule:
+    """소스별 수집 주기와 변경률을 기억하고, 기한이 된 소스를 요청 예산 안에서 고릅니다."""
+
+    def __init__(self, path=SCHEDULE_FILE, runs_path=SCHEDULE_RUNS_FILE):
+        self.path, self.runs_path = path, runs_path
+        state, runs = load_json_state(path, {}), load_json_state(runs_path, {})
+        self.saved = json.dumps(state.get("sources", {}), sort_keys=True)
+        self.sources = merge_state(state.get("sources", {}), runs.get("sources", {}))
+        self.request_log = runs.get("request_log", [])  # [[시각, 요청 수], ...] 최근 24시간
+        self.deferred = []
+
+    def interval(self, name, spec):
+        return self.sources.get(name, {}).get("interval_h", spec["interval_hours"])
+
+    def next_due(self, name, spec):
+        last = self.sources.get(name, {}).get("last_run")
+        if not last:
+            return None
+        return datetime.fromisoformat(last) + timedelta(hours=self.interval(name, spec))
+
+    def requests_last_day(self, now):
+        cutoff = (now - timedelta(days=1)).isoformat(timespec="seconds")
+        self.request_log = [e for e in self.request_log if e[0] >= cutoff]
+        return sum(n for _, n in self.request_log)
+
+    def plan(self, sources, now=None):
+        """기한이 된 소스 이름을 많이 밀린 순으로 고르고, 예산을 넘는 소스는 다음 실행으로 미룹니다."""
+        now = now or datetime.now()
+        slack = timedelta(hours=SCHEDULE_SLACK_HOURS)
+        overdue = {}
+        for name, spec in sources.items():
+            due = self.next_due(name, spec)
+            if due is None or due - slack <= now:
+                waited = float("inf") if due is None else (now - due).total_seconds() / 3600
+                overdue[name] = waited / self.interval(name, spec)
+        budget = DAILY_REQUEST_BUDGET - self.requests_last_day(now)
+        chosen, deferred = [], []
+        for name in sorted(overdue, key=overdue.get, reverse=True):
+            cost = self.sources.get(name, {}).get("requests") or 1
+            if cost > budget:
+                deferred.append(name)
+                continue
+            budget -= cost
+            chosen.append(name)
+        if deferred and deferred != self.deferred:
+            print(f"🗓️ 요청 예산 부족으로 다음 실행으로 미룸: {', '.join(deferred)}")
+        self.deferred = deferred
+        return [n for n in sources if n in chosen]
+
+    def observe(self, name, spec, items, metrics, now=None):
+        """수집 결과 해시를 지난번과 비교해 변경률을 갱신하고 다음 주기를 정합니다.
+        실패하거나 일부만 받은 실행은 변경 여부를 알 수 없으므로 주기를 그대로 둡니다.
+        """
+        now = now or datetime.now()
+        entry = self.sources.setdefault(name, {"interval_h": float(spec["interval_hours"]), "rate": 0.0, "checks": 0, "changes": 0})
+        entry["last_run"] = now.isoformat(timespec="seconds")
+        entry["requests"] = metrics["requests"]
+        if metrics["status"] != "ok":
+            return
+        digest = items_digest(items)
+        changed = digest != entry.get("digest")
+        if entry.get("digest") is not None:
+            entry["checks"] += 1
+            entry["changes"] += changed
+            entry["rate"] = round((1 - CHANGE_RATE_ALPHA) * entry["rate"] + CHANGE_RATE_ALPHA * changed, 3)
+            upper = max(SCHEDULE_MAX_HOURS, spec["interval_hours"])
+            interval = entry["interval_h"] / 2 if changed else entry["interval_h"] * 1.5
+            entry["interval_h"] = round(min(max(interval, SCHEDULE_MIN_HOURS), upper), 2)
+        entry["digest"] = digest
+
+    def record_requests(self, count, now=None):
+        if count:
+            self.request_log.append([(now or datetime.now()).isoformat(timespec="seconds"), count])
+
+    def save(self):
+        """실행 기록은 캐시 파일에 쓰고, 커밋되는 주기 파일은 주기나 결과 해시가 바뀌었을 때만 씁니다.
+        바뀐 것 없이 수집만 한 실행은 Actions 커밋을 만들지 않습니다.
+        """
+        kept, runs = split_state(self.sources, SCHEDULE_RUN_KEYS)
+        snapshot = json.dumps(kept, sort_keys=True)
+        if snapshot != self.saved:
+            save_json_state(self.path, {"sources": kept})
+            self.saved = snapshot
+        save_json_state(self.runs_path, {"sources": runs, "request_log": self.request_log})
+
+
+# ─────────────────────────────────────────────────────
+# 소스 상태(서킷 브레이커) 섹션
+# ─────────────────────────────────────────────────────
+
+# 소스별 연속 실패와 서킷 상태 (Actions에서 커밋됨)
+HEALTH_FILE = "source_health.json"
+# 마지막 정상 수집 시각/항목 수/항목(네거티브 캐시)은 성공할 때마다 바뀌므로 커밋하지 않고 캐시로 이어 씀
+HEALTH_LAST_GOOD_FILE = "source_last_good.json"
+HEALTH_LAST_GOOD_KEYS = ("last_ok", "last_count", "last_items")
+# 연속 실패가 이만큼 쌓이면 서킷을 열고, 대기 시간이 지나면 한 번 시험 요청. 시험도 실패하면 대기 시간을 두 배로
+CIRCUIT_FAILURES = int(os.environ.get('BOT_CIRCUIT_FAILURES', '3'))
+CIRCUIT_BACKOFF_HOURS = float(os.environ.get('BOT_CIRCUIT_BACKOFF_HOURS', '2'))
+CIRCUIT_MAX_HOURS = float(os.environ.get('BOT_CIRCUIT_MAX_HOURS', '72'))
+LAST_GOOD_ITEMS = 50  # 소스별로 남겨 두는 마지막 정상 결과 항목 수
+
+
+class SourceHealth:
+    """소스별 서킷 브레이커입니다. 열린 서킷의 소스는 요청 없이 건너뛰고,
+    마지막 정상 수집 결과(네거티브 캐시)를 보고서용으로 남겨 둡니다.
+    """
+
+    def __init__(self, path=HEALTH_FILE, last_good_path=HEALTH_LAST_GOOD_FILE):
+        self.path, self.last_good_path = path, last_good_path
+        sources = load_json_state(path, {}).get("sources", {})
+        self.saved = json.dumps(sources, sort_keys=True)
+        self.sources = merge_state(sources, load_json_state(last_good_path, {}).get("sources", {}))
+        self.blocked = []
+
+    def is_open(self, name, now=None):
+        until = self.sources.get(name, {}).get("open_until")
+        return bool(until) and until > (now or datetime.now()).isoformat(timespec="seconds")
+
+    def admit(self, names, now=None):
+        """열린 서킷의 소스를 뺀 이름 목록을 돌려줍니다. 대기 시간이 끝난 소스는 시험 요청으로 통과시킵니다."""
+        blocked = [n for n in names if self.is_open(n, now)]
+        if blocked and blocked != self.blocked:
+            until = {n: self.sources[n]["open_until"][5:16].replace("T", " ") for n in blocked}
+            print(f"🔌 서킷이 열려 건너뜀: {', '.join(f'{n} (~{until[n]})' for n in blocked)}")
+        self.blocked = blocked
+        return [n for n in names if n not in blocked]
+
+    def observe(self, name, items, metrics, now=None):
+        """수집 결과로 서킷 상태를 갱신합니다. 예산 부족으로 건너뛴 소스처럼 성공/실패를 모르는 실행은 무시합니다."""
+        if metrics["status"] not in ("ok", "partial", "error", "timeout"):
+            return
+        now = now or datetime.now()
+        entry = self.sources.setdefault(name, {"failures": 0, "trips": 0})
+        if metrics["status"] in ("ok", "partial"):
+            if entry.get("trips"):
+                print(f"🔌 {name}: 시험 요청 성공, 서킷을 닫습니다.")
+            entry.update(failures=0, trips=0, open_until=None, last_ok=now.isoformat(timespec="seconds"),
+                         last_count=len(items),
+                         last_items=[{k: i.get(k) for k in ("title", "url", "date")} for i in items[:LAST_GOOD_ITEMS]])
+            return
+        entry["failures"] += 1
+        entry["last_error"] = ", ".join(metrics["errors"] + [str(c) for c in metrics["http_errors"]]) or metrics["status"]
+        if entry["failures"] >= CIRCUIT_FAILURES:
+            hours = min(CIRCUIT_BACKOFF_HOURS * 2 ** entry["trips"], CIRCUIT_MAX_HOURS)
+            entry["trips"] += 1
+            entry["open_until"] = (now + timedelta(hours=hours)).isoformat(timespec="seconds")
+            print(f"🔌 {name}: 연속 {entry['failures']}회 실패({entry['last_error']})로 서킷을 엽니다. {hours:g}시간 뒤 다시 시도")
+
+    def open_circuits(self, now=None):
+        """{이름: 상태}로 지금 열려 있는 서킷만 돌려줍니다 (마지막 정상 결과 목록은 빼고)."""
+        return {n: {k: v for k, v in e.items() if k != "last_items"}
+                for n, e in self.sources.items() if self.is_open(n, now)}
+
+    def last_good(self, name):
+        """마지막으로 정상 수집했을 때의 항목들 (최대 LAST_GOOD_ITEMS개)."""
+        return self.sources.get(name, {}).get("last_items", [])
+
+    def save(self):
+        """마지막 정상 결과는 캐시 파일에 쓰고, 커밋되는 상태 파일은 실패 횟수나 서킷 상태가 바뀌었을 때만 씁니다."""
+        kept, last_good = split_state(self.sources, HEALTH_LAST_GOOD_KEYS)
+        snapshot = json.dumps(kept, sort_keys=True)
+        if snapshot != self.saved:
+            save_json_state(self.path, {"sources": kept})
+            self.saved = snapshot
+        save_json_state(self.last_good_path, {"sources": last_good})
+
+
+# ─────────────────────────────────────────────────────
+# 스냅샷 비교 섹션
+# ─────────────────────────────────────────────────────
+
+# 소스별 마지막 수집 결과의 요약 {키 해시: [제목 해시, URL 해시, 종료일]} (Actions에서 커밋됨)
+SNAPSHOT_FILE = "source_snapshots.json"
+
+
+def short_hash(text):
+    return hashlib.sha1(str(text or '').encode("utf-8")).hexdigest()[:10]
+
+
+def snapshot_entries(items, today=None):
+    """항목들을 {키 해시: [제목 해시, URL 해시, 종료일]}로 요약합니다.
+    키는 숫자를 뺀 정규화 제목이라 기수/연도만 바뀐 공고도 같은 공고로 이어지고,
+    한 번에 같은 키가 여럿이면(SSAFY 12기/13기 공지가 함께 있을 때) 숫자까지 넣은 키로 구분합니다.
+    날짜를 해석할 수 없으면 종료일 대신 날짜 문자열의 해시('#...')를 씁니다.
+    """
+    today = today or datetime.now().strftime('%Y-%m-%d')
+    groups = {}
+    for item in items:
+        key = normalize_key(item['title'], item.get('url'))
+        groups.setdefault(DIGITS_RE.sub('#', key), []).append((key, item))
+    entries = {}
+    for loose, members in groups.items():
+        for key, item in members:
+            end = parse_date_range(item.get('date'), today)[1] or f"#{short_hash(item.get('date'))}"
+            entries[short_hash(loose if len(members) == 1 else key)] = (
+                item, [short_hash(item['title']), short_hash(canonical_url(item.get('url'))), end])
+    return entries
+
+
+YEAR_RE = re.compile(r'\d{4}')
+
+
+def pin_year(item, entry, old):
+    """연도 없는 날짜('DEC 01 - DEC 03')가 시계가 넘어가면서 다른 해로 해석됐으면 처음 본 해로 되돌립니다.
+    월/일이 같고 연도만 다른 종료일은 일정 변경이 아니므로 스냅샷 항목(entry)을 old의 종료일로 맞추고,
+    항목에는 year_shift를 남겨 마감 필터(normalize_dates)도 같은 해를 쓰게 합니다.
+    """
+    end, pinned = entry[2], old[2]
+    if (end == pinned or end.startswith("#") or pinned.startswith("#") or end[4:] != pinned[4:]
+            or YEAR_RE.search(str(item.get('date') or ''))):
+        return
+    item['year_shift'] = int(pinned[:4]) - int(end[:4])
+    entry[2] = pinned
+
+
+def describe_change(old, new):
+    """스냅샷 항목 두 개를 비교해 '마감 2026-10-20 → 2026-10-31, 링크 변경' 같은 설명을 만듭니다."""
+    changes = []
+    if old[0] != new[0]:
+        changes.append("제목 변경")
+    if old[2] != new[2]:
+        dated = not old[2].startswith("#") and not new[2].startswith("#")
+        changes.append(f"일정 {old[2]} → {new[2]}" if dated else "일정 변경")
+    if old[1] != new[1]:
+        changes.append("링크 변경")
+    return ", ".join(changes)
+
+
+class SnapshotStore:
+    """소스별 스냅샷을 지난 실행과 비교해 추가/변경/삭제를 한 번 훑어 찾습니다.
+    새 스냅샷은 pending에 두었다가 전송이 모두 끝난 뒤 commit해, 못 보낸 변경은 다음 실행에서 다시 나옵니다.
+    """
+
+    def __init__(self, path=SNAPSHOT_FILE):
+        self.path = path
+        self.sources = load_json_state(path, {}).get("sources", {})
+        self.pending, self.dirty = {}, False
+
+    def diff(self, name, items, today=None):
+        """(추가된 항목, 바뀐 항목, 사라진 개수)를 돌려줍니다. 스냅샷 해시가 지난번과 같으면 None입니다.
+        바뀐 항목에는 changes(변경 설명)가 붙습니다. 연도 없는 날짜는 처음 본 해로 고정합니다(pin_year).
+        """
+        entries = snapshot_entries(items, today)
+        previous = self.sources.get(name, {})
+        old = previous.get("items", {})
+        for key, (item, entry) in entries.items():
+            if key in old:
+                pin_year(item, entry, old[key])
+        snapshot = {k: v for k, (_, v) in entries.items()}
+        digest = short_hash(json.dumps(snapshot, sort_keys=True))
+        if previous.get("digest") == digest:
+            return None
+        self.pending[name] = {"digest": digest, "items": snapshot}
+        added, changed = [], []
+        for key, (item, entry) in entries.items():
+            if key not in old:
+                added.append(item)
+            elif old[key] != entry:
+                item['changes'] = describe_change(old[key], entry)
+                changed.append(item)
+        removed = sum(1 for key in old if key not in entries)
+        return added, changed, removed
+
+    def commit(self, names=None):
+        for name in list(self.pending) if names is None else names:
+            if name in self.pending:
+                self.sources[name] = self.pending.pop(name)
+                self.dirty = True
+
+    def discard(self, names=None):
+        for name in list(self.pending) if names is None else names:
+            self.pending.pop(name, None)
+
+    def save(self):
+        """commit된 스냅샷이 있을 때만 씁니다."""
+        if self.dirty:
+            save_json_state(self.path, {"sources": self.sources})
+            self.dirty = False
+
+
 class HackathonBot:
-    def __init__(self):
+    def __init__(self, full_resync=FULL_RESYNC, sources=SOURCES_ONLY, subscriptions=None):
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         }
-        self.linkareer_headers = {
-            **self.headers,
-            "Content-Type": "application/json",
-            "Origin": "https://linkareer.com",
-            "Referer": "https://linkareer.com/",
-        }
+        self.sources = load_sources(only=sources)
+        self.schedule = SourceSchedule()
+        self.health = SourceHealth()
+        self.snapshots = SnapshotStore()
+        self.classifier = TitleClassifier(self.sources)
+        self.router = SubscriptionRouter(load_subscriptions() if subscriptions is None else subscriptions)
+        self.session = build_session()
+        self.session.headers.update(self.headers)
+        # 디스코드는 post_webhook에서 rate limit 헤더를 보고 직접 재시도
+        self.discord_session = build_session(retries=0)
         self.sent_list = self.load_sent_list()
+        self.http_cache = load_json_state(HTTP_CACHE_FILE, {})
+        self._cache_lock = threading.Lock()
+        self.detail_cache = load_json_state(DETAIL_CACHE_FILE, {})
+        self.enrich_metrics, self.enrich_requests = new_metrics("상세 보강"), 0
+        self._host_slots, self._slots_lock = {}, threading.Lock()
+        self.full_resync = full_resync
+        self.metrics, self.fetch_wall = {}, 0.0
+        self.discord_metrics = new_metrics("Discord")
+        self.cursors = load_json_state(CURSOR_FILE, {})
+        self.pending_cursors = {}
+        self.pending_deliveries = load_json_state(PENDING_DELIVERY_FILE, {})
+        self._stage = threading.local()
 
     def load_sent_list(self):
-        if os.path.exists(DB_FILE):
-            with open(DB_FILE, "r", encoding="utf-8") as f:
-                return set(line.strip() for line in f if line.strip())
-        return set()
+        return open_dedup_store(DEDUP_BACKEND)
 
     def save_sent_list(self, new_items):
-        with open(DB_FILE, "a", encoding="utf-8") as f:
-            for item in new_items:
-                f.write(f"{item['title']}\n")
+        self.sent_list.add_many(new_items)
+
+    def cached_get(self, url, parse, params=None, **kwargs):
+        """검증자(ETag/Last-Modified)를 보내는 조건부 GET입니다.
+        304면 지난번 parse(res) 결과를 그대로 돌려주고, 200이면 새로 파싱해 캐시에 저장합니다.
+        """
+        key = url if not params else f"{url}?{'&'.join(f'{k}={v}' for k, v in sorted(params.items()))}"
+        with self._cache_lock:
+            entry = self.http_cache.get(key)
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        res = self.session.get(url, params=params, headers=headers, **kwargs)
+        now = datetime.now().isoformat(timespec="seconds")
+        if res.status_code == 304 and entry:
+            with self._cache_lock:
+                entry["checked_at"] = now
+            return [dict(i) for i in entry["items"]]
+        items = parse(res)
+        etag, last_modified = res.headers.get("ETag"), res.headers.get("Last-Modified")
+        if res.status_code == 200 and (etag or last_modified):
+            with self._cache_lock:
+                self.http_cache[key] = {
+                    "etag": etag, "last_modified": last_modified,
+                    # 이후 단계가 항목을 고쳐 쓰므로(분류, 상세 보강) 사본을 저장
+                    "items": [dict(i) for i in items], "checked_at": now,
+                }
+        return items
+
+    def cursor(self, key):
+        """key의 지난 실행 최신 id를 돌려줍니다. 전체 재동기화 모드면 None."""
+        return None if self.full_resync else self.cursors.get(key)
+
+    def advance_cursor(self, key, newest_id):
+        """이번 실행에서 본 최신 id를 기록해 둡니다. 전송이 끝난 뒤 commit_cursors에서 저장됩니다.
+        staging_cursors 안이면 수집 결과가 실제로 쓰일 때까지 그 수집의 stage에만 모아 둡니다.
+        """
+        if newest_id is None:
+            return
+        stage = getattr(self._stage, "cursors", None)
+        if stage is None:
+            self.accept_cursors({key: newest_id})
+        else:
+            stage[key] = max(newest_id, stage.get(key, newest_id))
+
+    @contextmanager
+    def staging_cursors(self, stage):
+        """현재 스레드의 커서 갱신을 stage에 모읍니다. 마감을 넘겨 버린 수집이 커서를 올리지 못하게 합니다."""
+        self._stage.cursors = stage
+        try:
+            yield stage
+        finally:
+            self._stage.cursors = None
+
+    def accept_cursors(self, stage):
+        """결과를 내보낸 수집의 커서만 pending_cursors에 반영합니다."""
+        with self._cache_lock:
+            for key, newest_id in stage.items():
+                self.pending_cursors[key] = max(newest_id, self.pending_cursors.get(key, newest_id))
+
+    def commit_cursors(self):
+        """pending_cursors를 반영하고, 커서가 올라갔을 때만 파일에 씁니다."""
+        cursors = dict(self.cursors)
+        for key, newest_id in self.pending_cursors.items():
+            cursors[key] = max(newest_id, cursors.get(key) or newest_id)
+        self.pending_cursors = {}
+        if cursors != self.cursors:
+            self.cursors = cursors
+            save_json_state(CURSOR_FILE, cursors)
+
+    def save_http_cache(self):
+        """오래된 항목을 지우고, 파일이 HTTP_CACHE_MAX_BYTES를 넘으면 오래 확인 안 된 순으로 줄여 저장합니다."""
+        cutoff = (datetime.now() - timedelta(days=HTTP_CACHE_MAX_AGE_DAYS)).isoformat(timespec="seconds")
+        with self._cache_lock:
+            cache = {k: v for k, v in self.http_cache.items() if v.get("checked_at", "") >= cutoff}
+        sizes = {k: len(json.dumps(v, ensure_ascii=False)) for k, v in cache.items()}
+        total = sum(sizes.values())
+        for k in sorted(cache, key=lambda k: cache[k].get("checked_at", "")):
+            if total <= HTTP_CACHE_MAX_BYTES:
+                break
+            total -= sizes[k]
+            del cache[k]
+        self.http_cache = cache
+        save_json_state(HTTP_CACHE_FILE, cache)
 
     # ─────────────────────────────────────────────────────
     # 수집 함수 섹션
     # ─────────────────────────────────────────────────────
 
-    def fetch_devpost(self):
+    def fetch_source(self, name, spec):
+        """레지스트리 선언대로 소스 하나를 수집합니다. 실패하면 오류를 기록하고 빈 목록을 돌려줍니다."""
         try:
-            h = self.headers.copy()
-            h.update({"Accept": "application/json", "Referer": "https://devpost.com/hackathons", "X-Requested-With": "XMLHttpRequest"})
-            res = requests.get("https://devpost.com/api/hackathons", params={"status[]": "upcoming", "sort_by": "Recently Added"}, headers=h, timeout=15)
-            if res.status_code == 200:
-                return [{"title": h['title'], "url": h['url'], "host": "Devpost", "date": h.get('submission_period_dates', 'N/A')}
-                        for h in res.json().get('hackathons', [])]
-        except:
-            pass
+            if spec.get("fetch"):
+                return getattr(self, spec["fetch"])(name, spec)
+            return self.fetch_endpoint(name, spec)
+        except Exception as e:
+            report_error(e)
+            print(f"{name} 수집 실패: {e}")
         return []
 
-    def fetch_mlh(self):
-        MONTHS = {'JAN':1,'FEB':2,'MAR':3,'APR':4,'MAY':5,'JUN':6,'JUL':7,'AUG':8,'SEP':9,'OCT':10,'NOV':11,'DEC':12}
+    def fetch_endpoint(self, name, spec, params=None, quiet=False):
+        """엔드포인트 하나를 요청해 spec["parse"] 메서드로 해석합니다. conditional이면 조건부 요청을 씁니다.
+        paginate가 있으면 fetch_pages로 여러 페이지를 읽습니다. quiet면 응답 오류를 출력하지 않습니다.
+        """
+        if spec["paginate"] and params is None:
+            return self.fetch_pages(name, spec)
+        parse = getattr(self, spec["parse"])
+        headers = {**self.headers, **spec["headers"]}
+        params = spec.get("params") if params is None else params
+        if spec["conditional"]:
+            return self.cached_get(spec["url"], lambda res: parse(res, spec),
+                                   params=params, headers=headers, timeout=spec["timeout"])
+        res = self.session.request(spec["method"], spec["url"], params=params,
+                                   headers=headers, timeout=spec["timeout"])
+        if res.status_code != 200:
+            if quiet:
+                pass
+            elif res.status_code == 403 and spec.get("blocked_message"):
+                print(f"{name}: {spec['blocked_message']}")
+            else:
+                print(f"{name} 응답 오류: {res.status_code}")
+            return []
+        return parse(res, spec)
+
+    def fetch_pages(self, name, spec):
+        """페이지 번호형 게시판을 읽고, 앞 페이지와 겹치는 항목을 빼고 페이지 순서대로 합칩니다.
+        평소에는 첫 페이지 한 요청이고, 첫 페이지가 모두 아직 보내지 않은 공고일 때만 나머지 depth-1개 페이지를
+        PAGE_WORKERS개씩 동시에 요청합니다. 합치다가 새 공고만으로 채워지지 않은 페이지가 나오면 그 뒤 페이지는 버리고
+        아직 시작하지 않은 요청은 취소합니다. 전체 재동기화 모드에서는 새 항목이 나오는 동안 depth까지 읽습니다.
+        페이지마다 따로 계측해 소스 계측에 더하고, 첫 페이지 뒤의 404는 목록 끝으로 보고 오류에서 뺍니다.
+        """
+        paging = spec["paginate"]
+        start, depth = paging.get("start", 1), paging.get("depth", PAGE_DEPTH)
+        metrics = current_metrics()
+
+        def page(number):
+            params = {**(spec.get("params") or {}), paging["param"]: str(number)}
+            page_metrics = new_metrics(name)
+            try:
+                with collecting(page_metrics):
+                    return self.fetch_endpoint(name, spec, params=params, quiet=number != start)
+            finally:
+                if number != start and page_metrics["http_errors"] == [404]:
+                    page_metrics["http_errors"] = []
+                merge_metrics(metrics, page_metrics)
+
+        results, seen = [], set()
+
+        def merge(found):
+            """found를 합치고 다음 페이지를 더 읽을지 돌려줍니다."""
+            added = whole = 0
+            for item in found:
+                key = canonical_url(item.get('url')) or normalize_key(item['title'], item.get('url'))
+                if key in seen:
+                    continue
+                seen.add(key)
+                results.append(item)
+                added += 1
+                whole += item['title'] not in self.sent_list
+            return bool(added and (self.full_resync or whole == len(found)))
+
+        if not merge(page(start)) or depth < 2:
+            return results
+        pool = DaemonThreadPool(min(PAGE_WORKERS, depth - 1), thread_name_prefix="page")
         try:
-            res = requests.get("https://mlh.io/seasons/2026/events", headers=self.headers, timeout=15)
-            if res.status_code == 200:
-                soup = BeautifulSoup(res.text, 'html.parser')
-                results, today, seen = [], datetime.now().replace(hour=0,minute=0,second=0,microsecond=0), set()
-                for a in soup.find_all('a', href=True):
-                    h3 = a.find('h3')
-                    if not h3: continue
-                    title = h3.get_text(strip=True)
-                    if not title or title in seen: continue
-                    seen.add(title)
-                    link = a['href'].split('?')[0]
-                    if not link.startswith('http'): link = "https://mlh.io" + link
-                    a_text = a.get_text(separator=' ', strip=True).replace(title, '')
-                    date_parts = re.findall(r'([A-Z]{3})\s+(\d{1,2})', a_text)
-                    if date_parts:
-                        date_str = ' - '.join(f"{m} {d}" for m,d in date_parts) if len(date_parts)>1 else f"{date_parts[0][0]} {date_parts[0][1]}"
-                        mon, day = date_parts[-1]
-                        end_m = MONTHS.get(mon, 0)
-                        if end_m and datetime(today.year, end_m, int(day)) < today: continue
-                    else:
-                        date_str = "2026 Season"
-                    results.append({"title": title, "url": link, "host": "MLH", "date": date_str})
-                return results
-        except Exception as e:
-            print(f"MLH 예외: {e}")
-        return []
+            futures = [pool.submit(page, number) for number in range(start + 1, start + depth)]
+            for future in futures:
+                try:
+                    found = future.result()
+                except Exception as e:
+                    report_error(e)
+                    break
+                if not merge(found):
+                    break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def _parse_devpost(self, res, spec):
+        return [{"title": h['title'], "url": h['url'], "host": "Devpost", "date": h.get('submission_period_dates', 'N/A')}
+                for h in res.json().get('hackathons', [])]
+
+    def _parse_mlh(self, res, spec):
+        if res.status_code != 200:
+            return []
+        soup = make_soup(res.text, strainer('a', href=True))
+        results, seen = [], set()
+        for a in soup.find_all('a', href=True):
+            h3 = a.find('h3')
+            if not h3: continue
+            title = h3.get_text(strip=True)
+            if not title or title in seen: continue
+            seen.add(title)
+            link = a['href'].split('?')[0]
+            if not link.startswith('http'): link = "https://mlh.io" + link
+            a_text = a.get_text(separator=' ', strip=True).replace(title, '')
+            date_parts = re.findall(r'([A-Z]{3})\s+(\d{1,2})', a_text)
+            if date_parts:
+                # 연도 추정과 마감 필터링은 normalize_dates에서 한꺼번에 처리
+                date_str = ' - '.join(f"{m} {d}" for m,d in date_parts) if len(date_parts)>1 else f"{date_parts[0][0]} {date_parts[0][1]}"
+            else:
+                date_str = "2026 Season"
+            results.append({"title": title, "url": link, "host": "MLH", "date": date_str})
+        return results
 
-    def _fetch_linkareer(self, filter_by, label):
-        """링커리어 GraphQL API로 활동 목록을 가져옵니다."""
+    def fetch_linkareer(self, name, spec):
+        """링커리어 GraphQL API로 활동 목록을 가져옵니다.
+        최신순 정렬이므로 지난 실행의 최신 id 이하가 나오면 거기서 멈춥니다.
+        """
         results = []
         page = 1
         page_size = 20
+        label = spec["label"]
+        cursor_key = f"linkareer:{label}"
+        last_seen = self.cursor(cursor_key)
+        newest = None
         try:
-            while True:
+            reached = False
+            while not reached:
                 payload = {
                     "query": LINKAREER_QUERY,
                     "variables": {
-                        "filterBy": filter_by,
+                        "filterBy": spec["filter_by"],
                         "page": page,
                         "pageSize": page_size,
                     },
                 }
-                res = requests.post(
-                    LINKAREER_GRAPHQL_URL,
+                res = self.session.post(
+                    spec["url"],
                     json=payload,
-                    headers=self.linkareer_headers,
-                    timeout=15,
+                    headers={**self.headers, **spec["headers"]},
+                    timeout=spec["timeout"],
                 )
                 res.raise_for_status()
                 data = res.json()
@@ -125,6 +2330,11 @@ class HackathonBot:
                 total = data["data"]["activities"]["totalCount"]
 
                 for a in nodes:
+                    activity_id = int(a["id"])
+                    if last_seen is not None and activity_id <= last_seen:
+                        reached = True
+                        break
+                    newest = max(newest or activity_id, activity_id)
                     close_date = "미정"
                     if a.get("recruitCloseAt"):
                         close_ts = int(a["recruitCloseAt"]) / 1000
@@ -136,476 +2346,969 @@ class HackathonBot:
                         "date": f"마감: {close_date}",
                     })
 
-                if page * page_size >= total:
+                if page * page_size >= total or (last_seen is not None and page >= MAX_PAGES):
                     break
                 page += 1
+            self.advance_cursor(cursor_key, newest)
 
         except Exception as e:
+            report_error(e)
             print(f"링커리어 {label} 수집 실패: {e}")
 
         return results
 
-    def fetch_linkareer_hackathon(self):
-        """링커리어에서 해커톤 공고를 가져옵니다."""
-        return self._fetch_linkareer(
-            filter_by={"q": "해커톤", "status": "OPEN"},
-            label="해커톤",
-        )
-
-    def fetch_linkareer_bootcamp(self):
-        """링커리어에서 부트캠프 공고를 가져옵니다 (교육 타입, activityTypeID=6)."""
-        return self._fetch_linkareer(
-            filter_by={"activityTypeID": 6, "status": "OPEN"},
-            label="부트캠프",
-        )
-
-    def fetch_campuspick(self):
-        try:
-            h = self.headers.copy()
-            h.update({"Content-Type": "application/x-www-form-urlencoded", "Origin": "https://www2.campuspick.com", "Referer": "https://www2.campuspick.com/"})
-            today, results = datetime.now().strftime('%Y-%m-%d'), []
-            for cat_id in [108, 111]: # 108: 공모전, 111: 교육/강연
-                res = requests.post("https://api2.campuspick.com/find/activity/list", data={"target":1,"limit":20,"offset":0,"categoryId":cat_id}, headers=h, timeout=15)
-                if res.status_code == 200:
-                    activities = res.json().get("result", {}).get("activities", [])
-                    for a in activities:
-                        if a.get("endDate","") >= today:
-                            prefix = "🎓 [부트캠프/교육]" if cat_id == 111 else "🇰🇷 [캠퍼스픽]"
-                            results.append({"title": f"{prefix} {a['title']}", "url": f"https://www2.campuspick.com/contest/view?id={a['id']}", "host": "CampusPick", "date": a.get("endDate","상세 확인")})
-            return results
-        except Exception as e:
-            print(f"CampusPick 예외: {e}")
-        return []
-
-    def fetch_devevent(self):
-        try:
-            # README.md에 현재 진행 중/예정 행사 목록이 있음 (end_event/는 종료된 행사)
-            res = requests.get(
-                "https://raw.githubusercontent.com/brave-people/Dev-Event/master/README.md",
-                headers=self.headers, timeout=15
-            )
-            if res.status_code == 200:
-                results, seen = [], set()
-                keywords = ['해커톤', 'hackathon', '공모전', '경진대회', '부트캠프', 'bootcamp', '교육', 'kdt', '양성']
-                for m in re.finditer(r'__\[([^\]]+)\]\((https?://[^\)]+)\)__', res.text):
-                    title, link = m.group(1), m.group(2)
-                    if link in seen:
+    def fetch_campuspick(self, name, spec):
+        """캠퍼스픽 공모전/교육 목록을 가져옵니다.
+        offset을 20씩 넘기다가 지난 실행의 최신 id 이하가 나오면 멈추므로 평소에는 한 페이지만 읽습니다.
+        """
+        h = {**self.headers, **spec["headers"]}
+        results, limit = [], 20
+        for cat_id, (prefix, category) in spec["categories"].items():
+            cursor_key = f"campuspick:{cat_id}"
+            last_seen, newest = self.cursor(cursor_key), None
+            for page in range(MAX_PAGES):
+                res = self.session.post(spec["url"], data={"target":1,"limit":limit,"offset":page*limit,"categoryId":int(cat_id)}, headers=h, timeout=spec["timeout"])
+                if res.status_code != 200:
+                    break
+                activities = res.json().get("result", {}).get("activities", [])
+                reached = False
+                for a in activities:
+                    if last_seen is not None and int(a['id']) <= last_seen:
+                        reached = True
                         continue
-                    if any(k in title.lower() for k in keywords):
-                        seen.add(link)
-                        icon = "🎓" if any(b in title.lower() for b in ['부트캠프', '교육', 'kdt']) else "🇰🇷"
-                        results.append({"title": f"{icon} [데브이벤트] {title}", "url": link, "host": "DevEvent", "date": "상세 확인"})
-                return results
-        except Exception as e:
-            print(f"DevEvent 수집 실패: {e}")
-        return []
+                    newest = max(newest or int(a['id']), int(a['id']))
+                    results.append({"title": f"{prefix} {a['title']}", "url": f"https://www2.campuspick.com/contest/view?id={a['id']}", "host": "CampusPick", "date": a.get("endDate","상세 확인"), "category": category})
+                if reached or len(activities) < limit:
+                    break
+            self.advance_cursor(cursor_key, newest)
+        return results
+
+    def _parse_devevent(self, res, spec):
+        if res.status_code != 200:
+            return []
+        results, seen = [], set()
+        for m in re.finditer(r'__\[([^\]]+)\]\((https?://[^\)]+)\)__', res.text):
+            title, link = m.group(1), m.group(2)
+            if link in seen:
+                continue
+            category = self.classifier.classify(title, spec)
+            if category is not None:
+                seen.add(link)
+                icon = "🎓" if category == "bootcamp" else "🇰🇷"
+                results.append({"title": f"{icon} [데브이벤트] {title}", "url": link, "host": "DevEvent", "date": "상세 확인", "category": category})
+        return results
 
-    def fetch_ssafy(self):
+    def _parse_ssafy(self, res, spec):
         """SSAFY 공지사항 게시판에서 모집 공고를 가져옵니다."""
-        try:
-            url = "https://www.ssafy.com/ksp/servlet/swp.board.controller.SwpBoardServlet"
-            params = {"p_process": "select-board-list", "p_tabseq": "226504", "p_pageno": "1"}
-            h = self.headers.copy()
-            h.update({
-                "X-Requested-With": "XMLHttpRequest",
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Accept-Language": "ko-KR,ko;q=0.9",
+        soup = make_soup(res.text, strainer('li', class_='_top'))
+        # 실제 구조: <li class="_top"> 안에 <span class="td td1"><a>, <span class="td td2">
+        results = []
+        for li in soup.select('li._top'):
+            td1 = li.select_one('span.td1')
+            if not td1:
+                continue
+            a = td1.find('a')
+            if not a:
+                continue
+            # <i class="ico_noti"> 태그([공지] 텍스트) 제거 후 제목 추출
+            for ico in a.find_all('i'):
+                ico.decompose()
+            title = a.get_text(strip=True)
+            category = self.classifier.classify(title, spec)
+            if category is None:
+                continue
+            seq_match = re.search(r'goViewPage\((\d+)\)', a.get('href', ''))
+            if not seq_match:
+                continue
+            seq = seq_match.group(1)
+            detail_url = (
+                f"https://www.ssafy.com/ksp/servlet/swp.board.controller.SwpBoardServlet"
+                f"?p_process=select-board-view&p_tabseq=226504&p_seq={seq}"
+            )
+            date_span = li.select_one('span.td2')
+            date = date_span.get_text(strip=True) if date_span else '미정'
+            results.append({
+                "title": f"[SSAFY] {title}",
+                "url": detail_url,
+                "host": "SSAFY (삼성 청년 SW 아카데미)",
+                "date": date,
+                "category": category,
             })
-            res = requests.get(url, params=params, headers=h, timeout=15)
-            if res.status_code != 200:
-                print(f"SSAFY 응답 오류: {res.status_code}")
-                return []
-            soup = BeautifulSoup(res.text, 'html.parser')
-            # 실제 구조: <li class="_top"> 안에 <span class="td td1"><a>, <span class="td td2">
-            results = []
-            for li in soup.select('li._top'):
-                td1 = li.select_one('span.td1')
-                if not td1:
-                    continue
-                a = td1.find('a')
-                if not a:
-                    continue
-                # <i class="ico_noti"> 태그([공지] 텍스트) 제거 후 제목 추출
-                for ico in a.find_all('i'):
-                    ico.decompose()
-                title = a.get_text(strip=True)
-                if not any(k in title for k in ['모집', '공고', '기수']):
-                    continue
-                seq_match = re.search(r'goViewPage\((\d+)\)', a.get('href', ''))
-                if not seq_match:
-                    continue
-                seq = seq_match.group(1)
-                detail_url = (
-                    f"https://www.ssafy.com/ksp/servlet/swp.board.controller.SwpBoardServlet"
-                    f"?p_process=select-board-view&p_tabseq=226504&p_seq={seq}"
-                )
-                date_span = li.select_one('span.td2')
-                date = date_span.get_text(strip=True) if date_span else '미정'
-                results.append({
-                    "title": f"[SSAFY] {title}",
-                    "url": detail_url,
-                    "host": "SSAFY (삼성 청년 SW 아카데미)",
-                    "date": date,
-                })
-            return results
-        except Exception as e:
-            print(f"SSAFY 수집 실패: {e}")
-        return []
+        return results
 
-    def fetch_woowacourse(self):
+    def _parse_woowacourse(self, res, spec):
         """우아한테크코스 공지사항에서 모집 공고를 가져옵니다."""
-        try:
-            res = requests.get("https://woowacourse.io/notice", headers=self.headers, timeout=15)
-            soup = BeautifulSoup(res.text, 'html.parser')
-            script = soup.find('script', id='__NEXT_DATA__')
-            keywords = ['모집', '지원', '과정', '기수', '선발']
-            if script:
-                data = json.loads(script.string)
-                blocks = (
-                    data.get('props', {})
-                    .get('pageProps', {})
-                    .get('recordMap', {})
-                    .get('block', {})
-                )
-                results = []
-                for block_id, block_data in blocks.items():
-                    value = block_data.get('value', {})
-                    if value.get('type') != 'page':
-                        continue
-                    props = value.get('properties', {})
-                    title_arr = props.get('title', [])
-                    if not title_arr:
-                        continue
-                    title = title_arr[0][0] if title_arr else ''
-                    if not title or not any(k in title for k in keywords):
-                        continue
-                    date = '미정'
-                    for key, val in props.items():
-                        if key == 'title' or not val:
-                            continue
-                        try:
-                            candidate = val[0][0]
-                            if isinstance(candidate, str) and re.match(r'\d{4}', candidate):
-                                date = candidate[:10]
-                                break
-                        except (IndexError, TypeError):
-                            pass
-                    results.append({
-                        "title": f"[우테코] {title}",
-                        "url": f"https://woowacourse.io/notice/{block_id}",
-                        "host": "우아한테크코스",
-                        "date": date,
-                    })
-                if results:
-                    return results
-
-            # fallback: 페이지 내 링크 직접 추출
+        # __NEXT_DATA__ 스크립트만 정규식으로 잘라내 트리를 만들지 않음
+        script = NEXT_DATA_RE.search(res.text)
+        if script:
+            data = json.loads(script.group(1))
+            blocks = (
+                data.get('props', {})
+                .get('pageProps', {})
+                .get('recordMap', {})
+                .get('block', {})
+            )
             results = []
-            seen = set()
-            for a in soup.find_all('a', href=True):
-                title = a.get_text(strip=True)
-                href = a['href']
-                if not title or not any(k in title for k in keywords):
+            for block_id, block_data in blocks.items():
+                value = block_data.get('value', {})
+                if value.get('type') != 'page':
                     continue
-                if href in seen:
+                props = value.get('properties', {})
+                title_arr = props.get('title', [])
+                if not title_arr:
                     continue
-                seen.add(href)
-                if not href.startswith('http'):
-                    href = 'https://woowacourse.io' + href
+                title = title_arr[0][0] if title_arr else ''
+                category = self.classifier.classify(title, spec) if title else None
+                if category is None:
+                    continue
+                date = '미정'
+                for key, val in props.items():
+                    if key == 'title' or not val:
+                        continue
+                    try:
+                        candidate = val[0][0]
+                        if isinstance(candidate, str) and re.match(r'\d{4}', candidate):
+                            date = candidate[:10]
+                            break
+                    except (IndexError, TypeError):
+                        pass
                 results.append({
                     "title": f"[우테코] {title}",
-                    "url": href,
+                    "url": f"https://woowacourse.io/notice/{block_id}",
                     "host": "우아한테크코스",
-                    "date": "상세 확인",
+                    "date": date,
+                    "category": category,
                 })
-            return results
-        except Exception as e:
-            print(f"우아한테크코스 수집 실패: {e}")
-        return []
+            if results:
+                return results
 
-    def fetch_boostcamp(self):
+        # fallback: 페이지 내 링크 직접 추출
+        results = []
+        seen = set()
+        soup = make_soup(res.text, strainer('a', href=True))
+        for a in soup.find_all('a', href=True):
+            title = a.get_text(strip=True)
+            href = a['href']
+            category = self.classifier.classify(title, spec) if title else None
+            if category is None:
+                continue
+            if href in seen:
+                continue
+            seen.add(href)
+            if not href.startswith('http'):
+                href = 'https://woowacourse.io' + href
+            results.append({
+                "title": f"[우테코] {title}",
+                "url": href,
+                "host": "우아한테크코스",
+                "date": "상세 확인",
+                "category": category,
+            })
+        return results
+
+    def fetch_boostcamp(self, name, spec):
         """네이버 부스트캠프 모집 공고를 가져옵니다."""
         results = []
-        pages = [
-            ("https://boostcamp.connect.or.kr/guide_ai.html", "AI Tech"),
-            ("https://boostcamp.connect.or.kr/main_wm.html", "Web·Mobile"),
-        ]
-        for url, course in pages:
+        for url, course in spec["pages"]:
             try:
-                res = requests.get(url, headers=self.headers, timeout=15)
-                if res.status_code != 200:
-                    continue
-                soup = BeautifulSoup(res.text, 'html.parser')
-                text = soup.get_text(separator=' ', strip=True)
-                # 모집 중 여부 확인
-                recruiting_keywords = ['모집 중', '지원 기간', '모집 기간', '접수 기간', '모집합니다', '지원하기', '원서접수']
-                if not any(k in text for k in recruiting_keywords):
-                    continue
-                # 기수 추출
-                cohort_match = re.search(r'(\d+)기', text)
-                cohort = f" {cohort_match.group(1)}기" if cohort_match else ""
-                # 날짜 추출
-                date_match = re.search(r'(\d{4}[년.\-]\s*\d{1,2}[월.\-]\s*\d{1,2}[일]?)', text)
-                date = date_match.group(1).strip() if date_match else '상세 확인'
-                results.append({
-                    "title": f"[부스트캠프] {course}{cohort} 모집",
-                    "url": url,
-                    "host": "네이버 부스트캠프",
-                    "date": date,
-                })
+                results.extend(self.cached_get(
+                    url, lambda res: self._parse_boostcamp(res, spec, url, course),
+                    headers={**self.headers, **spec["headers"]}, timeout=spec["timeout"],
+                ))
             except Exception as e:
+                report_error(e)
                 print(f"부스트캠프 {course} 수집 실패: {e}")
         return results
 
-    def fetch_kt_techup(self):
+    def _parse_boostcamp(self, res, spec, url, course):
+        if res.status_code != 200:
+            return []
+        soup = make_soup(res.text, strainer('body'))
+        text = soup.get_text(separator=' ', strip=True)
+        # 모집 중 여부 확인 (본문을 한 번만 훑음)
+        if self.classifier.classify(text, spec) is None:
+            return []
+        # 기수 추출
+        cohort_match = re.search(r'(\d+)기', text)
+        cohort = f" {cohort_match.group(1)}기" if cohort_match else ""
+        # 날짜 추출
+        date_match = re.search(r'(\d{4}[년.\-]\s*\d{1,2}[월.\-]\s*\d{1,2}[일]?)', text)
+        date = date_match.group(1).strip() if date_match else '상세 확인'
+        return [{
+            "title": f"[부스트캠프] {course}{cohort} 모집",
+            "url": url,
+            "host": "네이버 부스트캠프",
+            "date": date,
+            "category": spec["category"],
+        }]
+
+    def _parse_kt_techup(self, res, spec):
         """KT Cloud TECH UP K-디지털 트레이닝 부트캠프 모집 정보를 가져옵니다."""
-        try:
-            res = requests.get("https://ktcloud-techup.com/", headers=self.headers, timeout=15)
-            res.encoding = 'utf-8'
-            if res.status_code != 200:
-                return []
-            soup = BeautifulSoup(res.text, 'html.parser')
-            now = datetime.now()
-            # JSON-LD FAQPage에서 교육 일정 추출
-            start_date = end_date = None
-            for script in soup.find_all('script', type='application/ld+json'):
-                try:
-                    data = json.loads(script.string)
-                    if data.get('@type') != 'FAQPage':
-                        continue
-                    for qa in data.get('mainEntity', []):
-                        answer = qa.get('acceptedAnswer', {}).get('text', '')
-                        dates = re.findall(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', answer)
-                        if len(dates) >= 2:
-                            start_date = datetime(int(dates[0][0]), int(dates[0][1]), int(dates[0][2]))
-                            end_date = datetime(int(dates[1][0]), int(dates[1][1]), int(dates[1][2]))
-                            break
-                except Exception:
-                    pass
-                if start_date:
-                    break
-            # 교육 종료일이 지난 경우 건너뜀
-            if end_date and end_date < now:
-                return []
-            date_str = (f"{start_date.strftime('%Y.%m.%d')} ~ {end_date.strftime('%Y.%m.%d')}"
-                        if start_date and end_date else "상세 확인")
-            return [{
-                "title": "[KT Cloud TECH UP] 부트캠프 9개 트랙 모집 (K-디지털 트레이닝)",
-                "url": "https://ktcloud-techup.com/",
-                "host": "kt cloud TECH UP",
-                "date": date_str,
-            }]
-        except Exception as e:
-            print(f"KT Cloud TechUp 수집 실패: {e}")
-        return []
+        res.encoding = 'utf-8'
+        if res.status_code != 200:
+            return []
+        # JSON-LD FAQPage에서 교육 일정 추출 (스크립트 본문만 정규식으로 잘라냄)
+        start_date = end_date = None
+        for script in LD_JSON_RE.finditer(res.text):
+            try:
+                data = json.loads(script.group(1))
+                if data.get('@type') != 'FAQPage':
+                    continue
+                for qa in data.get('mainEntity', []):
+                    answer = qa.get('acceptedAnswer', {}).get('text', '')
+                    dates = re.findall(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', answer)
+                    if len(dates) >= 2:
+                        start_date = datetime(int(dates[0][0]), int(dates[0][1]), int(dates[0][2]))
+                        end_date = datetime(int(dates[1][0]), int(dates[1][1]), int(dates[1][2]))
+                        break
+            except Exception:
+                pass
+            if start_date:
+                break
+        date_str = (f"{start_date.strftime('%Y.%m.%d')} ~ {end_date.strftime('%Y.%m.%d')}"
+                    if start_date and end_date else "상세 확인")
+        return [{
+            "title": "[KT Cloud TECH UP] 부트캠프 9개 트랙 모집 (K-디지털 트레이닝)",
+            "url": spec["url"],
+            "host": "kt cloud TECH UP",
+            "date": date_str,
+        }]
 
-    def fetch_boottent(self):
+    def fetch_boottent(self, name, spec):
         """부트텐트에서 Data/AI 카테고리 부트캠프 공고를 가져옵니다.
         서버는 전체 캠프를 반환하므로 categories 필드로 클라이언트 필터링합니다.
+        응답은 조각 단위로 읽어 campList 청크를 찾는 즉시 연결을 닫습니다.
         """
-        try:
-            res = requests.get(
-                "https://boottent.com/camps",
-                headers=self.headers,
-                timeout=15,
-            )
+        with self.session.get(
+            spec["url"],
+            headers={**self.headers, **spec["headers"]},
+            timeout=spec["timeout"],
+            stream=True,
+        ) as res:
             if res.status_code != 200:
                 print(f"부트텐트: HTTP {res.status_code}")
                 return []
-
+            if 'charset' not in res.headers.get('Content-Type', '').lower():
+                res.encoding = 'utf-8'
             # Next.js RSC 스트림에서 campList 추출: self.__next_f.push([1, "...json..."]) 패턴
-            pushes = re.findall(r'self\.__next_f\.push\((\[.*?\])\)', res.text, re.DOTALL)
-            all_camps = []
-            for p in pushes:
-                if '\\"campList\\"' not in p:
-                    continue
+            all_camps = extract_rsc_array(
+                res.iter_content(chunk_size=RSC_READ_SIZE, decode_unicode=True), 'campList'
+            )
+
+        if not all_camps:
+            print("부트텐트: campList 데이터 없음")
+            return []
+
+        target_cats = set(spec["categories"])
+        results = []
+        for camp in all_camps:
+            if not set(camp.get('categories', [])) & target_cats:
+                continue
+            camp_id = camp.get('campId', '')
+            batch_id = camp.get('batchId', '')
+            title = camp.get('title', '').strip()
+            end_date = camp.get('endDate', '')
+            start_date = camp.get('startDate', '')
+            if not title or not camp_id:
+                continue
+            url = (f"https://boottent.com/camps/{camp_id}_{batch_id}"
+                   if batch_id else f"https://boottent.com/camps/{camp_id}")
+            date_str = (f"{start_date} ~ {end_date}" if start_date and end_date
+                        else end_date or start_date or "상세 확인")
+            results.append({
+                "title": f"[부트텐트] {title}",
+                "url": url,
+                "host": "부트텐트 (boottent.com)",
+                "date": f"마감: {date_str}",
+            })
+        return results
+
+    def _parse_kt_aivle(self, res, spec):
+        """KT 에이블스쿨 주요소식 페이지에서 모집 공고를 가져옵니다."""
+        # 날짜를 같은 행(부모)에서 찾아야 해서 범위를 좁히지 않고 빠른 파서만 사용
+        soup = make_soup(res.text)
+        results = []
+        for subj_div in soup.select('div.td.subject'):
+            a = subj_div.find('a')
+            if not a:
+                continue
+            title = a.get_text(strip=True)
+            category = self.classifier.classify(title, spec)
+            if category is None:
+                continue
+            seq_match = re.search(r"readPtlBbsAtcl\('(\d+)'\)", a.get('href', ''))
+            seq = seq_match.group(1) if seq_match else ''
+            # 날짜: 같은 행(부모)의 형제 div에서 추출
+            row = subj_div.parent
+            date_div = row.select_one('div.td.date') if row else None
+            date = date_div.get_text(strip=True) if date_div else '상세 확인'
+            detail_url = (
+                f"https://aivle.kt.co.kr/home/brd/bbs/view?bbsCd=NEWS&atclSn={seq}"
+                if seq else "https://aivle.kt.co.kr/home/main/goMenuPage?mcd=MC00000058"
+            )
+            results.append({
+                "title": f"[KT 에이블스쿨] {title}",
+                "url": detail_url,
+                "host": "KT 에이블스쿨 (AIVLE School)",
+                "date": date,
+                "category": category,
+            })
+        return results
+
+    # ─────────────────────────────────────────────────────
+    # 유틸리티 및 실행 섹션
+    # ─────────────────────────────────────────────────────
+
+    def iter_fetchers(self, tasks):
+        """수집 함수들을 스레드 풀에서 동시에 실행하고, 끝나는 순서대로 (이름, 결과)를 내보냅니다.
+        소스별 마감(SOURCE_DEADLINE)이나 전체 예산(RUN_BUDGET)을 넘긴 소스는 내보내지 않고 건너뜁니다.
+        """
+        run_start = time.perf_counter()
+        started, timings = {}, {}
+        self.metrics = {name: new_metrics(name) for name, _ in tasks}
+        stages = {name: {} for name, _ in tasks}
+
+        def timed(name, fetcher):
+            started[name] = time.perf_counter()
+            with collecting(self.metrics[name]), self.staging_cursors(stages[name]):
                 try:
-                    inner = json.loads(p)[1]  # 이중 이스케이프 해제
-                    arr_str = self._extract_json_array(inner, 'campList')
-                    if arr_str:
-                        all_camps = json.loads(arr_str)
-                except Exception:
-                    pass
-                break
+                    return fetcher()
+                except Exception as e:
+                    report_error(e)
+                    raise
+                finally:
+                    timings[name] = time.perf_counter() - started[name]
 
-            if not all_camps:
-                print("부트텐트: campList 데이터 없음")
-                return []
+        def in_time(f):
+            """소비자가 늦게 꺼내더라도, 마감과 예산 안에 끝난 소스는 결과를 그대로 씁니다."""
+            name = futures[f]
+            return (f.done() and name in timings and timings[name] < SOURCE_DEADLINE
+                    and started[name] + timings[name] - run_start <= RUN_BUDGET)
 
-            today = datetime.now().strftime('%Y-%m-%d')
-            target_cats = {'data', 'ai'}
-            results = []
-            for camp in all_camps:
-                if not set(camp.get('categories', [])) & target_cats:
-                    continue
-                camp_id = camp.get('campId', '')
-                batch_id = camp.get('batchId', '')
-                title = camp.get('title', '').strip()
-                end_date = camp.get('endDate', '')
-                start_date = camp.get('startDate', '')
-                if not title or not camp_id:
-                    continue
-                if end_date and end_date < today:
-                    continue
-                url = (f"https://boottent.com/camps/{camp_id}_{batch_id}"
-                       if batch_id else f"https://boottent.com/camps/{camp_id}")
-                date_str = (f"{start_date} ~ {end_date}" if start_date and end_date
-                            else end_date or start_date or "상세 확인")
-                results.append({
-                    "title": f"[부트텐트] {title}",
-                    "url": url,
-                    "host": "부트텐트 (boottent.com)",
-                    "date": f"마감: {date_str}",
-                })
-            return results
-        except Exception as e:
-            print(f"부트텐트 수집 실패: {e}")
-        return []
+        pool = DaemonThreadPool(MAX_WORKERS, thread_name_prefix="fetch")
+        futures = {pool.submit(timed, name, fetcher): name for name, fetcher in tasks}
+        pending = set(futures)
+        status = {}
+        try:
+            while pending:
+                now = time.perf_counter()
+                budget_left = RUN_BUDGET - (now - run_start)
+                if budget_left <= 0:
+                    for f in [f for f in pending if not in_time(f)]:
+                        f.cancel()
+                        pending.discard(f)
+                        status[futures[f]] = "budget"
+                        if futures[f] in started:
+                            timings.setdefault(futures[f], now - started[futures[f]])
+                    if not pending:
+                        break
+                # 이미 시작된 소스 중 가장 먼저 마감되는 시점까지만 대기
+                deadlines = [started[futures[f]] + SOURCE_DEADLINE - now
+                             for f in pending if futures[f] in started]
+                timeout = min([budget_left] + deadlines)
+                done, pending = wait(pending, timeout=max(timeout, 0.01), return_when=FIRST_COMPLETED)
+                for f in done:
+                    name = futures[f]
+                    try:
+                        found = f.result() or []
+                        status[name] = "ok"
+                        self.accept_cursors(stages[name])
+                        print(f"📡 {name}: {len(found)}개 발견")
+                    except Exception as e:
+                        print(f"❌ {name} 오류: {e}")
+                        found, status[name] = [], "error"
+                    finish_metrics(self.metrics[name], status[name], found, timings.get(name, 0.0))
+                    yield name, found
+                now = time.perf_counter()
+                for f in list(pending):
+                    name = futures[f]
+                    if name in started and now - started[name] >= SOURCE_DEADLINE and not in_time(f):
+                        print(f"⏱️ {name}: {SOURCE_DEADLINE:.0f}초 안에 끝나지 않아 건너뜁니다.")
+                        status[name] = "timeout"
+                        timings.setdefault(name, now - started[name])
+                        pending.discard(f)
+        finally:
+            # 멈춘 요청은 requests 타임아웃으로 정리되므로 기다리지 않음
+            pool.shutdown(wait=False, cancel_futures=True)
 
-    def _extract_json_array(self, s, key):
-        """문자열 s에서 key에 해당하는 JSON 배열을 괄호 매칭으로 추출합니다."""
-        pattern = f'"{key}":'
-        idx = s.find(pattern)
-        if idx == -1:
+        wall = time.perf_counter() - run_start
+        self.fetch_wall = wall
+        for name, _ in tasks:
+            if status.get(name) not in ("ok", "error"):
+                finish_metrics(self.metrics[name], status.get(name, "skipped"), [], timings.get(name, 0.0))
+        self.print_timing_report(tasks, wall)
+
+    def print_timing_report(self, tasks, wall):
+        """소스별 소요 시간(네트워크/파싱)과 전체 실행 시간(벽시계)을 나란히 출력합니다."""
+        print("⏱️ 소스별 소요 시간")
+        print(f"   {'소스':<16} {'전체':>7} {'네트워크':>7} {'파싱':>7} {'전송량':>8} {'요청':>4}  {'상태':<8} 항목")
+        for name, _ in tasks:
+            m = self.metrics[name]
+            elapsed_str = f"{m['elapsed_s']:6.2f}s" if m['status'] != 'skipped' else "      -"
+            errors = f" ({', '.join(m['errors'] + [str(c) for c in m['http_errors']])})" if m['errors'] or m['http_errors'] else ""
+            print(f"   {name:<16} {elapsed_str} {m['network_s']:6.2f}s {m['parse_s']:6.2f}s "
+                  f"{m['bytes'] / 1024:6.0f}KB {m['requests']:>4}  {m['status']:<8} {m['items']}개{errors}")
+        total = sum(m['elapsed_s'] for m in self.metrics.values())
+        print(f"   벽시계 {wall:.2f}s / 소스 합계 {total:.2f}s (워커 {MAX_WORKERS}개)")
+
+    def write_run_report(self, started_at, wall, new_count, delivered_count):
+        """이번 실행 계측을 run_report.json에 쓰고 run_history.jsonl에 한 줄 덧붙입니다 (최근 RUN_HISTORY_MAX개 유지).
+        실행 기록에는 열린 서킷의 마지막 정상 결과 목록을 빼고 남깁니다.
+        """
+        report = {
+            "started_at": started_at, "wall_s": round(wall, 3), "fetch_wall_s": round(self.fetch_wall, 3),
+            "new_items": new_count, "delivered": delivered_count,
+            "sources": [rounded(m) for m in self.metrics.values()],
+            "discord": rounded(self.discord_metrics),
+            "enrich": rounded(self.enrich_metrics),
+            # 열린 서킷은 이번에 수집하지 않았으므로 마지막 정상 결과(네거티브 캐시)를 함께 남김
+            "open_circuits": {name: {**entry, "last_items": self.health.last_good(name)}
+                              for name, entry in self.health.open_circuits().items()},
+        }
+        save_json_state(RUN_REPORT_FILE, report)
+        history = []
+        if os.path.exists(RUN_HISTORY_FILE):
+            with open(RUN_HISTORY_FILE, "r", encoding="utf-8") as f:
+                history = [line for line in f if line.strip()]
+        report["open_circuits"] = self.health.open_circuits()
+        history.append(json.dumps(report, ensure_ascii=False, separators=(",", ":"), sort_keys=True) + "\n")
+        with open(RUN_HISTORY_FILE, "w", encoding="utf-8") as f:
+            f.writelines(history[-RUN_HISTORY_MAX:])
+
+    def print_circuits(self):
+        """열려 있는 서킷과 각 소스의 마지막 정상 수집 시각/항목 수를 출력합니다."""
+        for name, entry in self.health.open_circuits().items():
+            last = f"마지막 정상 {entry['last_ok'][5:16].replace('T', ' ')} · {entry.get('last_count', 0)}개" if entry.get("last_ok") else "정상 수집 기록 없음"
+            print(f"🔌 열린 서킷: {name} (연속 실패 {entry['failures']}회, {entry.get('last_error')}, "
+                  f"다음 시도 {entry['open_until'][5:16].replace('T', ' ')}, {last})")
+
+    def categorize(self, items):
+        """범주가 없는 항목(키워드 필터가 없는 소스)의 제목을 분류하고, 제외 키워드에 걸린 항목을 뺍니다."""
+        kept = []
+        for item in items:
+            if 'category' not in item:
+                spec = self.sources.get(item.get('source'))
+                item['category'] = self.classifier.classify(item['title'], spec) if spec else ""
+            if item['category'] is not None:
+                kept.append(item)
+        return kept
+
+    def drop_expired(self, items):
+        """날짜를 정규화하고 종료일이 지난 항목을 뺍니다. expires=False인 소스(날짜가 게시일)와 날짜가 없는 항목은 남깁니다."""
+        today = datetime.now().strftime('%Y-%m-%d')
+        normalize_dates(items, today)
+        for item in items:
+            if not self.sources.get(item.get('source'), SOURCE_DEFAULTS)['expires']:
+                # 게시일은 마감이 아니므로 저장소 정리(prune) 기준으로도 쓰지 않음
+                item['end'] = None
+        kept = [i for i in items if not (i['end'] and i['end'] < today)]
+        if len(kept) < len(items):
+            print(f"⌛ 마감이 지난 공고 {len(items) - len(kept)}개를 제외했습니다.")
+        return kept
+
+    def screen(self, items, deduper):
+        """분류/마감 필터를 거쳐 이번 실행에서 처음 보는, 저장소에도 없는 항목만 돌려줍니다."""
+        return [i for i in deduper.admit(self.drop_expired(self.categorize(items))) if not self.sent_list.seen(i)]
+
+    def triage(self, name, found, deduper):
+        """수집 결과를 스냅샷과 비교해 보낼 항목(새 공고, 이미 알린 공고의 변경)을 돌려줍니다.
+        스냅샷이 그대로인 소스는 더 처리하지 않고, 일부만 수집됐거나 새 항목만 돌려주는(incremental) 소스는
+        비교 없이 전부 새 공고 후보로 봅니다.
+        """
+        metrics = self.metrics.get(name)
+        if metrics is None or metrics["status"] != "ok" or self.sources[name]["incremental"]:
+            return self.enrich(self.screen(found, deduper))
+        diff = self.snapshots.diff(name, found)
+        if diff is None:
+            return []
+        added, changed, removed = diff
+        metrics["diff"] = {"added": len(added), "changed": len(changed), "removed": removed}
+        updates, fresh = [], []
+        for item in self.drop_expired(self.categorize(changed)):
+            if self.sent_list.seen(item):
+                updates.append(item)
+            else:
+                item.pop('changes', None)  # 알린 적 없는 공고는 새 공고로 보냄
+                fresh.append(item)
+        if changed or removed:
+            print(f"🔁 {name}: 추가 {len(added)}개, 변경 {len(changed)}개 (알린 공고 {len(updates)}개), 사라짐 {removed}개")
+        return self.enrich(self.screen(added + fresh, deduper)) + updates
+
+    def enrich(self, items):
+        """enrich가 켜진 소스의 새 항목만 상세 페이지에서 마감일/장소/온·오프라인을 채우고, 마감이 지난 항목을 뺍니다.
+        캐시에 있는 URL은 요청하지 않으며, 실행당 요청 수(ENRICH_MAX_REQUESTS)와 시간(ENRICH_BUDGET)을 넘는 항목은
+        목록 정보만으로 돌려줍니다.
+        """
+        if not ENRICH:
+            return items
+        now = datetime.now()
+        today, fresh = now.strftime('%Y-%m-%d'), (now - timedelta(days=DETAIL_CACHE_TTL_DAYS)).strftime('%Y-%m-%d')
+        todo, cached = [], 0
+        for item in items:
+            if not self.sources.get(item.get('source'), SOURCE_DEFAULTS)['enrich']:
+                continue
+            entry = self.detail_cache.get(item['url'])
+            if entry and entry.get("checked", "") >= fresh:
+                apply_details(item, entry)
+                cached += 1
+            else:
+                todo.append(item)
+        metrics = self.enrich_metrics
+        remaining = ENRICH_BUDGET - metrics["elapsed_s"]
+        allowed = min(len(todo), ENRICH_MAX_REQUESTS - self.enrich_requests) if remaining > 0 else 0
+        done = set()
+        if allowed > 0:
+            self.enrich_requests += allowed
+            t = time.perf_counter()
+            pool = DaemonThreadPool(min(MAX_WORKERS, allowed), thread_name_prefix="detail")
+            futures = {pool.submit(self.fetch_details, item['url']): item for item in todo[:allowed]}
+            done, _ = wait(futures, timeout=remaining)
+            pool.shutdown(wait=False, cancel_futures=True)  # 시간 예산을 넘긴 요청은 결과를 버림
+            metrics["elapsed_s"] += time.perf_counter() - t
+            for future in done:
+                try:
+                    details = future.result()
+                except Exception as e:
+                    # 상세 페이지 하나가 실패해도 그 항목만 목록 정보로 보냄
+                    print(f"⚠️ 상세 페이지 보강 실패 ({futures[future]['url']}): {e}")
+                    with collecting(metrics):
+                        report_error(e)
+                    details = None
+                if details is not None:
+                    self.detail_cache[futures[future]['url']] = dict(details, checked=today)
+                    apply_details(futures[future], details)
+                    metrics["items"] += 1
+        if todo or cached:
+            skipped = len(todo) - len(done)
+            metrics["status"] = "partial" if skipped else metrics["status"] or "ok"
+            print(f"🔎 상세 페이지 보강: 요청 {len(done)}개, 캐시 {cached}개"
+                  + (f", 한도를 넘어 {skipped}개는 목록 정보만 사용" if skipped else ""))
+        kept = [i for i in items if not (i.get('end') and i['end'] < today)]
+        if len(kept) < len(items):
+            print(f"⌛ 상세 페이지 확인 결과 마감이 지난 공고 {len(items) - len(kept)}개를 제외했습니다.")
+        return kept
+
+    def fetch_details(self, url):
+        """상세 페이지 앞부분(DETAIL_MAX_BYTES)을 호스트별 동시 요청 한도(ENRICH_PER_HOST) 안에서 읽어 extract_details 결과를 돌려줍니다.
+        404 같은 영구 오류나 HTML이 아닌 응답은 빈 결과로 캐시되고, 연결 오류/5xx/429는 None을 돌려 다음 실행에서 다시 시도합니다.
+        """
+        with self._slots_lock:
+            slot = self._host_slots.setdefault(urlsplit(url).netloc, threading.Semaphore(ENRICH_PER_HOST))
+        empty = {"end": None, "location": None, "mode": None}
+        try:
+            with slot, collecting(self.enrich_metrics):
+                with self.session.get(url, timeout=ENRICH_TIMEOUT, stream=True) as res:
+                    if res.status_code >= 500 or res.status_code == 429:
+                        return None
+                    if not res.ok or 'html' not in res.headers.get('Content-Type', 'text/html'):
+                        return empty
+                    chunks, size = [], 0
+                    for chunk in res.iter_content(chunk_size=64 * 1024):
+                        chunks.append(chunk)
+                        size += len(chunk)
+                        if size >= DETAIL_MAX_BYTES:
+                            break
+                    body = b"".join(chunks)
+                    try:
+                        text = body.decode(res.encoding or 'utf-8', errors='replace')
+                    except LookupError:  # 파이썬이 모르는 charset
+                        text = body.decode('utf-8', errors='replace')
+        except requests.RequestException as e:
+            with collecting(self.enrich_metrics):
+                report_error(e)
             return None
-        start = s.index('[', idx + len(pattern))
-        depth, in_string, escape = 1, False, False
-        backslash = chr(92)
-        for i in range(start + 1, len(s)):
-            c = s[i]
-            if escape:
-                escape = False
+        return extract_details(text)
+
+    def save_detail_cache(self):
+        """TTL이 지난 상세 페이지 결과를 지우고 저장합니다."""
+        fresh = (datetime.now() - timedelta(days=DETAIL_CACHE_TTL_DAYS)).strftime('%Y-%m-%d')
+        save_json_state(DETAIL_CACHE_FILE, {k: v for k, v in self.detail_cache.items() if v.get("checked", "") >= fresh})
+
+    def send_to_discord(self, items, announced=None):
+        """항목을 구독 규칙에 따라 웹훅별로 나눈 뒤, 디스코드 한도(메시지당 임베드 10개, 6000자)에 맞춰 묶어 보냅니다.
+        웹훅마다 하나의 스레드가 순서대로 보내며(동시에 FANOUT_WORKERS개), 한 웹훅에라도 전달된 항목을 돌려줍니다.
+        그중 못 받은 웹훅이 있으면 (항목, 웹훅)을 pending_deliveries에 남겨 다음 실행에서 그 웹훅에만 다시 보내고,
+        어느 웹훅에도 못 보낸 항목만 돌려주지 않습니다(다음 실행에서 처음부터 다시 보냄).
+        어느 구독에도 맞지 않는 항목은 보낼 곳이 없으므로 전달된 것으로 봅니다.
+        announced(집합)를 주면 거기 없는 웹훅에만 머리글을 붙이고, 보낸 웹훅을 추가합니다.
+        """
+        routes = self.router.route(items)
+        metrics = self.discord_metrics
+        t = time.perf_counter()
+
+        def deliver(url):
+            indices = routes[url]
+            header = NEW_ITEMS_HEADER if announced is None or url not in announced else None
+            with collecting(metrics):
+                sent = self.deliver_to_webhook(url, pack_messages([items[i] for i in indices], header))
+            return url, {indices[j] for j in sent}
+
+        reached, missed = set(), {}
+        if routes:
+            with ThreadPoolExecutor(max_workers=min(FANOUT_WORKERS, len(routes)), thread_name_prefix="discord") as pool:
+                for url, sent in pool.map(deliver, routes):
+                    reached |= sent
+                    if len(sent) < len(routes[url]):
+                        missed[url] = set(routes[url]) - sent
+                    if sent and announced is not None:
+                        announced.add(url)
+        failed = set().union(*missed.values()) - reached
+        retried = 0
+        for url, indices in missed.items():
+            retried += self.queue_delivery(url, [items[i] for i in sorted(indices & reached)])
+        metrics["elapsed_s"] += time.perf_counter() - t
+        status = "ok" if not missed else ("partial" if len(failed) < len(items) else "error")
+        metrics["status"] = status if metrics["status"] in (None, status) else "partial"
+        if failed:
+            print(f"⚠️ 디스코드 전송 실패: {len(failed)}개 (다음 실행에서 다시 시도)")
+        if retried:
+            print(f"⚠️ 일부 웹훅에만 못 보낸 전달 {retried}건은 다음 실행에서 그 웹훅에만 다시 보냅니다.")
+        return [item for i, item in enumerate(items) if i not in failed]
+
+    def queue_delivery(self, url, items):
+        """url에 못 보낸 items를 다음 실행의 retry_deliveries로 미룹니다. 미룬 개수를 돌려줍니다."""
+        if items:
+            with self._cache_lock:
+                self.pending_deliveries.setdefault(webhook_key(url), []).extend(items)
+        return len(items)
+
+    def retry_deliveries(self, announced=None):
+        """지난 실행에서 일부 웹훅에만 못 보낸 항목을 그 웹훅에만 다시 보냅니다.
+        구독 설정에서 빠진 웹훅의 항목은 보낼 곳이 없으므로 버립니다.
+        """
+        with self._cache_lock:
+            pending, self.pending_deliveries = self.pending_deliveries, {}
+        if not pending:
+            return
+        webhooks = {webhook_key(url): url for url in self.router.by_webhook}
+        sent_count = 0
+        for key, items in pending.items():
+            url = webhooks.get(key)
+            if url is None:
+                continue
+            header = NEW_ITEMS_HEADER if announced is None or url not in announced else None
+            with collecting(self.discord_metrics):
+                sent = self.deliver_to_webhook(url, pack_messages(items, header))
+            if sent and announced is not None:
+                announced.add(url)
+            sent_count += len(sent)
+            self.queue_delivery(url, [item for i, item in enumerate(items) if i not in sent])
+        print(f"📮 지난 실행에서 일부 웹훅에 못 보낸 전달 {sent_count}/{sum(map(len, pending.values()))}건을 다시 보냈습니다.")
+
+    def save_pending_deliveries(self):
+        if self.pending_deliveries or os.path.exists(PENDING_DELIVERY_FILE):
+            save_json_state(PENDING_DELIVERY_FILE, self.pending_deliveries)
+
+    def deliver_stream(self, items, totals):
+        """큐에서 항목을 받아 메시지 한 개 분량(임베드 DISCORD_MAX_EMBEDS개)씩 보내고,
+        전달된 묶음마다 중복 방지 기록을 바로 저장합니다. 실행 도중 죽어도 보낸 항목은 기록돼 있어 다시 보내지 않습니다.
+        None을 받으면 남은 항목을 보내고 끝냅니다. 머리글은 이번 실행에서 웹훅마다 첫 메시지에만 붙습니다.
+        """
+        announced, done = set(), False
+        try:
+            self.retry_deliveries(announced)
+        except Exception as e:
+            print(f"❌ 디스코드 재전송 오류: {e}")
+        while not done:
+            batch = []
+            item = items.get()
+            while True:
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+                if len(batch) >= DISCORD_MAX_EMBEDS:
+                    break
+                try:
+                    item = items.get_nowait()
+                except queue.Empty:
+                    break
+            if not batch:
                 continue
-            if c == backslash and in_string:
-                escape = True
+            try:
+                delivered = self.send_to_discord(batch, announced)
+                self.save_sent_list(delivered)
+            except Exception as e:
+                print(f"❌ 디스코드 전송 오류: {e}")
+                delivered = []
+            totals["new"] += len(batch)
+            totals["delivered"] += len(delivered)
+
+    def deliver_to_webhook(self, url, messages):
+        """메시지를 순서대로 보내고 전달된 항목 번호 집합을 돌려줍니다.
+        디스코드가 내용을 거부한 메시지(4xx)는 항목 하나씩 다시 보내고, 그래도 거부된 항목은 기록만 남기고 건너뜁니다.
+        다시 보내도 똑같이 거부되므로 전달된 것으로 쳐서 다음 실행에서 같은 묶음이 계속 실패하지 않게 합니다.
+        """
+        delivered = set()
+        for indices, payload in messages:
+            result = self.post_webhook(url, payload)
+            if result is None and len(indices) > 1:
+                delivered |= self.deliver_to_webhook(url, [
+                    ([i], {"content": payload["content"] if j == 0 else "", "embeds": [embed]})
+                    for j, (i, embed) in enumerate(zip(indices, payload["embeds"]))])
+            elif result is None:
+                print(f"⚠️ 디스코드가 거부한 항목을 건너뜁니다: {payload['embeds'][0].get('title')}")
+                record("errors", "WebhookRejected")
+                delivered.update(indices)
+            elif result:
+                delivered.update(indices)
+                record("items", len(indices))
+        return delivered
+
+    def post_webhook(self, url, payload):
+        """429면 retry_after만큼, 5xx/연결 오류면 백오프 후 다시 보냅니다.
+        버킷 잔량(X-RateLimit-Remaining)이 0이면 초기화될 때까지 기다린 뒤 돌아갑니다.
+        보냈으면 True, 재시도를 다 써도 실패했거나 웹훅 자체를 쓸 수 없으면(401/403/404) False,
+        디스코드가 내용을 거부했으면(그 밖의 4xx) 다시 보내지 않고 None을 돌려줍니다.
+        """
+        for attempt in range(DISCORD_MAX_RETRIES + 1):
+            try:
+                res = self.discord_session.post(url, params={"wait": "true"}, json=payload, timeout=15)
+            except requests.RequestException as e:
+                print(f"디스코드 연결 오류: {e}")
+                time.sleep(HTTP_BACKOFF * 2 ** attempt)
                 continue
-            if c == '"':
-                in_string = not in_string
+            if res.status_code == 429:
+                record("retries", 1)
+                try:
+                    retry_after = float(res.json().get("retry_after", 1))
+                except ValueError:
+                    retry_after = float(res.headers.get("Retry-After", 1))
+                time.sleep(min(retry_after, HTTP_RETRY_AFTER_MAX))
                 continue
-            if in_string:
+            if res.status_code >= 500:
+                time.sleep(HTTP_BACKOFF * 2 ** attempt)
                 continue
-            if c == '[':
-                depth += 1
-            elif c == ']':
-                depth -= 1
-                if depth == 0:
-                    return s[start:i + 1]
-        return None
-
-    def fetch_kt_aivle(self):
-        """KT 에이블스쿨 주요소식 페이지에서 모집 공고를 가져옵니다."""
+            if not res.ok:
+                print(f"디스코드 전송 거부: HTTP {res.status_code} {res.text[:200]}")
+                return False if res.status_code in (401, 403, 404) else None
+            if res.headers.get("X-RateLimit-Remaining") == "0":
+                time.sleep(float(res.headers.get("X-RateLimit-Reset-After", 1)))
+            return True
+        return False
+
+    def tasks(self, names=None):
+        """켜진 소스(names를 주면 그중 일부)를 iter_fetchers에 넘길 (이름, 수집 함수) 목록으로 만듭니다."""
+        return [(name, lambda name=name, spec=spec: self.fetch_source(name, spec))
+                for name, spec in self.sources.items() if names is None or name in names]
+
+    def run(self, due_only=DUE_ONLY):
+        print("🔍 해커톤 및 부트캠프 정보 수집을 시작합니다...")
+        started_at = datetime.now().isoformat(timespec="seconds")
+        run_start = time.perf_counter()
+        # 서킷이 열린 소스는 수집 주기/요청 예산 계산에서도 뺌
+        sources = {n: self.sources[n] for n in self.health.admit(list(self.sources))}
+        names = list(sources)
+        if due_only:
+            names = self.schedule.plan(sources)
+            print(f"🗓️ 수집 주기가 된 소스 {len(names)}/{len(self.sources)}개: {', '.join(names) or '없음'}")
+            if not names:
+                self.schedule.save()
+                self.sent_list.close()
+                return
+        # 수집 → 분류/마감 필터 → 중복 제거 → 전송을 소스가 끝나는 대로 흘려보냄
+        outbox, totals = queue.Queue(maxsize=DELIVERY_QUEUE_SIZE), {"new": 0, "delivered": 0}
+        sender = threading.Thread(target=self.deliver_stream, args=(outbox, totals), name="discord-sender")
+        sender.start()
+        deduper = BatchDeduper()
         try:
-            # 공지 JSON API가 막혀 있어 주요소식(MC00000058) HTML 페이지를 파싱
-            # GitHub Actions(AWS IP)에서 403이 발생할 수 있음 - 브라우저 헤더로 우회 시도
-            h = self.headers.copy()
-            h.update({
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Referer": "https://aivle.kt.co.kr/",
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "same-origin",
-                "Sec-Fetch-User": "?1",
-                "Upgrade-Insecure-Requests": "1",
-            })
-            res = requests.get(
-                "https://aivle.kt.co.kr/home/main/goMenuPage?mcd=MC00000058",
-                headers=h, timeout=15
-            )
-            if res.status_code == 403:
-                print("KT 에이블스쿨: 서버에서 접근 차단됨 (IP 제한 추정), 건너뜁니다.")
-                return []
-            res.raise_for_status()
-            soup = BeautifulSoup(res.text, 'html.parser')
-            results = []
-            keywords = ['모집', '공고', '기수', '과정', '선발']
-            for subj_div in soup.select('div.td.subject'):
-                a = subj_div.find('a')
-                if not a:
-                    continue
-                title = a.get_text(strip=True)
-                if not any(k in title for k in keywords):
-                    continue
-                seq_match = re.search(r"readPtlBbsAtcl\('(\d+)'\)", a.get('href', ''))
-                seq = seq_match.group(1) if seq_match else ''
-                # 날짜: 같은 행(부모)의 형제 div에서 추출
-                row = subj_div.parent
-                date_div = row.select_one('div.td.date') if row else None
-                date = date_div.get_text(strip=True) if date_div else '상세 확인'
-                detail_url = (
-                    f"https://aivle.kt.co.kr/home/brd/bbs/view?bbsCd=NEWS&atclSn={seq}"
-                    if seq else "https://aivle.kt.co.kr/home/main/goMenuPage?mcd=MC00000058"
-                )
-                results.append({
-                    "title": f"[KT 에이블스쿨] {title}",
-                    "url": detail_url,
-                    "host": "KT 에이블스쿨 (AIVLE School)",
-                    "date": date,
-                })
-            return results
-        except Exception as e:
-            print(f"KT 에이블스쿨 수집 실패: {e}")
-        return []
+            for name, found in self.iter_fetchers(self.tasks(names)):
+                self.schedule.observe(name, self.sources[name], found, self.metrics[name])
+                self.health.observe(name, found, self.metrics[name])
+                for item in found:
+                    item.setdefault('source', name)
+                for item in self.triage(name, found, deduper):
+                    outbox.put(item)  # 전송이 밀리면 여기서 기다림
+        finally:
+            outbox.put(None)
+            sender.join()
+        for name, metrics in self.metrics.items():
+            if metrics["status"] == "timeout":  # 마감을 넘긴 소스는 결과 없이 끝나므로 여기서 실패로 기록
+                self.health.observe(name, [], metrics)
+        self.schedule.record_requests(sum(m["requests"] for m in self.metrics.values()))
+        self.schedule.save()
+        self.health.save()
+        self.print_circuits()
+        print(f"📊 최종 신규 공고: {totals['new']}개 (전송 {totals['delivered']}개)")
+
+        if totals["delivered"] < totals["new"]:
+            # 못 보낸 항목을 다음 실행에서 다시 읽도록 최신 id와 스냅샷을 올리지 않음
+            self.pending_cursors = {}
+            self.snapshots.discard()
+        self.commit_cursors()
+        self.snapshots.commit()
+        self.snapshots.save()
+        pruned = self.sent_list.prune(keep_sources=[n for n, spec in registered_sources().items() if not spec["expires"]])
+        if pruned:
+            print(f"🧹 마감이 지난 기록 {pruned}개를 정리했습니다.")
+        self.sent_list.close()
+        self.save_http_cache()
+        self.save_detail_cache()
+        self.save_pending_deliveries()
+        self.write_run_report(started_at, time.perf_counter() - run_start, totals["new"], totals["delivered"])
 
     # ─────────────────────────────────────────────────────
-    # 유틸리티 및 실행 섹션
+    # 데몬 모드 섹션
     # ─────────────────────────────────────────────────────
 
-    def send_to_discord(self, items):
-        for i in range(0, len(items), 10):
-            chunk = items[i:i+10]
-            embeds = [{"title": f"✨ {h['title']}", "url": h['url'], "color": 5814783,
-                    "fields": [{"name": "플랫폼", "value": h['host'], "inline": True},
-                                {"name": "마감/일정", "value": str(h['date']), "inline": True}]}
-                    for h in chunk]
-            requests.post(WEBHOOK_URL, json={
-                "content": "🚀 **새로운 소식이 도착했습니다!**" if i == 0 else "",
-                "embeds": embeds
-            })
+    def run_daemon(self):
+        """프로세스를 띄워 둔 채 소스별 수집 주기마다 수집하고 바로 전송합니다.
+        세션 커넥션과 중복 방지 저장소를 계속 재사용하며, SIGTERM/SIGINT를 받으면 상태를 저장하고 끝냅니다.
+        """
+        asyncio.run(self._daemon())
 
-    def run(self):
-        print("🔍 해커톤 및 부트캠프 정보 수집을 시작합니다...")
-        all_items = []
-        tasks = [
-            ("Devpost", self.fetch_devpost),
-            ("MLH", self.fetch_mlh),
-            ("DevEvent", self.fetch_devevent),
-            ("CampusPick", self.fetch_campuspick),
-            # ("링커리어 해커톤", self.fetch_linkareer_hackathon),
-            # ("링커리어 부트캠프", self.fetch_linkareer_bootcamp),
-            ("SSAFY", self.fetch_ssafy),
-            ("우아한테크코스", self.fetch_woowacourse),
-            ("부스트캠프", self.fetch_boostcamp),
-            ("KT Cloud TechUp", self.fetch_kt_techup),
-            ("KT 에이블스쿨", self.fetch_kt_aivle),
-            ("부트텐트", self.fetch_boottent),
-        ]
-
-        for name, fetcher in tasks:
+    async def _daemon(self):
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        for sig in (signal.SIGTERM, signal.SIGINT):
             try:
-                found = fetcher()
-                print(f"📡 {name}: {len(found)}개 발견")
-                all_items.extend(found)
-            except Exception as e:
-                print(f"❌ {name} 오류: {e}")
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:
+                pass  # Windows는 KeyboardInterrupt로 종료
+        pool = DaemonThreadPool(MAX_WORKERS, thread_name_prefix="fetch")
+        deliver_lock = asyncio.Lock()
+        inflight = {}
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.daemon_start = time.perf_counter()
+        self.new_count = self.delivered_count = 0
+        self.delivery_failed = False
+        self.metrics = {}
+        last_flush = time.monotonic()
+        print(f"🛰️ 데몬 모드 시작: 소스 {len(self.sources)}개, {DAEMON_TICK:g}초마다 수집 주기 확인")
+        try:
+            while not stop.is_set():
+                idle = {n: spec for n, spec in self.sources.items() if n not in inflight}
+                for name in self.schedule.plan({n: idle[n] for n in self.health.admit(list(idle))}):
+                    task = asyncio.ensure_future(self._daemon_fetch(name, pool, deliver_lock))
+                    inflight[name] = task
+                    task.add_done_callback(lambda _, name=name: inflight.pop(name, None))
+                if time.monotonic() - last_flush >= DAEMON_FLUSH:
+                    self.flush_state(commit_cursors=not inflight)
+                    last_flush = time.monotonic()
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=DAEMON_TICK)
+                except asyncio.TimeoutError:
+                    pass
+            print("🛑 종료 신호를 받았습니다. 진행 중인 수집을 마무리합니다...")
+            if inflight:
+                await asyncio.wait(list(inflight.values()), timeout=SOURCE_DEADLINE)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self.flush_state(commit_cursors=not inflight)
+            self.sent_list.close()
+
+    async def _daemon_fetch(self, name, pool, deliver_lock):
+        """소스 하나를 스레드 풀에서 수집하고, 신규 항목을 다른 소스와 겹치지 않게 차례로 전송합니다."""
+        loop = asyncio.get_running_loop()
+        spec = self.sources[name]
+        metrics = self.metrics[name] = new_metrics(name)
+        started, stage = time.perf_counter(), {}
+        try:
+            found = await asyncio.wait_for(loop.run_in_executor(pool, self.fetch_one, name, spec, metrics, stage),
+                                           timeout=SOURCE_DEADLINE)
+            self.accept_cursors(stage)
+        except asyncio.TimeoutError:
+            print(f"⏱️ {name}: {SOURCE_DEADLINE:.0f}초 안에 끝나지 않아 건너뜁니다.")
+            found = []
+            finish_metrics(metrics, "timeout", found, time.perf_counter() - started)
+        self.schedule.observe(name, spec, found, metrics)
+        self.health.observe(name, found, metrics)
+        self.schedule.record_requests(metrics["requests"])
+        for item in found:
+            item.setdefault('source', name)
+        try:
+            async with deliver_lock:
+                await loop.run_in_executor(None, self.retry_deliveries)
+                new_items = await loop.run_in_executor(None, self.triage, name, found, BatchDeduper())
+                delivered = []
+                if new_items:
+                    delivered = await loop.run_in_executor(None, self.send_to_discord, new_items)
+                    self.save_sent_list(delivered)
+                    self.delivery_failed |= len(delivered) < len(new_items)
+                if len(delivered) < len(new_items):
+                    self.snapshots.discard([name])
+                self.snapshots.commit([name])
+                self.new_count += len(new_items)
+                self.delivered_count += len(delivered)
+            print(f"📡 {name}: {len(found)}개 발견, 신규 {len(new_items)}개 ({metrics['status']}, {metrics['elapsed_s']:.2f}s)")
+        except Exception as e:
+            print(f"❌ {name} 전송 오류: {e}")
+            self.delivery_failed = True
 
-        # 중복 제거 (제목 기준) 및 신규 항목 필터링
-        seen_titles, deduped = set(), []
-        for item in all_items:
-            if item['title'] not in seen_titles:
-                seen_titles.add(item['title'])
-                deduped.append(item)
+    def fetch_one(self, name, spec, metrics, stage):
+        """iter_fetchers의 풀 없이 소스 하나를 현재 스레드에서 수집하며 metrics에 계측하고, 커서 갱신은 stage에 모읍니다."""
+        started = time.perf_counter()
+        with collecting(metrics), self.staging_cursors(stage):
+            found = self.fetch_source(name, spec)
+        finish_metrics(metrics, "ok", found, time.perf_counter() - started)
+        return found
 
-        new_items = [i for i in deduped if i['title'] not in self.sent_list]
-        print(f"📊 최종 신규 공고: {len(new_items)}개")
+    def flush_state(self, commit_cursors=True):
+        """데몬에서 주기적으로 상태를 파일에 씁니다. 중복 방지 기록은 전송할 때마다 바로 저장되므로
+        여기서는 오래된 기록 정리, 커서, 조건부 요청 캐시, 수집 주기, 실행 보고서를 처리합니다.
+        커서는 진행 중인 수집이 없을 때만 저장하고, 그사이 전송 실패가 있었다면 버립니다.
+        """
+        if commit_cursors:
+            if self.delivery_failed:
+                self.pending_cursors, self.delivery_failed = {}, False
+            self.commit_cursors()
+        pruned = self.sent_list.prune(keep_sources=[n for n, spec in registered_sources().items() if not spec["expires"]])
+        if pruned:
+            print(f"🧹 마감이 지난 기록 {pruned}개를 정리했습니다.")
+        self.save_http_cache()
+        self.save_detail_cache()
+        self.save_pending_deliveries()
+        self.schedule.save()
+        self.health.save()
+        self.snapshots.save()
+        self.write_run_report(self.started_at, time.perf_counter() - self.daemon_start, self.new_count, self.delivered_count)
+        # 상세 페이지 요청 한도는 저장 주기마다 새로 채움
+        self.enrich_metrics, self.enrich_requests = new_metrics("상세 보강"), 0
 
-        if new_items:
-            self.send_to_discord(new_items)
-            self.save_sent_list(new_items)
 
 if __name__ == "__main__":
-    if WEBHOOK_URL:
-        HackathonBot().run()
+    parser = argparse.ArgumentParser(description="해커톤/부트캠프 공고를 모아 디스코드로 보냅니다.")
+    parser.add_argument("--full-resync", action="store_true", default=FULL_RESYNC,
+                        help="저장된 최신 id를 무시하고 페이지형 소스를 처음부터 다시 읽습니다.")
+    parser.add_argument("--sources", default=SOURCES_ONLY, metavar="NAME,...",
+                        help="쉼표로 구분한 소스만 실행합니다 (꺼진 소스도 지정 가능).")
+    parser.add_argument("--due-only", action="store_true", default=DUE_ONLY,
+                        help="수집 주기가 된 소스만 요청 예산 안에서 실행합니다 (매시 cron용).")
+    parser.add_argument("--daemon", action="store_true",
+                        help="종료하지 않고 소스별 수집 주기마다 수집/전송합니다 (SIGTERM으로 종료).")
+    parser.add_argument("--list-sources", action="store_true", help="등록된 소스와 켜짐 여부, 현재 수집 주기를 출력합니다.")
+    parser.add_argument("--list-subscriptions", action="store_true", help="구독별 웹훅 수와 조건을 출력합니다.")
+    parser.add_argument("--compact-history", action="store_true",
+                        help="바이너리 기록(sent_hackathons.bin)의 만료 기록을 지우고 정렬해 다시 씁니다.")
+    parser.add_argument("--export-history", metavar="PATH", help="바이너리 기록의 제목을 텍스트(한 줄에 하나)로 내보냅니다.")
+    parser.add_argument("--import-history", metavar="PATH", help="텍스트 기록의 제목을 바이너리 기록에 더합니다.")
+    args = parser.parse_args()
+    subscriptions = load_subscriptions()
+    if args.compact_history or args.export_history or args.import_history:
+        store = CompactDedupStore()
+        keep = [name for name, spec in registered_sources().items() if not spec["expires"]]
+        if args.import_history:
+            print(f"📥 {args.import_history}에서 {store.import_text(args.import_history)}개를 더했습니다.")
+        if args.compact_history:
+            print(f"🗜️ 만료 기록 {store.compact(keep_sources=keep)}개를 지우고 {store.count}개로 다시 썼습니다.")
+        if args.export_history:
+            print(f"📤 {args.export_history}에 {store.export_text(args.export_history)}개를 내보냈습니다.")
+    elif args.list_sources:
+        schedule, health = SourceSchedule(), SourceHealth()
+        for name, spec in registered_sources().items():
+            state = schedule.sources.get(name, {})
+            due = schedule.next_due(name, spec)
+            icon = '🔌' if health.is_open(name) else '✅' if spec['enabled'] else '⏸️'
+            print(f"{icon} {name:<16} {spec['transport']:<9} "
+                  f"{schedule.interval(name, spec):>5.1f}시간  변경률 {state.get('rate', 0):.2f}  "
+                  f"다음 {due.strftime('%m-%d %H:%M') if due else '즉시'}  {spec.get('url') or spec['pages'][0][0]}")
+    elif args.list_subscriptions:
+        for name, spec in subscriptions.items():
+            rules = [f"{field}={','.join(spec[field])}" for field in ("categories", "sources", "keywords", "exclude") if spec[field]]
+            print(f"📬 {name:<16} 웹훅 {len(spec['webhook'])}개  {' '.join(rules) or '전체'}")
+    elif not subscriptions:
+        print("❌ DISCORD_WEBHOOK_URL 환경 변수나 구독 설정(subscriptions.json / BOT_SUBSCRIPTIONS)이 없습니다.")
+    elif args.daemon:
+        HackathonBot(full_resync=args.full_resync, sources=args.sources, subscriptions=subscriptions).run_daemon()
     else:
-        print("❌ DISCORD_WEBHOOK_URL 환경 변수가 없습니다.")
+        HackathonBot(full_resync=args.full_resync, sources=args.sources, subscriptions=subscriptions).run(due_only=args.due_only)
@@ -0,0 +1,37 @@
+"""날짜 파싱 회귀 테스트: 월 이름으로 시작하는 영단어를 날짜로 읽지 않아야 함."""
+import pytest
+
+import bot
+
+TODAY = "2026-07-25"
+
+
+@pytest.mark.parametrize("text", ["Market 15", "Decision 5", "Junior 3", "Mayor 12", "Augmented 2", "Octane 7"])
+def test_words_starting_with_month_are_not_dates(text):
+    assert bot.parse_date_range(text, TODAY) == (None, None)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Mar 15", ("2026-03-15", "2026-03-15")),
+    ("March 3rd - 5th", ("2026-03-03", "2026-03-05")),
+    ("SEPT 4, 2026", ("2026-09-04", "2026-09-04")),
+    ("Sep. 9", ("2026-09-09", "2026-09-09")),
+    ("June 30", ("2026-06-30", "2026-06-30")),
+])
+def test_month_spellings(text, expected):
+    assert bot.parse_date_range(text, TODAY) == expected
+
+
+def test_detail_page_label_followed_by_word():
+    assert bot.extract_details("<p>Registration: Marketing 2 people per team</p>")["end"] is None
+
+
+def test_snapshot_keeps_the_year_first_inferred(tmp_path):
+    store = bot.SnapshotStore(path=str(tmp_path / "snapshots.json"))
+    event = lambda: [{"title": "HackMIT", "url": "https://mlh.io/e/1", "date": "DEC 01 - DEC 03"}]
+    store.diff("mlh", event(), "2026-07-25")
+    store.commit()
+    # 열흘 뒤에는 같은 문자열이 2026-12-03으로 해석되지만, 일정 변경으로 보지 않고 지난 행사로 남아야 함
+    items = event()
+    assert store.diff("mlh", items, "2026-08-05") is None
+    assert bot.normalize_dates(items, "2026-08-05")[0]["end"] == "2025-12-03"
@@ -0,0 +1,119 @@
+"""중복 판정 회귀 테스트: 예전 기준(0.8)에서 한 공고로 묶이던 다른 공고들과 대괄호 제목."""
+import os
+import re
+
+import pytest
+
+import bot
+
+HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sent_hackathons.txt")
+
+# 짧은 제목이라 3-gram 유사도는 높지만 서로 다른 공고 (기준선은 모두 따로 보냈음)
+DISTINCT = [
+    ("DigitalOcean Hackathon NY", "DigitalOcean Hackathon SF"),
+    ("DigitalOcean Hackathon NY", "DigitalOcean Hackathon LA"),
+    ("DigitalOcean Hackathon SF", "DigitalOcean Hackathon LA"),
+    ("Global Hack Week: API", "Global Hack Week: Beginners"),
+    ("Global Hack Week: API Week", "Global Hack Week: Data Week"),
+    ("Global Hack Week: Beginners", "Global Hack Week: Data Week"),
+    ("Global Hack Week: API", "Global Hack Week: API Week"),
+    ("🇰🇷 [캠퍼스픽] [2026 전국 공모전]", "🇰🇷 [캠퍼스픽] [2027 전혀 새로운 공모전]"),
+]
+
+# 출처가 달라도 같은 공고 (날짜/기수 표기나 '모집 안내' 같은 군더더기만 다름)
+SAME = [
+    ("🎓 [데브이벤트] 2026 양천구 청년도전지원사업 참여자 모집 안내", "🇰🇷 [캠퍼스픽] 2026 양천구 청년도전지원사업 참여자 모집"),
+    ("[SSAFY] SSAFY 15기 입학생 모집", "SSAFY 15기 입학생 모집 공고"),
+]
+
+
+def item(title, source):
+    return {"title": title, "url": f"https://example.com/{source}/{abs(hash(title))}", "source": source}
+
+
+def stores(tmp_path):
+    missing = str(tmp_path / "none")
+    return [
+        bot.TextDedupStore(str(tmp_path / "sent.txt")),
+        bot.SqliteDedupStore(str(tmp_path / "sent.db"), legacy_path=missing),
+        bot.CompactDedupStore(str(tmp_path / "sent.bin"), legacy_db=missing, legacy_path=missing),
+    ]
+
+
+@pytest.mark.parametrize("first, second", DISTINCT)
+def test_distinct_postings_from_same_source_are_not_merged(tmp_path, first, second):
+    assert bot.BatchDeduper().admit([item(first, "MLH"), item(second, "MLH")]) == [item(first, "MLH"), item(second, "MLH")]
+    for store in stores(tmp_path):
+        store.add_many([item(first, "MLH")])
+        assert not store.seen(item(second, "MLH")), type(store).__name__
+        store.close()
+
+
+@pytest.mark.parametrize("first, second", SAME)
+def test_filler_variants_across_sources_are_merged(tmp_path, first, second):
+    assert len(bot.BatchDeduper().admit([item(first, "DevEvent"), item(second, "CampusPick")])) == 1
+    for store in stores(tmp_path):
+        store.add_many([item(first, "DevEvent")])
+        assert store.seen(item(second, "CampusPick")), type(store).__name__
+        store.close()
+
+
+def test_title_keys_are_never_empty():
+    assert bot.normalize_key("🇰🇷 [캠퍼스픽] [2027 전혀 새로운 공모전]") == "2027 전혀 새로운 공모전"
+    assert bot.normalize_key("🔥🔥") == "🔥🔥"
+    assert bot.normalize_key("", "https://www.example.com/a/?utm_source=x") == "https://example.com/a"
+
+
+def test_history_titles_do_not_collide():
+    # 기록의 제목은 모두 따로 보낸 공고이므로, 모두 같은 출처라고 보고 비교해도 거의 묶이지 않아야 함
+    with open(HISTORY, "r", encoding="utf-8") as f:
+        keys = list(dict.fromkeys(bot.normalize_key(line.strip()) for line in f if line.strip()))
+    index, merged = bot.NearDuplicateIndex(), []
+    for key in keys:
+        match = index.query(key, lambda cand: True)
+        if match is not None:
+            merged.append((key, match))
+        index.add(key)
+    assert len(merged) <= 1, merged
+
+
+def test_torn_tail_is_truncated_before_next_append(tmp_path):
+    # 덧붙이다 끊긴 기록 뒤에 다음 실행이 또 덧붙여도, 다시 열 때 온전한 기록은 모두 읽혀야 함
+    missing, path = str(tmp_path / "none"), str(tmp_path / "sent.bin")
+    store = bot.CompactDedupStore(path, legacy_db=missing, legacy_path=missing)
+    store.add_many([item("첫 번째 공모전", "DACON"), item("두 번째 공모전", "DACON")])
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 5)
+    store = bot.CompactDedupStore(path, legacy_db=missing, legacy_path=missing)
+    assert [r[6] for r in store.tail] == ["첫 번째 공모전"]
+    store.add_many([item("세 번째 해커톤", "MLH")])
+    store = bot.CompactDedupStore(path, legacy_db=missing, legacy_path=missing)
+    assert [r[6] for r in store.tail] == ["첫 번째 공모전", "세 번째 해커톤"]
+    assert store.seen(item("세 번째 해커톤", "MLH")) and not store.seen(item("두 번째 공모전", "DACON"))
+
+
+def test_lsh_cache_is_a_sidecar_and_can_be_stale(tmp_path):
+    # 버킷은 커밋하는 기록 파일이 아니라 옆의 .lsh 캐시에 두고, 캐시가 깨졌거나 낡아도 결과는 같아야 함
+    missing, path = str(tmp_path / "none"), str(tmp_path / "sent.bin")
+    store = bot.CompactDedupStore(path, legacy_db=missing, legacy_path=missing)
+    store.add_many([item("SSAFY 15기 입학생 모집", "SSAFY")])
+    assert store.seen(item("SSAFY 15기 입학생 모집 공고", "CampusPick"))
+    store.close()
+    assert os.path.exists(str(tmp_path / "sent.lsh"))
+    store = bot.CompactDedupStore(path, legacy_db=missing, legacy_path=missing)
+    store.add_many([item("부스트캠프 웹 모바일 10기 모집", "부스트캠프")])
+    store.close()
+    with open(str(tmp_path / "sent.lsh"), "r+b") as f:
+        f.truncate(20)
+    store = bot.CompactDedupStore(path, legacy_db=missing, legacy_path=missing)
+    assert store.seen(item("SSAFY 15기 입학생 모집 공고", "CampusPick"))
+    assert store.seen(item("부스트캠프 웹 모바일 10기 모집 안내", "CampusPick"))
+
+
+def test_source_title_tags_match_the_parsers():
+    # 파서와 레지스트리가 제목 앞에 붙이는 "[출처]" 접두어를 소스 코드에서 모아 목록과 비교
+    with open(bot.__file__, encoding="utf-8") as f:
+        source = f.read()
+    added = set(re.findall(r'"title": f?"(?:\S+ )?\[([^\]{}]+)\]', source))
+    added |= set(re.findall(r'\["\S+ \[([^\]]+)\]", "\w+"\]', source))
+    assert added == set(bot.SOURCE_TITLE_TAGS)
@@ -0,0 +1,35 @@
+"""상태 파일 회귀 테스트: 바뀐 것 없이 수집만 한 실행은 커밋되는 상태 파일을 다시 쓰지 않아야 함."""
+from datetime import datetime, timedelta
+
+import bot
+
+SPEC = {"interval_hours": 72}
+METRICS = {"status": "ok", "requests": 1, "errors": [], "http_errors": []}
+ITEMS = [{"title": "HackMIT", "url": "https://example.com/hackmit", "date": "Oct 9, 2026"}]
+
+
+def run_once(tmp_path, when):
+    schedule = bot.SourceSchedule(path=str(tmp_path / "schedule.json"), runs_path=str(tmp_path / "runs.json"))
+    health = bot.SourceHealth(path=str(tmp_path / "health.json"), last_good_path=str(tmp_path / "last_good.json"))
+    snapshots = bot.SnapshotStore(path=str(tmp_path / "snapshots.json"))
+    schedule.observe("MLH", SPEC, ITEMS, METRICS, when)
+    schedule.record_requests(1, when)
+    health.observe("MLH", ITEMS, METRICS, when)
+    snapshots.diff("MLH", [dict(i) for i in ITEMS], when.strftime('%Y-%m-%d'))
+    snapshots.commit()
+    schedule.save()
+    health.save()
+    snapshots.save()
+    return schedule
+
+
+def test_unchanged_run_only_writes_caches(tmp_path, monkeypatch):
+    start = datetime(2026, 10, 1)
+    run_once(tmp_path, start)
+    written = []
+    save = bot.save_json_state
+    monkeypatch.setattr(bot, "save_json_state", lambda path, data: (written.append(path), save(path, data)))
+    schedule = run_once(tmp_path, start + timedelta(days=3))
+    assert sorted(p.rsplit("/", 1)[-1] for p in written) == ["last_good.json", "runs.json"]
+    # 마지막 수집 시각은 캐시 쪽에서 다시 읽힘
+    assert schedule.sources["MLH"]["last_run"] == "2026-10-04T00:00:00"